@@ -0,0 +1,199 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Build cache, knows if a generated file is up to date with its inputs
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import subprocess
+import xml.etree.ElementTree as ElementTree
+
+try:
+    ParseError = ElementTree.ParseError
+except AttributeError:
+    from xml.parsers.expat import ExpatError as ParseError
+
+_versions = {}
+
+
+def file_digest(filename):
+    """Return the sha1 hex digest of the given file contents
+    """
+
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as fhandler:
+        for chunk in iter(lambda: fhandler.read(1 << 16), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def qrc_assets(filename):
+    """Return the absolute paths of every file referenced by a qrc file,
+    referenced directories are expanded
+    """
+
+    root = os.path.dirname(os.path.abspath(filename))
+    try:
+        tree = ElementTree.parse(filename)
+    except (IOError, ParseError):
+        return []
+
+    assets = []
+    for node in tree.getroot().findall('.//file'):
+        if not node.text:
+            continue
+
+        path = os.path.normpath(os.path.join(root, node.text.strip()))
+        if not os.path.isdir(path):
+            assets.append(path)
+            continue
+
+        for dirname, dirs, files in os.walk(path):
+            dirs.sort()
+            assets.extend(
+                os.path.join(dirname, name) for name in sorted(files))
+
+    return assets
+
+
+def tool_version(command):
+    """Return the (memoized) version string reported by a tool, the tool
+    is spawned the first time so callers must not hold any lock
+    """
+
+    version = _versions.get(command)
+    if version is None:
+        try:
+            proc = subprocess.Popen(
+                [command, '--version'], stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+            output = proc.communicate()[0].decode('utf-8', 'replace')
+            version = output.strip().split('\n')[0]
+        except OSError:
+            version = ''
+
+        _versions[command] = version
+
+    return version
+
+
+def known_version(command):
+    """Return the memoized version of a tool, None if it was not asked yet
+    """
+
+    return _versions.get(command)
+
+
+class BuildCache(object):
+    """
+    Records the inputs content hashes, tool path, tool version and options
+    used to generate every output file
+
+    File digests are memoized by (mtime, size) so checking an up to date
+    target does not read its inputs again
+    """
+
+    def __init__(self, filename):
+        super(BuildCache, self).__init__()
+
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.records = None
+        self.stats = None
+
+    def load(self):
+        """Load the cache file if it was not loaded yet"""
+
+        if self.records is not None:
+            return
+
+        try:
+            with open(self.filename, 'r') as fhandler:
+                data = json.load(fhandler)
+        except (IOError, OSError, ValueError):
+            data = {}
+
+        self.records = data.get('records') or {}
+        self.stats = data.get('stats') or {}
+
+    def save(self):
+        """Write the cache file atomically"""
+
+        self.load()
+        dirname = os.path.dirname(self.filename)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+        with os.fdopen(fd, 'w') as fhandler:
+            json.dump({'records': self.records, 'stats': self.stats}, fhandler)
+
+        getattr(os, 'replace', os.rename)(tmpname, self.filename)
+
+    def digest(self, filename):
+        """Return the digest of filename reusing the memoized one if the
+        file did not change, None if the file does not exist
+        """
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        key = [stat.st_mtime, stat.st_size]
+        memo = self.stats.get(filename)
+        if memo is not None and memo[:2] == key:
+            return memo[2]
+
+        digest = file_digest(filename)
+        self.stats[filename] = key + [digest]
+        return digest
+
+    def signature(self, inputs, tool, options, version=None):
+        """Return the build signature of an output, the version of external
+        tools is asked to the tool itself
+        """
+
+        version = version or tool_version(tool)
+        with self.lock:
+            self.load()
+            return {
+                'inputs': dict(
+                    (name, self.digest(name)) for name in sorted(inputs)),
+                'tool': tool,
+                'version': version,
+                'options': list(options)
+            }
+
+    def is_up_to_date(self, output, signature):
+        """True if output exists and was built with the same signature"""
+
+        with self.lock:
+            self.load()
+            return (os.path.exists(output)
+                    and self.records.get(output) == signature)
+
+    def record(self, output, signature):
+        """Record the signature of a successfully built output"""
+
+        with self.lock:
+            self.load()
+            self.records[output] = signature
+            self.save()
+
+    def forget(self, output):
+        """Drop the record of an output"""
+
+        with self.lock:
+            self.load()
+            if self.records.pop(output, None) is not None:
+                self.save()
@@ -0,0 +1,264 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Headless builder commands
+"""
+
+import os
+import sys
+import json
+import functools
+
+from . import rcc
+from .cache import BuildCache
+from .daemon import DaemonClient, interpreter
+from .graph import plan, walk, Scheduler
+from .qm import compile_catalogs
+from .settings import load_settings
+
+
+class BuildCommand(object):
+    """
+    Build every Qt artifact under the given folders
+    """
+
+    name = 'build'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='build .ui, .qrc and translation artifacts')
+        parser.add_argument('paths', nargs='*', default=['.'])
+        parser.add_argument('--settings', action='append', default=[],
+                            help='extra sublime-settings file to overlay')
+        parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help='parallel tools (default: number of cores)')
+        parser.add_argument('--cache', default=None,
+                            help='build cache file (default: '
+                            '<first path>/.sublimepyside-build.json)')
+        parser.add_argument('--force', action='store_true',
+                            help='rebuild up to date artifacts too')
+        parser.add_argument('--no-translations', action='store_true',
+                            help='do not run lupdate')
+        parser.add_argument('--daemon', nargs='?', const='', default=None,
+                            metavar='PYTHON',
+                            help='compile forms in a warm helper process '
+                            'running PYTHON (default: the pyside-uic one)')
+        parser.add_argument('-q', '--quiet', action='store_true')
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        settings = load_settings(*args.settings)
+        roots = [os.path.abspath(path) for path in args.paths]
+        cache = BuildCache(args.cache or os.path.join(
+            roots[0], '.sublimepyside-build.json'))
+
+        builtin_rcc = None
+        if settings.get('sublimepyside_rcc_engine') == 'builtin':
+            builtin_rcc = functools.partial(
+                rcc.run, chunks=rcc.ChunkCache(os.path.join(
+                    os.path.dirname(cache.filename), '.sublimepyside-chunks')),
+                processes=True
+            )
+
+        graph = plan(
+            roots, settings.get('sublimepyside_tools_map', {}),
+            settings.get('sublimepyside_rcc_options', {}),
+            not args.no_translations,
+            settings.get('sublimepyside_ignore_patterns'), builtin_rcc
+        )
+
+        def on_output(job, line):
+            if not args.quiet:
+                sys.stdout.write(line)
+
+        def on_task(task, job):
+            if not args.quiet or task.state == 'failed':
+                status = job.status if job is not None else task.state
+                print('[{0}] {1}'.format(task.name, status))
+
+        daemon = None
+        if args.daemon is not None:
+            tools = settings.get('sublimepyside_tools_map', {})
+            python = args.daemon or interpreter(tools.get('uic', ''))
+            if python:
+                daemon = DaemonClient(python, os.path.dirname(
+                    os.path.dirname(os.path.abspath(__file__))))
+
+        scheduler = Scheduler(
+            graph, cache, args.jobs, args.force,
+            settings.get('sublimepyside_jobs', {}).get('timeout'),
+            on_output, on_task, daemon
+        )
+        try:
+            success = scheduler.run()
+        finally:
+            if daemon is not None:
+                daemon.stop()
+        print('\n'.join(scheduler.report()))
+
+        return 0 if success else 1
+
+
+class RccCommand(object):
+    """
+    Compile a qrc file without pyside-rcc
+    """
+
+    name = 'rcc'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='compile a .qrc file into a python module')
+        parser.add_argument('qrc', nargs='+',
+                            help='qrc file, several ones with -shared')
+        parser.add_argument('-o', dest='output', default=None,
+                            help='output module (default: <qrc>_rc.py), '
+                            'the shared data module with -shared')
+        parser.add_argument('-compress', dest='level', type=int,
+                            default=rcc.DEFAULT_LEVEL,
+                            help='zlib compression level (-1 to 9)')
+        parser.add_argument('-threshold', type=int,
+                            default=rcc.DEFAULT_THRESHOLD,
+                            help='minimum compression gain in percent')
+        parser.add_argument('-no-compress', dest='level', const=0,
+                            action='store_const',
+                            help='store every asset raw')
+        parser.add_argument('-root', default=None,
+                            help='prefix every resource path with root')
+        parser.add_argument('-policy', default=None,
+                            help='JSON list of compression rules (see '
+                            'compression_policy in the settings)')
+        parser.add_argument('-report', action='store_true',
+                            help='print per asset sizes and times and the '
+                            'module import cost')
+        parser.add_argument('-split', action='store_true',
+                            help='one module per qrc prefix and a loader '
+                            'that registers them on first access')
+        parser.add_argument('-shared', action='store_true',
+                            help='store every distinct asset of the qrc '
+                            'files once in the -o module, each qrc gets a '
+                            '<qrc>_rc.py module that registers against it')
+        parser.add_argument('-shared-name', dest='shared_name', default=None,
+                            help='import name of the shared module '
+                            '(default: its file name)')
+        parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help='compression processes (default: number '
+                            'of cores)')
+        parser.add_argument('--chunks', default=None,
+                            help='directory that keeps the compressed '
+                            'assets between runs')
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        if args.shared and not args.output:
+            sys.stderr.write('-shared needs the -o shared module\n')
+            return 1
+        if not args.shared and len(args.qrc) != 1:
+            sys.stderr.write('several qrc files need -shared\n')
+            return 1
+
+        output = args.output or args.qrc[0][:-len('.qrc')] + '_rc.py'
+        chunks = rcc.ChunkCache(args.chunks) if args.chunks else None
+        try:
+            policy = None
+            if args.policy:
+                policy = rcc.CompressionPolicy(json.loads(args.policy))
+            if args.shared:
+                stats = rcc.compile_bundle(
+                    args.qrc, output, args.level, args.threshold, args.root,
+                    chunks, args.jobs, policy=policy, measure=args.report,
+                    module=args.shared_name)
+            else:
+                stats = rcc.compile_qrc(
+                    args.qrc[0], output, args.level, args.threshold,
+                    args.root, chunks, args.jobs, policy=policy,
+                    measure=args.report, split=args.split)
+        except (rcc.ResourceError, ValueError, IOError, OSError) as error:
+            sys.stderr.write('{0}\n'.format(error))
+            return 1
+
+        print('{0}: {1} files, {2} compressed, {3} from cache, {4} '
+              'bytes'.format(output, stats['files'], stats['compressed'],
+                             stats['cached'], stats['size']))
+        if args.report:
+            print('\n'.join(rcc.report(stats)))
+        elif args.shared:
+            print('{0} bytes saved by sharing assets across {1} qrc '
+                  'files'.format(stats['saved'], len(stats['outputs'])))
+
+        return 0
+
+
+class ReleaseCommand(object):
+    """
+    Compile TS catalogs into QM files without lrelease
+    """
+
+    name = 'release'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='compile .ts catalogs into .qm files')
+        parser.add_argument('paths', nargs='*', default=['.'],
+                            help='TS files or directories to walk')
+        parser.add_argument('--settings', action='append', default=[],
+                            help='extra sublime-settings file to overlay')
+        parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help='parallel compilers (default: number of '
+                            'cores)')
+        parser.add_argument('--cache', default=None,
+                            help='build cache file (default: '
+                            '<first path>/.sublimepyside-build.json)')
+        parser.add_argument('--force', action='store_true',
+                            help='compile up to date catalogs too')
+        parser.add_argument('-q', '--quiet', action='store_true')
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        settings = load_settings(*args.settings)
+        catalogs, roots = [], []
+        for path in args.paths:
+            if os.path.isdir(path):
+                roots.append(path)
+            else:
+                catalogs.append(path)
+
+        catalogs.extend(walk(
+            roots, ('.ts',), settings.get('sublimepyside_ignore_patterns')))
+
+        first = args.paths[0] if args.paths else '.'
+        cache = BuildCache(args.cache or os.path.join(
+            first if os.path.isdir(first) else os.path.dirname(
+                os.path.abspath(first)), '.sublimepyside-build.json'))
+
+        results = compile_catalogs(catalogs, cache, args.jobs,
+                                   force=args.force)
+
+        failed = 0
+        for source, output, stats, error in results:
+            if error is not None:
+                failed += 1
+                sys.stderr.write('{0}\n'.format(error))
+            elif args.quiet:
+                continue
+            elif stats is None:
+                print('{0}: up to date'.format(output))
+            else:
+                print('{0}: {1} finished and {2} unfinished translations, '
+                      '{3} untranslated'.format(
+                          output, stats['finished'], stats['unfinished'],
+                          stats['untranslated']))
+
+        return 1 if failed else 0
+
+
+COMMANDS = [BuildCommand, RccCommand, ReleaseCommand]
@@ -0,0 +1,543 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Long lived helper process that keeps the PySide tools imported between
+compilations, and its client
+
+The server runs under the Python interpreter that owns PySide:
+
+    python -m builder.daemon [--idle-timeout SECONDS]
+
+it prints the port it listens on (127.0.0.1) as its first output line and
+exits when it has been idle for too long or when its standard input is
+closed (the client died). Requests are JSON lines authenticated with the
+token given in the SUBLIMEPYSIDE_DAEMON_TOKEN environment variable. A run
+request can be cancelled by its id while it waits for the compilations
+before it.
+
+pyside-rcc and pyside-lupdate are native binaries that can not be kept
+warm, the daemon does not serve them and the client reports them as
+unavailable so callers spawn the configured binary instead.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import binascii
+import optparse
+import threading
+import traceback
+import subprocess
+
+from .jobs import Job
+
+TOKEN_VARIABLE = 'SUBLIMEPYSIDE_DAEMON_TOKEN'
+HEALTH_INTERVAL = 30
+MAX_RESTARTS = 3
+SERVED_TOOLS = ('uic',)
+
+
+class DaemonUnavailable(Exception):
+    """The daemon can not be started, does not answer or does not serve
+    the requested tool
+    """
+
+
+class Unsupported(Exception):
+    """The request needs the real binary (preview, unknown options...)
+    """
+
+
+def _send(sock, message):
+    """Send a JSON line"""
+
+    sock.sendall((json.dumps(message) + '\n').encode('utf8'))
+
+
+def _receive(sock):
+    """Receive a JSON line, None if the peer closed the connection"""
+
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = sock.recv(65536)
+        if not chunk:
+            return None
+
+        data += chunk
+
+    return json.loads(data.decode('utf8'))
+
+
+def interpreter(command):
+    """Return the Python interpreter of a tool script reading its shebang
+    line, None if command is not a Python script
+    """
+
+    try:
+        with open(command, 'rb') as fhandler:
+            line = fhandler.readline(256).decode('utf8', 'replace').strip()
+    except (IOError, OSError):
+        return None
+
+    if not line.startswith('#!') or 'python' not in line:
+        return None
+
+    args = line[2:].split()
+    if os.path.basename(args[0]) == 'env' and len(args) > 1:
+        return args[1]
+
+    return args[0]
+
+
+# =============================================================================
+# Server
+# =============================================================================
+def _uic_parser():
+    """Option parser compatible with the pyside-uic command line"""
+
+    parser = optparse.OptionParser(prog='pyside-uic')
+    parser.add_option('-p', '--preview', action='store_true', default=False)
+    parser.add_option('-o', '--output', default='-')
+    parser.add_option('-x', '--execute', action='store_true', default=False)
+    parser.add_option('-d', '--debug', action='store_true', default=False)
+    parser.add_option('-i', '--indent', type='int', default=4)
+    parser.error = lambda message: _raise(Unsupported(message))
+
+    return parser
+
+
+def _raise(error):
+    raise error
+
+
+def load_tools():
+    """Import the tools available in this interpreter once, returns a
+    dict of tool name to callable(args) -> output
+    """
+
+    tools = {}
+    try:
+        from pysideuic import compileUi
+    except ImportError:
+        return tools
+
+    def uic(args):
+        options, filenames = _uic_parser().parse_args(args)
+        if options.preview or options.output == '-' or len(filenames) != 1:
+            raise Unsupported('only -o output compilations are served')
+
+        with open(options.output, 'w') as output:
+            compileUi(filenames[0], output, options.execute, options.indent)
+
+        return ''
+
+    tools['uic'] = uic
+    return tools
+
+
+class Server(object):
+    """
+    Serves compile requests, compilations are serialized because the tools
+    keep module level state
+    """
+
+    def __init__(self, token, idle_timeout=600):
+        super(Server, self).__init__()
+
+        self.token = token
+        self.idle_timeout = idle_timeout
+        self.tools = load_tools()
+        self.lock = threading.Lock()
+        self.requests = threading.Lock()
+        self.pending = set()
+        self.cancelled = set()
+        self.last = time.time()
+        self.running = True
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(16)
+        self.socket.settimeout(0.2)
+
+    @property
+    def port(self):
+        """The port the server listens on"""
+
+        return self.socket.getsockname()[1]
+
+    def serve_forever(self):
+        """Accept connections until idle, orphaned or shut down"""
+
+        while self.running:
+            try:
+                connection, _ = self.socket.accept()
+            except socket.timeout:
+                idle = time.time() - self.last
+                if self.idle_timeout and idle > self.idle_timeout:
+                    break
+                continue
+
+            connection.settimeout(None)
+            thread = threading.Thread(target=self.handle, args=(connection,))
+            thread.daemon = True
+            thread.start()
+
+        self.socket.close()
+
+    def watch_parent(self, stream):
+        """Stop when stream (our stdin) is closed by the client process"""
+
+        def watch():
+            stream.read()
+            self.running = False
+
+        thread = threading.Thread(target=watch)
+        thread.daemon = True
+        thread.start()
+
+    def handle(self, connection):
+        """Answer one request"""
+
+        try:
+            request = _receive(connection)
+            if request is None or request.get('token') != self.token:
+                return
+
+            self.last = time.time()
+            _send(connection, self.dispatch(request))
+        except (socket.error, ValueError):
+            pass
+        finally:
+            connection.close()
+            self.last = time.time()
+
+    def dispatch(self, request):
+        """Return the response to a request"""
+
+        operation = request.get('op')
+        if operation == 'ping':
+            return {'pid': os.getpid(), 'tools': sorted(self.tools)}
+
+        if operation == 'shutdown':
+            self.running = False
+            return {'pid': os.getpid()}
+
+        if operation == 'cancel':
+            with self.requests:
+                if request.get('id') in self.pending:
+                    self.cancelled.add(request['id'])
+            return {}
+
+        if operation != 'run':
+            return {'error': 'unknown operation {0}'.format(operation)}
+
+        tool = self.tools.get(request.get('tool'))
+        if tool is None:
+            return {'unsupported': True}
+
+        with self.requests:
+            self.pending.add(request.get('id'))
+
+        try:
+            return self.run(tool, request)
+        finally:
+            with self.requests:
+                self.pending.discard(request.get('id'))
+                self.cancelled.discard(request.get('id'))
+
+    def run(self, tool, request):
+        """Run a tool request unless it was cancelled while it waited"""
+
+        with self.lock:
+            if request.get('id') in self.cancelled:
+                return {'cancelled': True}
+
+            try:
+                if request.get('cwd'):
+                    os.chdir(request['cwd'])
+                output = tool(request.get('args', []))
+            except Unsupported:
+                return {'unsupported': True}
+            except Exception:
+                return {'status': 1, 'output': traceback.format_exc()}
+
+        return {'status': 0, 'output': output}
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m builder.daemon',
+        description='Keep the PySide tools warm between compilations')
+    parser.add_argument('--idle-timeout', type=float, default=600,
+                        help='exit after this many idle seconds (0: never)')
+    args = parser.parse_args(argv)
+
+    server = Server(os.environ.get(TOKEN_VARIABLE, ''), args.idle_timeout)
+    sys.stdout.write('{0}\n'.format(server.port))
+    sys.stdout.flush()
+
+    # nobody reads our output anymore, tools must not block on a full pipe
+    sys.stdout = open(os.devnull, 'w')
+    server.watch_parent(sys.stdin)
+    server.serve_forever()
+
+    return 0
+
+
+# =============================================================================
+# Client
+# =============================================================================
+class DaemonClient(object):
+    """
+    Starts the daemon lazily with the given Python interpreter, checks its
+    health and restarts it when it dies (up to MAX_RESTARTS times in a row)
+    """
+
+    def __init__(self, python, cwd, idle_timeout=600, startup_timeout=10,
+                 **popen_kwargs):
+        super(DaemonClient, self).__init__()
+
+        self.python = python
+        self.cwd = cwd
+        self.idle_timeout = idle_timeout
+        self.startup_timeout = startup_timeout
+        self.popen_kwargs = popen_kwargs
+
+        self.proc = None
+        self.port = None
+        self.token = None
+        self.tools = []
+        self.checked = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def is_alive(self):
+        """True if the daemon process is running"""
+
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self):
+        """Start the daemon and wait for its port"""
+
+        self.token = binascii.hexlify(os.urandom(16)).decode('ascii')
+        env = dict(os.environ)
+        env[TOKEN_VARIABLE] = self.token
+
+        try:
+            proc = subprocess.Popen(
+                [self.python, '-m', 'builder.daemon',
+                 '--idle-timeout', str(self.idle_timeout)],
+                cwd=self.cwd, env=env, stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, **self.popen_kwargs
+            )
+        except OSError as error:
+            raise DaemonUnavailable(
+                '{0}: {1}'.format(self.python, error))
+
+        timer = threading.Timer(self.startup_timeout, proc.kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            port = int(proc.stdout.readline())
+        except ValueError:
+            proc.kill()
+            proc.wait()
+            raise DaemonUnavailable('the daemon did not start')
+        finally:
+            timer.cancel()
+
+        proc.stdout.close()
+        self.proc, self.port = proc, port
+        self.tools = self.call({'op': 'ping'}, self.startup_timeout)['tools']
+        self.checked = time.time()
+
+    def stop(self):
+        """Stop the daemon"""
+
+        with self.lock:
+            if self.is_alive():
+                try:
+                    self.call({'op': 'shutdown'}, 1)
+                    self.proc.wait()
+                except (DaemonUnavailable, socket.error):
+                    self.kill()
+
+            self.proc = None
+
+    def kill(self):
+        """Kill an unresponsive daemon"""
+
+        if self.is_alive():
+            try:
+                self.proc.kill()
+                self.proc.wait()
+            except OSError:
+                pass
+
+    def ensure(self):
+        """Make sure a healthy daemon is running"""
+
+        with self.lock:
+            if self.is_alive() and time.time() - self.checked > (
+                    HEALTH_INTERVAL):
+                try:
+                    self.tools = self.call({'op': 'ping'}, 5)['tools']
+                    self.checked = time.time()
+                except (DaemonUnavailable, socket.error):
+                    self.kill()
+
+            if self.is_alive():
+                return
+
+            if self.failures >= MAX_RESTARTS:
+                raise DaemonUnavailable('the daemon keeps failing')
+
+            try:
+                self.start()
+                self.failures = 0
+            except (DaemonUnavailable, socket.error):
+                self.failures += 1
+                self.kill()
+                raise DaemonUnavailable('the daemon did not start')
+
+    def call(self, message, timeout=None):
+        """Send a request and return its response"""
+
+        message = dict(message, token=self.token)
+        sock = socket.create_connection(('127.0.0.1', self.port), timeout)
+        try:
+            _send(sock, message)
+            response = _receive(sock)
+        finally:
+            sock.close()
+
+        if response is None:
+            raise DaemonUnavailable('the daemon closed the connection')
+
+        return response
+
+    def run(self, tool, args, cwd=None, timeout=None, request=None):
+        """Run tool with the given arguments in the daemon, returns
+        (status, output), status is None if the request was cancelled;
+        raises DaemonUnavailable when the caller has to spawn the binary
+        and socket.timeout when it took too long
+        """
+
+        if tool not in SERVED_TOOLS:
+            raise DaemonUnavailable('{0} is not served'.format(tool))
+
+        self.ensure()
+        if tool not in self.tools:
+            raise DaemonUnavailable('{0} is not served'.format(tool))
+
+        try:
+            response = self.call(
+                {'op': 'run', 'tool': tool, 'args': args, 'cwd': cwd,
+                 'id': request}, timeout
+            )
+        except socket.timeout:
+            self.kill()
+            raise
+        except socket.error as error:
+            self.kill()
+            raise DaemonUnavailable(str(error))
+
+        if response.get('unsupported'):
+            raise DaemonUnavailable('{0} request not served'.format(tool))
+
+        if response.get('cancelled'):
+            return None, ''
+
+        return response['status'], response['output']
+
+    def cancel(self, request):
+        """Drop the run request with the given id if it did not start yet
+        """
+
+        if not self.is_alive():
+            return
+
+        try:
+            self.call({'op': 'cancel', 'id': request}, 1)
+        except (DaemonUnavailable, socket.error):
+            pass
+
+
+class DaemonJob(Job):
+    """
+    A Job that runs in the daemon when it serves the tool and falls back
+    to spawning the command otherwise
+
+    Cancelling a job the daemon serves drops its request if it is still
+    waiting there, the output of a compilation already running is ignored
+    """
+
+    def __init__(self, client, tool, args, **kwargs):
+        super(DaemonJob, self).__init__(args, **kwargs)
+
+        self.client = client
+        self.tool = tool
+        self.request = binascii.hexlify(os.urandom(8)).decode('ascii')
+        self.served = False
+
+    def execute(self):
+        """Run the job in the daemon or spawn it
+        """
+
+        if self.client is None or self.tool is None or self.cancelled:
+            return super(DaemonJob, self).execute()
+
+        start = time.time()
+        self.served = True
+        status, output = -1, ''
+        try:
+            status, output = self.client.run(
+                self.tool, self.args[1:], self.cwd, self.timeout,
+                self.request)
+        except DaemonUnavailable:
+            self.served = False
+            return super(DaemonJob, self).execute()
+        except socket.timeout:
+            self.timed_out = True
+        except Exception:
+            output = traceback.format_exc()
+        finally:
+            self.served = False
+
+        try:
+            if self.cancelled or status is None:
+                status, output = -1, ''
+
+            for line in output.splitlines(True):
+                self.emit(line)
+
+            self.returncode = status
+        except Exception:
+            self.emit(traceback.format_exc())
+            self.returncode = -1
+        finally:
+            self.elapsed = time.time() - start
+            self.finish()
+
+    def cancel(self):
+        """Cancel the job, a request waiting in the daemon is dropped
+        from a background thread so the caller never waits on the socket
+        """
+
+        super(DaemonJob, self).cancel()
+        if self.served:
+            thread = threading.Thread(
+                target=self.client.cancel, args=(self.request,))
+            thread.daemon = True
+            thread.start()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,402 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Dependency graph of Qt artifacts (uic, rcc and lupdate) and its parallel
+scheduler
+"""
+
+import os
+import re
+import time
+import fnmatch
+import threading
+
+from .jobs import JobQueue, FunctionJob
+from .daemon import DaemonJob
+from .cache import qrc_assets
+from . import rcc
+from .tools import (
+    uic_arguments, rcc_arguments, builtin_rcc_arguments, shared_rcc_arguments,
+    write_lupdate_project
+)
+
+IGNORE = ['.git', '.hg', '.svn', '.bzr', '__pycache__', '.tox', '*.egg-info']
+
+_pro_variable = re.compile(r'^\s*(\w+)\s*\+?=\s*((?:.*\\\n)*.*)$', re.M)
+
+
+def walk(roots, extensions, ignore=None):
+    """Generator of files under roots with one of the given extensions,
+    directories or files matching an ignore glob are skipped
+    """
+
+    ignore = IGNORE if ignore is None else ignore
+    for root in roots:
+        for dirname, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not any(
+                fnmatch.fnmatch(d, pattern) for pattern in ignore))
+
+            for filename in sorted(files):
+                if not filename.endswith(tuple(extensions)):
+                    continue
+
+                if any(fnmatch.fnmatch(filename, p) for p in ignore):
+                    continue
+
+                yield os.path.join(dirname, filename)
+
+
+def pro_variables(filename):
+    """Return the variables (SOURCES, FORMS, TRANSLATIONS...) of a qmake
+    project file as lists of absolute paths
+    """
+
+    root = os.path.dirname(os.path.abspath(filename))
+    with open(filename, 'r') as fhandler:
+        text = fhandler.read()
+
+    variables = {}
+    for name, value in _pro_variable.findall(text):
+        variables.setdefault(name, []).extend(
+            os.path.normpath(os.path.join(root, item))
+            for item in value.replace('\\\n', ' ').split()
+        )
+
+    return variables
+
+
+class Task(object):
+    """
+    A node of the build graph, runs `args` to generate `output` from
+    `inputs` once every task in `deps` finished
+
+    Built-in tools run `function` (see jobs.FunctionJob) in process and
+    give their `version` for the build signature, `cleanup` files are
+    removed once the task finished
+    """
+
+    def __init__(self, kind, args, output, inputs, deps=(), function=None,
+                 version=None, cleanup=()):
+        super(Task, self).__init__()
+
+        self.kind = kind
+        self.args = args
+        self.function = function
+        self.version = version
+        self.cleanup = list(cleanup)
+        self.output = output
+        self.inputs = list(inputs)
+        self.deps = list(deps)
+        self.dependents = []
+        self.state = 'pending'
+        self.started = self.finished = None
+
+        for dep in self.deps:
+            dep.dependents.append(self)
+
+    @property
+    def name(self):
+        """Task display name"""
+
+        return '{0} {1}'.format(self.kind, os.path.basename(self.output))
+
+    @property
+    def duration(self):
+        """Wall time of the task, 0 if it did not run"""
+
+        if self.started is None or self.finished is None:
+            return 0.0
+
+        return self.finished - self.started
+
+
+class BuildGraph(object):
+    """
+    DAG of build tasks: assets -> qrc -> _rc.py, ui -> _ui.py and
+    sources (including generated _ui.py modules) -> ts
+    """
+
+    def __init__(self):
+        super(BuildGraph, self).__init__()
+        self.tasks = []
+
+    def add(self, task):
+        """Add a task to the graph"""
+
+        self.tasks.append(task)
+        return task
+
+    def topological(self):
+        """Return the tasks in dependency order"""
+
+        ordered, visited = [], set()
+
+        def visit(task, path):
+            if task in path:
+                raise ValueError('dependency cycle at {0}'.format(task.name))
+
+            if task in visited:
+                return
+
+            for dep in task.deps:
+                visit(dep, path | set([task]))
+
+            visited.add(task)
+            ordered.append(task)
+
+        for task in self.tasks:
+            visit(task, set())
+
+        return ordered
+
+    def critical_path(self):
+        """Return the (duration, tasks) of the longest dependency chain"""
+
+        best = {}
+        for task in self.topological():
+            previous = (0.0, [])
+            for dep in task.deps:
+                if best[dep][0] > previous[0]:
+                    previous = best[dep]
+
+            best[task] = (previous[0] + task.duration, previous[1] + [task])
+
+        return max(best.values(), key=lambda item: item[0]) if best else (
+            0.0, [])
+
+
+def plan(roots, tools, rcc_options, translations=True, ignore=None,
+         builtin_rcc=None):
+    """Discover .ui, .qrc, .py and .pro files under roots and return the
+    BuildGraph that generates every artifact
+
+    tools is the sublimepyside_tools_map setting, resources are compiled
+    with builtin_rcc (a rcc.run like function) instead of pyside-rcc when
+    it is given, in a single task sharing their assets when the
+    shared_module rcc option names the data module of every root
+    """
+
+    graph = BuildGraph()
+    for root in roots:
+        forms, resources, sources, projects = [], [], [], []
+        for filename in walk([root], ('.ui', '.qrc', '.py', '.pro'), ignore):
+            if filename.endswith('.ui'):
+                forms.append(filename)
+            elif filename.endswith('.qrc'):
+                resources.append(filename)
+            elif filename.endswith('.pro'):
+                projects.append(filename)
+            elif not filename.endswith(('_rc.py', '_ui.py')):
+                sources.append(filename)
+
+        if builtin_rcc is None and 'rcc' not in tools:
+            resources = []
+
+        command = rcc.COMPILER if builtin_rcc else tools.get('rcc')
+        shared = rcc_options.get('shared_module') if builtin_rcc else None
+        if shared and resources:
+            output = os.path.join(root, shared)
+            inputs = list(resources)
+            for filename in resources:
+                inputs += qrc_assets(filename)
+            graph.add(Task(
+                'rcc', [command] + shared_rcc_arguments(
+                    resources, output, rcc_options),
+                output, inputs, function=builtin_rcc,
+                version=rcc.COMPILER_VERSION
+            ))
+            resources = []
+
+        arguments = builtin_rcc_arguments if builtin_rcc else rcc_arguments
+        for filename in resources:
+            output = filename[:-len('.qrc')] + '_rc.py'
+            graph.add(Task(
+                'rcc', [command] + arguments(filename, output, rcc_options),
+                output, [filename] + qrc_assets(filename),
+                function=builtin_rcc,
+                version=rcc.COMPILER_VERSION if builtin_rcc else None
+            ))
+
+        uic_tasks = []
+        for filename in forms if 'uic' in tools else ():
+            output = filename[:-len('.ui')] + '_ui.py'
+            uic_tasks.append(graph.add(Task(
+                'uic', [tools['uic']] + uic_arguments(filename, output),
+                output, [filename]
+            )))
+
+        if not translations or 'lupdate' not in tools:
+            continue
+
+        for filename in projects:
+            variables = pro_variables(filename)
+            catalogs = variables.get('TRANSLATIONS', [])
+            if not catalogs:
+                continue
+
+            graph.add(Task(
+                'lupdate', [tools['lupdate'], filename], catalogs[0],
+                [filename] + variables.get('SOURCES', []) +
+                variables.get('FORMS', []), uic_tasks
+            ))
+
+        if not projects and (sources or uic_tasks):
+            catalog = os.path.join(
+                root, '{0}.ts'.format(os.path.basename(root.rstrip('/\\'))))
+            inputs = sources + [task.output for task in uic_tasks]
+            project = write_lupdate_project(inputs, catalog)
+            graph.add(Task(
+                'lupdate', [tools['lupdate']] + project, catalog, inputs,
+                uic_tasks, cleanup=project
+            ))
+
+    return graph
+
+
+class Scheduler(object):
+    """
+    Executes a BuildGraph on a worker pool, a task is dispatched as soon
+    as all its dependencies finished, up to date tasks are skipped using
+    the given BuildCache, tools served by the optional DaemonClient run
+    in it instead of spawning a process
+    """
+
+    def __init__(self, graph, cache=None, workers=None, force=False,
+                 timeout=None, on_output=None, on_task=None, daemon=None,
+                 **popen_kwargs):
+        super(Scheduler, self).__init__()
+
+        self.graph = graph
+        self.cache = cache
+        self.force = force
+        self.timeout = timeout
+        self.on_output = on_output
+        self.on_task = on_task
+        self.daemon = daemon
+        self.popen_kwargs = popen_kwargs
+        self.queue = JobQueue(workers)
+        self.condition = threading.Condition()
+        self.waiting = {}
+        self.remaining = 0
+        self.started = self.finished = None
+
+    def run(self):
+        """Run the graph, blocks until done, returns True on success"""
+
+        self.graph.topological()
+        self.started = time.time()
+        self.remaining = len(self.graph.tasks)
+        self.waiting = dict(
+            (task, len(task.deps)) for task in self.graph.tasks)
+
+        try:
+            for task in list(self.graph.tasks):
+                if not task.deps:
+                    self.dispatch(task)
+
+            with self.condition:
+                while self.remaining:
+                    self.condition.wait(0.1)
+        finally:
+            self.queue.close(wait=not self.remaining)
+
+        self.finished = time.time()
+        return all(
+            task.state in ('done', 'up to date') for task in self.graph.tasks)
+
+    def cancel(self):
+        """Cancel the running jobs, pending tasks are skipped"""
+
+        self.queue.cancel_all()
+
+    def dispatch(self, task):
+        """Start a task whose dependencies are all finished"""
+
+        if any(dep.state not in ('done', 'up to date') for dep in task.deps):
+            return self.complete(task, 'skipped')
+
+        signature = None
+        if self.cache is not None:
+            signature = self.cache.signature(
+                task.inputs, task.args[0], task.args[1:], task.version)
+            if not self.force and self.cache.is_up_to_date(
+                    task.output, signature):
+                return self.complete(task, 'up to date')
+
+        def job_done(job):
+            task.finished = time.time()
+            task.started = task.finished - job.elapsed
+            if job.succeeded and self.cache is not None:
+                self.cache.record(task.output, signature)
+
+            self.complete(task, 'done' if job.succeeded else 'failed', job)
+
+        if task.function is not None:
+            self.queue.submit(FunctionJob(
+                task.function, task.args, name=task.name,
+                timeout=self.timeout, on_output=self.on_output,
+                on_done=job_done
+            ))
+            return
+
+        self.queue.submit(DaemonJob(
+            self.daemon, task.kind, task.args, name=task.name,
+            timeout=self.timeout, on_output=self.on_output, on_done=job_done,
+            **self.popen_kwargs
+        ))
+
+    def complete(self, task, state, job=None):
+        """Mark a task as finished and dispatch the tasks it unblocked"""
+
+        task.state = state
+        for filename in task.cleanup:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+
+        if self.on_task is not None:
+            self.on_task(task, job)
+
+        ready = []
+        with self.condition:
+            for dependent in task.dependents:
+                self.waiting[dependent] -= 1
+                if not self.waiting[dependent]:
+                    ready.append(dependent)
+
+        for dependent in ready:
+            self.dispatch(dependent)
+
+        with self.condition:
+            self.remaining -= 1
+            self.condition.notify_all()
+
+    def report(self):
+        """Return the build summary lines including the critical path"""
+
+        states = {}
+        for task in self.graph.tasks:
+            states[task.state] = states.get(task.state, 0) + 1
+
+        elapsed = (self.finished or time.time()) - self.started
+        busy = sum(task.duration for task in self.graph.tasks)
+        length, path = self.graph.critical_path()
+
+        lines = [
+            '{0} tasks: {1}'.format(len(self.graph.tasks), ', '.join(
+                '{0} {1}'.format(count, state)
+                for state, count in sorted(states.items()))),
+            'Wall time {0:.2f}s, task time {1:.2f}s ({2:.1f}x '
+            'parallel)'.format(elapsed, busy, busy / max(elapsed, 1e-6)),
+            'Critical path {0:.2f}s:'.format(length)
+        ]
+        lines += [
+            '    {0:.2f}s {1}'.format(task.duration, task.name)
+            for task in path
+        ]
+
+        return lines
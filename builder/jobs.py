@@ -0,0 +1,256 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Bounded concurrency job queue for external Qt tools
+"""
+
+import time
+import threading
+import traceback
+import subprocess
+import multiprocessing
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+class Job(object):
+    """
+    An external process whose output is captured line by line
+
+    on_output(job, line) is called for every output line and on_done(job)
+    once the process finished, both from the worker thread
+    """
+
+    def __init__(self, args, name=None, cwd=None, timeout=None,
+                 on_output=None, on_done=None, **popen_kwargs):
+        super(Job, self).__init__()
+
+        self.args = args
+        self.name = name or ' '.join(args)
+        self.cwd = cwd
+        self.timeout = timeout
+        self.on_output = on_output
+        self.on_done = on_done
+        self.popen_kwargs = popen_kwargs
+
+        self.proc = None
+        self.returncode = None
+        self.elapsed = None
+        self.output = []
+        self.cancelled = False
+        self.timed_out = False
+        self.done = threading.Event()
+
+    def execute(self):
+        """Run the process and wait for it, called from a worker thread
+        """
+
+        start = time.time()
+        timer = None
+        try:
+            if not self.cancelled:
+                self.proc = subprocess.Popen(
+                    self.args, cwd=self.cwd, stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT, stdin=subprocess.PIPE,
+                    **self.popen_kwargs
+                )
+                self.proc.stdin.close()
+
+                if self.timeout:
+                    timer = threading.Timer(self.timeout, self.expire)
+                    timer.daemon = True
+                    timer.start()
+
+                for line in iter(self.proc.stdout.readline, b''):
+                    self.emit(line.decode('utf-8', 'replace'))
+
+                self.proc.stdout.close()
+                self.returncode = self.proc.wait()
+        except OSError as error:
+            self.emit('{0}: {1}\n'.format(self.args[0], error))
+            self.returncode = -1
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+            self.elapsed = time.time() - start
+            self.finish()
+
+    def emit(self, line):
+        """Record an output line and forward it to on_output
+        """
+
+        self.output.append(line)
+        if self.on_output is not None:
+            self.on_output(self, line)
+
+    def finish(self):
+        """Mark the job as done and call on_done
+        """
+
+        self.done.set()
+        if self.on_done is not None:
+            self.on_done(self)
+
+    def expire(self):
+        """Kill the process because it took longer than its timeout
+        """
+
+        self.timed_out = True
+        self.kill()
+
+    def cancel(self):
+        """Cancel the job, kills the process if it is already running
+        """
+
+        self.cancelled = True
+        self.kill()
+
+    def kill(self):
+        """Kill the process if it is still alive
+        """
+
+        if self.proc is not None and self.proc.poll() is None:
+            try:
+                self.proc.kill()
+            except OSError:
+                pass
+
+    @property
+    def succeeded(self):
+        """True if the process finished with exit status 0
+        """
+
+        return self.returncode == 0 and not self.cancelled
+
+    @property
+    def status(self):
+        """Human readable exit status
+        """
+
+        if self.cancelled:
+            return 'cancelled'
+
+        if self.timed_out:
+            return 'timed out after {0}s'.format(self.timeout)
+
+        return 'exit status {0}'.format(self.returncode)
+
+
+class FunctionJob(Job):
+    """
+    A Job that runs a built-in tool in the worker thread instead of
+    spawning a process, function(args, emit) returns the exit status
+    """
+
+    def __init__(self, function, args, **kwargs):
+        super(FunctionJob, self).__init__(args, **kwargs)
+
+        self.function = function
+
+    def execute(self):
+        """Run the function, called from a worker thread
+        """
+
+        start = time.time()
+        try:
+            if not self.cancelled:
+                self.returncode = self.function(self.args[1:], self.emit)
+        except Exception:
+            self.emit(traceback.format_exc())
+            self.returncode = 1
+        finally:
+            self.elapsed = time.time() - start
+            self.finish()
+
+
+class JobQueue(object):
+    """
+    Runs jobs on at most `workers` threads (number of cores by default)
+    """
+
+    def __init__(self, workers=None):
+        super(JobQueue, self).__init__()
+
+        self.workers = workers or multiprocessing.cpu_count()
+        self.queue = queue.Queue()
+        self.threads = []
+        self.active = set()
+        self.lock = threading.Lock()
+
+    def submit(self, job):
+        """Queue a job
+        """
+
+        with self.lock:
+            self.active.add(job)
+            if len(self.threads) < self.workers:
+                thread = threading.Thread(target=self.work)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+
+        self.queue.put(job)
+        return job
+
+    def work(self):
+        """Worker thread loop, an exception of a job (or of its on_done
+        callback) is printed and the worker goes on with the next job
+        """
+
+        while True:
+            job = self.queue.get()
+            if job is None:
+                self.queue.task_done()
+                return
+
+            try:
+                job.execute()
+            except Exception:
+                traceback.print_exc()
+            finally:
+                with self.lock:
+                    self.active.discard(job)
+                self.queue.task_done()
+
+    def jobs(self):
+        """Return the list of queued and running jobs
+        """
+
+        with self.lock:
+            return list(self.active)
+
+    def cancel_all(self):
+        """Cancel every queued or running job
+        """
+
+        for job in self.jobs():
+            job.cancel()
+
+    def close(self, wait=False):
+        """Stop the worker threads once the queued jobs are done, jobs
+        submitted afterwards start new workers, with wait the threads are
+        joined
+        """
+
+        with self.lock:
+            threads, self.threads = self.threads, []
+
+        for _ in threads:
+            self.queue.put(None)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def wait(self):
+        """Block until every submitted job finished
+        """
+
+        self.queue.join()
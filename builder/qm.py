@@ -0,0 +1,375 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Compile Qt Linguist TS catalogs into binary QM files like lrelease does
+in its default (SaveEverything) mode, without the Qt tools
+
+Context, source and comment keys are stored as UTF-8 like Qt 5 lrelease
+does, QTranslator skips the language section when it does not know it
+"""
+
+import os
+import shutil
+import struct
+import tempfile
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import xml.etree.ElementTree as ElementTree
+
+COMPILER = 'builtin-lrelease'
+COMPILER_VERSION = '1'
+
+MAGIC = b'\x3c\xb8\x64\x18\xca\xef\x9c\x95\xcd\x21\x1c\xbf\x60\xa1\xbd\xdd'
+
+# sections
+HASHES = 0x42
+MESSAGES = 0x69
+NUMERUS_RULES = 0x88
+DEPENDENCIES = 0x96
+LANGUAGE = 0xa7
+
+# message tags
+TAG_END = 1
+TAG_TRANSLATION = 3
+TAG_SOURCE_TEXT = 6
+TAG_CONTEXT = 7
+TAG_COMMENT = 8
+
+# numerus rule opcodes
+Q_EQ, Q_LT, Q_LEQ, Q_BETWEEN = 0x01, 0x02, 0x03, 0x04
+Q_NOT, Q_MOD_10, Q_MOD_100, Q_LEAD_1000 = 0x08, 0x10, 0x20, 0x40
+Q_AND, Q_OR, Q_NEWRULE = 0xfd, 0xfe, 0xff
+Q_NEQ, Q_GEQ, Q_NOT_BETWEEN = Q_NOT | Q_EQ, Q_NOT | Q_LT, Q_NOT | Q_BETWEEN
+
+VARIANT_SEPARATOR = u'\x9c'
+
+NUMERUS_RULES_TABLE = [
+    ([], 'bi my zh dz fj gn hu id ja jv ko ms na fa su th bo vi yo za bh '
+         'tt tr tw'),
+    ([Q_EQ, 1],
+     'ab aa af sq am as ay az ba eu bn bg ca km kw co da nl en eo et fo fi '
+     'fur fy gl ka de el kl gu ha he hi ia ie it kn ks kk rw ky ku rn lo la '
+     'ln lb mg ml mr mn ne nso nb nn no oc or ps pt pa qu rm st tn sn sd si '
+     'ss so es sw sv tg ta te to ts ug uz vo xh yi zu'),
+    ([Q_LEQ, 1], 'br fr ti wa pt_BR tl fil'),
+    ([Q_MOD_10 | Q_EQ, 1, Q_AND, Q_MOD_100 | Q_NEQ, 11, Q_NEWRULE,
+      Q_NEQ, 0], 'lv'),
+    ([Q_MOD_10 | Q_EQ, 1, Q_AND, Q_MOD_100 | Q_NEQ, 11], 'is'),
+    ([Q_EQ, 1, Q_NEWRULE, Q_EQ, 2], 'dv iu ga gv mi se sm sa'),
+    ([Q_EQ, 1, Q_OR, Q_EQ, 11, Q_NEWRULE, Q_EQ, 2, Q_OR, Q_EQ, 12,
+      Q_NEWRULE, Q_BETWEEN, 3, 19], 'gd'),
+    ([Q_EQ, 1, Q_NEWRULE, Q_BETWEEN, 2, 4], 'sk cs'),
+    ([Q_MOD_10 | Q_EQ, 1, Q_NEWRULE, Q_MOD_10 | Q_EQ, 2], 'mk'),
+    ([Q_MOD_10 | Q_EQ, 1, Q_AND, Q_MOD_100 | Q_NEQ, 11, Q_NEWRULE,
+      Q_MOD_10 | Q_NEQ, 0, Q_AND, Q_MOD_100 | Q_NOT_BETWEEN, 10, 19], 'lt'),
+    ([Q_MOD_10 | Q_EQ, 1, Q_AND, Q_MOD_100 | Q_NEQ, 11, Q_NEWRULE,
+      Q_MOD_10 | Q_BETWEEN, 2, 4, Q_AND, Q_MOD_100 | Q_NOT_BETWEEN, 10, 19],
+     'bs be hr ru sr sh uk'),
+    ([Q_EQ, 1, Q_NEWRULE, Q_MOD_10 | Q_BETWEEN, 2, 4, Q_AND,
+      Q_MOD_100 | Q_NOT_BETWEEN, 10, 19], 'pl'),
+    ([Q_EQ, 1, Q_NEWRULE, Q_EQ, 0, Q_OR, Q_MOD_100 | Q_BETWEEN, 1, 19],
+     'ro mo'),
+    ([Q_MOD_100 | Q_EQ, 1, Q_NEWRULE, Q_MOD_100 | Q_EQ, 2, Q_NEWRULE,
+      Q_MOD_100 | Q_BETWEEN, 3, 4], 'sl'),
+    ([Q_EQ, 1, Q_NEWRULE, Q_EQ, 0, Q_OR, Q_MOD_100 | Q_BETWEEN, 1, 10,
+      Q_NEWRULE, Q_MOD_100 | Q_BETWEEN, 11, 19], 'mt'),
+    ([Q_EQ, 0, Q_NEWRULE, Q_EQ, 1, Q_NEWRULE, Q_BETWEEN, 2, 5, Q_NEWRULE,
+      Q_EQ, 6], 'cy'),
+    ([Q_EQ, 0, Q_NEWRULE, Q_EQ, 1, Q_NEWRULE, Q_EQ, 2, Q_NEWRULE,
+      Q_MOD_100 | Q_BETWEEN, 3, 10, Q_NEWRULE, Q_MOD_100 | Q_GEQ, 11], 'ar'),
+]
+
+_numerus_rules = dict(
+    (code, bytes(bytearray(rules)))
+    for rules, codes in NUMERUS_RULES_TABLE for code in codes.split()
+)
+
+
+def numerus_rules(language):
+    """Return the numerus rules bytes of a TS language code (de_DE, pt_BR,
+    sr@latin...), None for unknown languages
+    """
+
+    code = (language or '').replace('-', '_').split('@')[0].split('.')[0]
+    if code in _numerus_rules:
+        return _numerus_rules[code]
+
+    return _numerus_rules.get(code.split('_')[0].lower())
+
+
+def numerus_forms(rules):
+    """Return the number of plural forms of a language given its numerus
+    rules (one per rule plus the last "other" form)
+    """
+
+    if not rules:
+        return 1
+
+    return list(bytearray(rules)).count(Q_NEWRULE) + 2
+
+
+def elf_hash(data):
+    """The hash QTranslator uses to look up source text + comment"""
+
+    value = 0
+    for byte in bytearray(data):
+        if not byte:
+            break
+
+        value = ((value << 4) + byte) & 0xffffffff
+        high = value & 0xf0000000
+        if high:
+            value ^= high >> 24
+        value &= ~high & 0xffffffff
+
+    return value or 1
+
+
+def _qstring(text):
+    """QDataStream serialization of a QString (None is a null QString)"""
+
+    if text is None:
+        return struct.pack('>I', 0xffffffff)
+
+    data = text.encode('utf-16-be')
+    return struct.pack('>I', len(data)) + data
+
+
+def _qbytearray(data):
+    """QDataStream serialization of a QByteArray"""
+
+    return struct.pack('>I', len(data)) + data
+
+
+def _text(element):
+    """Return the contents of a translation element as lrelease reads
+    them: <byte> escapes resolved, length variants joined and None when
+    the element is empty
+    """
+
+    if element.get('variants') == 'yes':
+        return VARIANT_SEPARATOR.join(
+            _text(variant) or u'' for variant in element
+            if variant.tag == 'lengthvariant'
+        )
+
+    if element.text is None and not len(element):
+        return None
+
+    parts = [element.text or u'']
+    for child in element:
+        if child.tag == 'byte':
+            value = child.get('value', '')
+            if value.startswith('x'):
+                code = int(value[1:], 16)
+            else:
+                code = int(value)
+            parts.append(struct.pack('>I', code).decode('utf-32-be'))
+        parts.append(child.tail or u'')
+
+    return u''.join(parts)
+
+
+def parse(filename):
+    """Stream a TS file with iterparse, returns (language, dependencies,
+    messages) where messages are (context, source, comment, translations,
+    type, numerus) tuples
+    """
+
+    language, context = None, u''
+    dependencies, messages = [], []
+    for event, element in ElementTree.iterparse(
+            filename, events=('start', 'end')):
+        if event == 'start':
+            if element.tag == 'TS':
+                language = element.get('language')
+            continue
+
+        if element.tag == 'dependency':
+            dependencies.append(element.get('catalog', u''))
+        elif element.tag == 'name':
+            context = element.text or u''
+        elif element.tag == 'message':
+            translation = element.find('translation')
+            if translation is None:
+                translations, kind = [None], 'unfinished'
+            else:
+                kind = translation.get('type') or 'finished'
+                if element.get('numerus') == 'yes':
+                    translations = [
+                        _text(form) for form in translation
+                        if form.tag == 'numerusform'
+                    ]
+                else:
+                    translations = [_text(translation)]
+
+            source = element.find('source')
+            comment = element.find('comment')
+            messages.append((
+                context,
+                (_text(source) if source is not None else None) or u'',
+                (_text(comment) if comment is not None else None) or u'',
+                translations, kind, element.get('numerus') == 'yes'
+            ))
+            element.clear()
+        elif element.tag == 'context':
+            element.clear()
+
+    return language, dependencies, messages
+
+
+def compile_catalog(filename):
+    """Return (qm data, stats) for a TS file"""
+
+    language, dependencies, messages = parse(filename)
+    rules = numerus_rules(language)
+    forms = numerus_forms(rules)
+    stats = {'finished': 0, 'unfinished': 0, 'untranslated': 0}
+
+    existing = set((context, source, comment)
+                   for context, source, comment, _, _, _ in messages)
+    released = {}
+    for context, source, comment, translations, kind, numerus in messages:
+        if kind in ('obsolete', 'vanished'):
+            continue
+
+        # like lrelease, numerus messages get exactly one translation per
+        # plural form of the language and the rest exactly one
+        count = forms if numerus else 1
+        translations = (translations + [None] * count)[:count]
+
+        if kind == 'unfinished':
+            if not translations or not translations[0]:
+                stats['untranslated'] += 1
+                continue
+            stats['unfinished'] += 1
+        else:
+            stats['finished'] += 1
+
+        key = (context.encode('utf-8'), source.encode('utf-8'),
+               comment.encode('utf-8'))
+
+        # the comment is dropped unless it is needed to tell the message
+        # apart, the first message inserted with a key wins
+        force_comment = (not comment or not context
+                         or (context, source, u'') in existing)
+        if not force_comment:
+            stripped = (key[0], key[1], b'')
+            if stripped not in released:
+                released[stripped] = translations
+                continue
+
+        released.setdefault(key, translations)
+
+    offsets, chunks, position = [], [], 0
+    for key in sorted(released):
+        context, source, comment = key
+        chunk = b''.join(
+            [struct.pack('>B', TAG_TRANSLATION) + _qstring(translation)
+             for translation in released[key]] + [
+                struct.pack('>B', TAG_COMMENT), _qbytearray(comment),
+                struct.pack('>B', TAG_SOURCE_TEXT), _qbytearray(source),
+                struct.pack('>B', TAG_CONTEXT), _qbytearray(context),
+                struct.pack('>B', TAG_END)
+            ]
+        )
+        offsets.append((elf_hash(source + comment), position))
+        chunks.append(chunk)
+        position += len(chunk)
+
+    sections = [MAGIC]
+
+    def section(tag, data):
+        sections.append(struct.pack('>BI', tag, len(data)) + data)
+
+    if language:
+        section(LANGUAGE, language.encode('utf-8'))
+    if dependencies:
+        section(DEPENDENCIES, b''.join(_qstring(d) for d in dependencies))
+    if offsets:
+        section(HASHES, b''.join(
+            struct.pack('>II', value, offset)
+            for value, offset in sorted(offsets)))
+        section(MESSAGES, b''.join(chunks))
+
+    if rules:
+        section(NUMERUS_RULES, rules)
+
+    return b''.join(sections), stats
+
+
+def compile_file(item):
+    """Compile item (ts, qm) atomically, returns (ts, qm, stats, error),
+    used as a pool worker
+    """
+
+    source, output = item
+    try:
+        data, stats = compile_catalog(source)
+        dirname = os.path.dirname(os.path.abspath(output))
+        fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+        with os.fdopen(fd, 'wb') as fhandler:
+            fhandler.write(data)
+        if os.path.exists(output):
+            shutil.copymode(output, tmpname)
+        else:
+            os.chmod(tmpname, 0o644)
+        getattr(os, 'replace', os.rename)(tmpname, output)
+    except (IOError, OSError, ValueError, SyntaxError) as error:
+        return source, output, None, '{0}: {1}'.format(source, error)
+
+    return source, output, stats, None
+
+
+def qm_filename(filename):
+    """Return the QM output of a TS file"""
+
+    return os.path.splitext(filename)[0] + '.qm'
+
+
+def compile_catalogs(catalogs, cache=None, jobs=None, processes=True,
+                     force=False):
+    """Compile the TS catalogs into QM files next to them, in a process
+    pool (or a thread pool if processes is False). Catalogs whose content
+    did not change since the BuildCache recorded them are skipped
+
+    Returns a list of (ts, qm, stats, error), stats is None for the
+    skipped and failed catalogs
+    """
+
+    results, pending, signatures = [], [], {}
+    for source in catalogs:
+        output = qm_filename(source)
+        if cache is not None:
+            signatures[output] = cache.signature(
+                [source], COMPILER, [], COMPILER_VERSION)
+            if not force and cache.is_up_to_date(output, signatures[output]):
+                results.append((source, output, None, None))
+                continue
+
+        pending.append((source, output))
+
+    if len(pending) > 1 and jobs != 1:
+        pool_class = multiprocessing.Pool if processes else ThreadPool
+        pool = pool_class(jobs or multiprocessing.cpu_count())
+        try:
+            compiled = pool.map(compile_file, pending)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        compiled = [compile_file(item) for item in pending]
+
+    for source, output, stats, error in compiled:
+        if cache is not None:
+            if error is None:
+                cache.record(output, signatures[output])
+            else:
+                cache.forget(output)
+
+        results.append((source, output, stats, error))
+
+    return results
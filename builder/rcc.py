@@ -0,0 +1,1021 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Compile Qt resource collections (.qrc) into python modules without
+pyside-rcc
+
+Assets are compressed in parallel and their compressed payloads are kept
+in a ChunkCache keyed by content digest, so a rebuild only compresses the
+assets that changed. The generated module registers the resources in the
+version 1 binary format with PySide or PyQt4, whichever the application
+already imported.
+
+With split the resources of every qrc prefix go to their own module and
+the output becomes a small loader that registers a group the first time
+one of its paths is requested, so an application only pays for the
+resources it uses.
+
+A bundle compiles several qrc files at once: every distinct asset is
+stored once in a shared data module and the module of each qrc file only
+registers its names and tree against that data.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import struct
+import shutil
+import marshal
+import fnmatch
+import posixpath
+import tempfile
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import xml.etree.ElementTree as ElementTree
+
+from .cache import file_digest, ParseError
+
+COMPILER = 'builtin-rcc'
+COMPILER_VERSION = '1'
+
+FORMAT_VERSION = 1
+COMPRESSED = 0x01
+DIRECTORY = 0x02
+
+DEFAULT_LEVEL = -1
+DEFAULT_THRESHOLD = 70
+
+# QLocale::AnyCountry and QLocale::C
+ANY_COUNTRY = 0
+C_LANGUAGE = 1
+
+MODULE_HEADER = '''# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: SublimePySide resource compiler from {0}
+#
+# WARNING! All changes made in this file will be lost!
+
+import sys
+
+if 'PyQt4.QtCore' in sys.modules:
+    from PyQt4 import QtCore
+else:
+    try:
+        from PySide import QtCore
+    except ImportError:
+        from PyQt4 import QtCore
+'''
+
+MODULE_FOOTER = '''
+
+def qInitResources():
+    QtCore.qRegisterResourceData(
+        0x{0:02x}, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(
+        0x{0:02x}, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
+'''
+
+
+SHARED_MODULE = '''# -*- coding: utf-8 -*-
+
+# Shared resource data
+#
+# Created by: SublimePySide resource compiler from {0}
+#
+# WARNING! All changes made in this file will be lost!
+#
+# Every asset of the qrc files above is stored once, their _rc modules
+# register their resources against this data
+
+qt_resource_data = {1}
+'''
+
+SHARED_IMPORT = '''
+qt_resource_data = __import__(
+    '{0}', fromlist=['qt_resource_data']).qt_resource_data
+'''
+
+LOADER_MODULE = '''# -*- coding: utf-8 -*-
+
+# Resource loader
+#
+# Created by: SublimePySide resource compiler from {0}
+#
+# WARNING! All changes made in this file will be lost!
+#
+# Every resource group lives in its own module, a group is registered the
+# first time resource() is called with one of its paths (or a directory
+# that contains them), qInitResources() registers all of them
+
+import sys
+
+GROUPS = {{
+{1}
+}}
+
+PATHS = {{
+{2}
+}}
+
+_loaded = {{}}
+
+
+def load(group):
+    """Register a resource group, returns its module"""
+
+    if group not in _loaded:
+        package = __name__.rpartition('.')[0]
+        name = (package + '.' if package else '') + GROUPS[group]
+        if name in sys.modules:
+            sys.modules[name].qInitResources()
+        else:
+            __import__(name)
+        _loaded[group] = sys.modules[name]
+
+    return _loaded[group]
+
+
+def resource(path):
+    """Register the groups of a :/path (or qrc:/path) and return it"""
+
+    key = path
+    if key.startswith('qrc:'):
+        key = ':/' + key[4:].lstrip('/')
+    for group in PATHS.get(key.rstrip('/') or ':', ()):
+        load(group)
+
+    return path
+
+
+def qInitResources():
+    for group in GROUPS:
+        load(group)
+
+
+def qCleanupResources():
+    for module in _loaded.values():
+        module.qCleanupResources()
+    _loaded.clear()
+'''
+
+_identifier = re.compile(r'[^0-9A-Za-z]+')
+
+
+class ResourceError(Exception):
+    """The qrc file or its command line can not be compiled"""
+
+
+def qt_hash(name):
+    """The hash QResource uses to binary search the children of a node"""
+
+    value = 0
+    for unit in _utf16(name):
+        value = (value << 4) + unit
+        value ^= (value & 0xf0000000) >> 23
+        value &= 0x0fffffff
+
+    return value
+
+
+def _utf16(name):
+    """Return the UTF-16 code units of name like QString stores them"""
+
+    encoded = name.encode('utf-16-be')
+    return struct.unpack('>{0}H'.format(len(encoded) // 2), encoded)
+
+
+def qcompress(data, level=DEFAULT_LEVEL):
+    """qCompress: the big endian uncompressed size and a zlib stream"""
+
+    return struct.pack('>I', len(data)) + zlib.compress(data, level)
+
+
+def _text(path):
+    """Return a file system path as text (python 2 walks give bytes)"""
+
+    if isinstance(path, bytes):
+        return path.decode(sys.getfilesystemencoding() or 'utf-8')
+
+    return path
+
+
+def _clean(path):
+    """QDir::cleanPath of a resource path"""
+
+    path = posixpath.normpath(path.replace('\\', '/'))
+    return '' if path == '.' else path
+
+
+class CompressionPolicy(object):
+    """
+    Per asset compression settings from glob rules matched against the
+    resource path or the file name, the first matching rule wins:
+
+        {"pattern": "*.png", "compress": "none"}  stored raw, never tried
+        {"pattern": "*.svg", "compress": 9}       compressed at level 9
+        {"pattern": "*.ttf", "compress": "auto", "threshold": 20}
+            compressed at the default level when it saves at least 20%
+
+    Assets that match no rule use the default level and threshold, the
+    compress and threshold attributes of a qrc file entry override it
+    """
+
+    def __init__(self, rules=None):
+        super(CompressionPolicy, self).__init__()
+
+        self.rules = []
+        for rule in rules or []:
+            compress = rule.get('compress', 'auto')
+            if compress not in ('auto', 'none') and not (
+                    isinstance(compress, int) and -1 <= compress <= 9):
+                raise ResourceError(
+                    'invalid compress value in rule {0}'.format(rule))
+            self.rules.append(rule)
+
+    def settings(self, alias, source, level, threshold):
+        """Return the (level, threshold) of an asset"""
+
+        for rule in self.rules:
+            pattern = rule.get('pattern', '*')
+            if not (fnmatch.fnmatch(alias, pattern) or fnmatch.fnmatch(
+                    os.path.basename(source), pattern)):
+                continue
+
+            compress = rule.get('compress', 'auto')
+            if compress == 'none':
+                return 0, threshold
+            if compress == 'auto':
+                return level, rule.get('threshold', threshold)
+            return compress, rule.get('threshold', 0)
+
+        return level, threshold
+
+    def to_json(self):
+        """Return the rules as a command line argument"""
+
+        return json.dumps(self.rules, sort_keys=True)
+
+
+def parse_groups(filename, root=None, level=DEFAULT_LEVEL,
+                 threshold=DEFAULT_THRESHOLD, policy=None):
+    """Return the (resource path, source file, level, threshold) entries of
+    a qrc file grouped by qresource prefix, as (prefix, entries) pairs in
+    the order the prefixes first appear. The compression of every asset
+    comes from its compress and threshold attributes, the
+    CompressionPolicy or the defaults. Directories are added recursively
+    """
+
+    if root and not root.startswith('/'):
+        raise ResourceError('root must start with a /')
+
+    base = os.path.dirname(os.path.abspath(filename))
+    try:
+        document = ElementTree.parse(filename).getroot()
+    except (IOError, OSError, ParseError) as error:
+        raise ResourceError('{0}: {1}'.format(filename, error))
+
+    groups, prefixes = [], {}
+    for resource in document.findall('.//qresource'):
+        if resource.get('lang'):
+            raise ResourceError(
+                '{0}: localized resources (lang="{1}") need pyside-rcc'
+                .format(filename, resource.get('lang')))
+
+        prefix = '/' + (resource.get('prefix') or '').strip('/')
+        prefix = prefix if prefix == '/' else prefix + '/'
+        if prefix not in prefixes:
+            prefixes[prefix] = []
+            groups.append((prefix, prefixes[prefix]))
+        entries = prefixes[prefix]
+
+        for node in resource.findall('.//file'):
+            path = (node.text or '').strip()
+            source = os.path.normpath(os.path.join(base, path))
+            alias = _clean(node.get('alias') or path)
+            while alias.startswith('../'):
+                alias = alias[3:]
+
+            alias = _clean(root or '') + prefix + alias
+            files = [(alias, source)]
+            if os.path.isdir(source):
+                files = []
+                for dirname, dirs, names in os.walk(source):
+                    dirs.sort()
+                    for name in sorted(names):
+                        child = os.path.join(dirname, name)
+                        relative = _text(os.path.relpath(child, source))
+                        files.append(
+                            (alias + '/' + relative.replace(os.sep, '/'),
+                             child))
+
+            for file_alias, file_source in files:
+                file_level, file_threshold = level, threshold
+                if policy is not None and level != 0:
+                    file_level, file_threshold = policy.settings(
+                        file_alias, file_source, level, threshold)
+                if level != 0 and node.get('compress'):
+                    file_level = int(node.get('compress'))
+                if node.get('threshold'):
+                    file_threshold = int(node.get('threshold'))
+
+                entries.append(
+                    (file_alias, file_source, file_level, file_threshold))
+
+    return groups
+
+
+def parse_qrc(filename, root=None, level=DEFAULT_LEVEL,
+              threshold=DEFAULT_THRESHOLD, policy=None):
+    """Return the entries of every group of the qrc file (see
+    parse_groups)
+    """
+
+    groups = parse_groups(filename, root, level, threshold, policy)
+    return [entry for _, entries in groups for entry in entries]
+
+
+class ChunkCache(object):
+    """
+    Compressed asset payloads keyed by content digest and compression
+    settings, one file per entry so pool workers never contend. The least
+    recently used entries are pruned when the cache grows over max_size
+    """
+
+    def __init__(self, directory, max_size=64 << 20):
+        super(ChunkCache, self).__init__()
+
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(digest, level, threshold):
+        """Return the cache key of an asset compressed with the settings"""
+
+        return '{0}-{1}-{2}'.format(digest, level, threshold)
+
+    def get(self, key):
+        """Return the cached (flags, payload), payload is None when the
+        asset is stored raw, None on a cache miss
+        """
+
+        filename = os.path.join(self.directory, key)
+        try:
+            with open(filename, 'rb') as fhandler:
+                data = fhandler.read()
+            os.utime(filename, None)
+        except (IOError, OSError):
+            data = b''
+
+        if not data:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        flags = bytearray(data[:1])[0]
+        return flags, data[1:] if flags & COMPRESSED else None
+
+    def put(self, key, flags, payload):
+        """Store the payload of a compressed asset (or the decision to
+        store it raw)
+        """
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        with os.fdopen(fd, 'wb') as fhandler:
+            fhandler.write(struct.pack('>B', flags))
+            if flags & COMPRESSED:
+                fhandler.write(payload)
+
+        getattr(os, 'replace', os.rename)(
+            tmpname, os.path.join(self.directory, key))
+
+    def prune(self):
+        """Remove the least recently used entries over max_size"""
+
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        entries = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_size:
+                break
+
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+def _compress(item):
+    """Pool worker: returns (key, flags, payload, seconds, error), the
+    payload is the raw data when compressing it is not worth it
+    """
+
+    key, source, level, threshold = item
+    start = time.time()
+    try:
+        with open(source, 'rb') as fhandler:
+            data = fhandler.read()
+    except (IOError, OSError) as error:
+        return key, 0, None, 0.0, '{0}: {1}'.format(source, error)
+
+    if level != 0 and data:
+        compressed = qcompress(data, level)
+        ratio = int(100.0 * (len(data) - len(compressed)) / len(data))
+        if ratio >= threshold:
+            return key, COMPRESSED, compressed, time.time() - start, None
+
+    return key, 0, data, time.time() - start, None
+
+
+def _original_size(flags, payload):
+    """Return the uncompressed size of a stored payload"""
+
+    if flags & COMPRESSED:
+        return struct.unpack('>I', payload[:4])[0]
+
+    return len(payload)
+
+
+def compress_assets(entries, chunks=None, jobs=None, processes=True,
+                    digest=file_digest):
+    """Return ({key: (flags, payload)}, {alias: key}, stats) for the qrc
+    entries, every distinct asset is compressed once and only if it is
+    missing in the chunk cache
+
+    stats['assets'] maps every key to its (original size, stored size,
+    compression seconds, cached)
+    """
+
+    payloads, keys, pending, raw = {}, {}, {}, {}
+    stats = {'files': len(entries), 'compressed': 0, 'cached': 0,
+             'seconds': 0.0, 'assets': {}}
+    for alias, source, level, threshold in entries:
+        if alias in keys:
+            continue
+
+        try:
+            key = ChunkCache.key(digest(source), level, threshold)
+        except (IOError, OSError) as error:
+            raise ResourceError('{0}: {1}'.format(source, error))
+
+        keys[alias] = key
+        if key in payloads or key in pending or key in raw:
+            continue
+
+        cached = chunks.get(key) if chunks is not None else None
+        if cached is None:
+            pending[key] = (key, source, level, threshold)
+        elif cached[1] is None:
+            raw[key] = source
+        else:
+            payloads[key] = cached
+            stats['cached'] += 1
+            stats['assets'][key] = (
+                _original_size(*cached), len(cached[1]), 0.0, True)
+
+    items = list(pending.values()) + [
+        (key, source, 0, 0) for key, source in raw.items()]
+    if len(pending) > 1 and jobs != 1:
+        pool_class = multiprocessing.Pool if processes else ThreadPool
+        pool = pool_class(min(jobs or multiprocessing.cpu_count(),
+                              len(pending)))
+        try:
+            results = pool.map(_compress, items)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_compress(item) for item in items]
+
+    for key, flags, payload, seconds, error in results:
+        if error is not None:
+            raise ResourceError(error)
+
+        payloads[key] = (flags, payload)
+        if key in raw:
+            stats['cached'] += 1
+            stats['assets'][key] = (len(payload), len(payload), 0.0, True)
+            continue
+
+        stats['seconds'] += seconds
+        stats['assets'][key] = (
+            _original_size(flags, payload), len(payload), seconds, False)
+        if chunks is not None:
+            chunks.put(key, flags, payload)
+
+    stats['compressed'] = sum(
+        1 for key in set(keys.values()) if payloads[key][0] & COMPRESSED)
+
+    return payloads, keys, stats
+
+
+class _Node(object):
+    """A directory or file of the resource tree"""
+
+    def __init__(self, name, key=None):
+        self.name = name
+        self.key = key
+        self.children = {}
+        self.child_offset = 0
+        self.name_offset = 0
+
+    @property
+    def is_dir(self):
+        return self.key is None
+
+    def sorted_children(self):
+        return sorted(self.children.values(),
+                      key=lambda node: (qt_hash(node.name), node.name))
+
+
+def resource_tables(keys, payloads, data_offsets=None):
+    """Return the (struct, names, data) tables of the resources given by
+    {alias: key} and {key: (flags, payload)}, identical payloads are
+    stored once
+
+    When data_offsets ({key: offset}) is given the payloads are expected
+    to live in an already built data table and data is empty
+    """
+
+    root = _Node(u'')
+    for alias in sorted(keys):
+        parts = [part for part in alias.split('/') if part]
+        node = root
+        for part in parts[:-1]:
+            child = node.children.get(part)
+            if child is None or not child.is_dir:
+                child = node.children[part] = _Node(part)
+            node = child
+        node.children.setdefault(parts[-1], _Node(parts[-1], keys[alias]))
+
+    # children are contiguous and sorted by hash, QResource binary
+    # searches them; offsets are assigned in the order they are written
+    offset, pending = 1, [root]
+    while pending:
+        node = pending.pop()
+        node.child_offset = offset
+        for child in node.sorted_children():
+            offset += 1
+            if child.is_dir:
+                pending.append(child)
+
+    names, name_offsets = [], {}
+    name_size = [0]
+
+    def name_offset(name):
+        if name not in name_offsets:
+            name_offsets[name] = name_size[0]
+            encoded = name.encode('utf-16-be')
+            names.append(
+                struct.pack('>HI', len(encoded) // 2, qt_hash(name)))
+            names.append(encoded)
+            name_size[0] += 6 + len(encoded)
+        return name_offsets[name]
+
+    data, own_offsets = [], {}
+    data_size = [0]
+
+    def data_offset(key):
+        if data_offsets is not None:
+            return data_offsets[key]
+        if key not in own_offsets:
+            payload = payloads[key][1]
+            own_offsets[key] = data_size[0]
+            data.append(struct.pack('>I', len(payload)))
+            data.append(payload)
+            data_size[0] += 4 + len(payload)
+        return own_offsets[key]
+
+    def node_info(node):
+        if node.is_dir:
+            return struct.pack(
+                '>IHII', node.name_offset, DIRECTORY, len(node.children),
+                node.child_offset)
+
+        return struct.pack(
+            '>IHHHI', node.name_offset, payloads[node.key][0], ANY_COUNTRY,
+            C_LANGUAGE, data_offset(node.key))
+
+    tree, pending = [node_info(root)], [root]
+    while pending:
+        node = pending.pop()
+        for child in node.sorted_children():
+            child.name_offset = name_offset(child.name)
+            tree.append(node_info(child))
+            if child.is_dir:
+                pending.append(child)
+
+    return b''.join(tree), b''.join(names), b''.join(data)
+
+
+def bytes_literal(data, width=64):
+    """Return the python source of a bytes literal split in lines of
+    width input bytes, printable ASCII is kept as is to keep the module
+    small and fast to compile
+    """
+
+    lines = []
+    for start in range(0, len(data), width):
+        chunk = data[start:start + width].decode('latin-1')
+        escaped = chunk.encode('unicode_escape').replace(b'"', b'\\"')
+        lines.append(escaped.decode('ascii'))
+
+    return 'b"\\\n{0}"'.format('\\\n'.join(lines) + ('\\\n' if lines else ''))
+
+
+def python_module(source, tables, version=FORMAT_VERSION, shared=None):
+    """Return the python module that registers the (struct, names, data)
+    resource tables, the data comes from the shared module when given
+    """
+
+    tree, names, data = tables
+    if shared is None:
+        data = '\nqt_resource_data = {0}\n'.format(bytes_literal(data))
+    else:
+        data = SHARED_IMPORT.format(shared)
+
+    return ''.join([
+        MODULE_HEADER.format(os.path.basename(source)),
+        data,
+        '\nqt_resource_name = {0}\n'.format(bytes_literal(names)),
+        '\nqt_resource_struct = {0}\n'.format(bytes_literal(tree)),
+        MODULE_FOOTER.format(version)
+    ])
+
+
+def group_modules(output, prefixes):
+    """Return {prefix: (group, module filename)} of a split build, the
+    group modules are written next to output as <base>_<group>_rc.py
+    """
+
+    base = output[:-len('.py')] if output.endswith('.py') else output
+    if base.endswith('_rc'):
+        base = base[:-len('_rc')]
+
+    modules, taken = {}, set()
+    for prefix in prefixes:
+        name = _identifier.sub('_', prefix).strip('_') or 'root'
+        group, index = name, 1
+        while group in taken:
+            index += 1
+            group = '{0}_{1}'.format(name, index)
+        taken.add(group)
+        modules[prefix] = (group, '{0}_{1}_rc.py'.format(base, group))
+
+    return modules
+
+
+def loader_module(source, groups):
+    """Return the loader of a split build, groups are (group name,
+    (module filename, aliases)) pairs
+    """
+
+    paths = {}
+    for group, (module, aliases) in groups:
+        for alias in aliases:
+            parts = alias.split('/')
+            for index in range(1, len(parts) + 1):
+                path = ':' + '/'.join(parts[:index])
+                paths.setdefault(path, [])
+                if group not in paths[path]:
+                    paths[path].append(group)
+
+    return LOADER_MODULE.format(
+        os.path.basename(source),
+        '\n'.join(
+            "    '{0}': '{1}',".format(
+                group, os.path.basename(module)[:-len('.py')])
+            for group, (module, aliases) in groups),
+        '\n'.join(
+            '    {0}: ({1},),'.format(_text_literal(path), ', '.join(
+                "'{0}'".format(group) for group in groups_of))
+            for path, groups_of in sorted(paths.items()))
+    )
+
+
+def _text_literal(text):
+    """Return an ASCII u'' literal of text, the same in python 2 and 3"""
+
+    escaped = text.encode('unicode_escape').decode('ascii')
+    return u"u'{0}'".format(escaped.replace("'", "\\'"))
+
+
+def write_module(output, text):
+    """Write a generated module atomically"""
+
+    dirname = os.path.dirname(os.path.abspath(output))
+    fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+    with os.fdopen(fd, 'wb') as fhandler:
+        fhandler.write(text.encode('utf-8'))
+
+    if os.path.exists(output):
+        shutil.copymode(output, tmpname)
+    else:
+        os.chmod(tmpname, 0o644)
+    getattr(os, 'replace', os.rename)(tmpname, output)
+
+
+def import_cost(text, filename):
+    """Return the (cold, warm) seconds this interpreter needs to load a
+    generated module: compiling its source (first import, no .pyc) and
+    unmarshaling its code (later imports), the resource data itself is
+    registered without a copy and only decompressed when it is read
+    """
+
+    start = time.time()
+    code = compile(text, filename, 'exec')
+    cold = time.time() - start
+
+    data = marshal.dumps(code)
+    start = time.time()
+    marshal.loads(data)
+
+    return cold, time.time() - start
+
+
+def report(stats):
+    """Return the per asset report lines of compile_qrc stats"""
+
+    keys = stats['keys']
+    owners = stats.get('owners', {})
+    lines = ['{0:>10} {1:>10} {2:>8}  {3}'.format(
+        'original', 'stored', 'time', 'asset')]
+    seen = set()
+    for alias in sorted(keys, key=lambda alias: (
+            -stats['assets'][keys[alias]][1], alias)):
+        original, stored, seconds, cached = stats['assets'][keys[alias]]
+        note = ' (cached)' if cached else ''
+        copy = (owners.get(alias), keys[alias])
+        if copy in seen:
+            stored, note = 0, ' (duplicate)'
+        seen.add(copy)
+
+        lines.append(u'{0:>10} {1:>10} {2:>7.3f}s  {3}{4}'.format(
+            original, stored, seconds, alias, note))
+
+    lines.append('{0:>10} {1:>10} {2:>7.3f}s  total'.format(
+        sum(stats['assets'][key][0] for _, key in seen),
+        stats['size'], stats['seconds']))
+
+    if 'module' in stats:
+        size, cold, warm = stats['module']
+        lines.append(
+            'module {0} bytes, import {1:.3f}s without .pyc, {2:.3f}s '
+            'with it, {3} bytes of resource data in memory'.format(
+                size, cold, warm, 0 if 'groups' in stats else stats['size']))
+
+    if 'saved' in stats:
+        lines.append(
+            '{0} qrc files share {1} bytes of resource data, {2} bytes '
+            'saved'.format(len(stats['outputs']), stats['size'],
+                           stats['saved']))
+
+    for group, (module, size) in stats.get('groups', ()):
+        lines.append(
+            u'group {0}: {1} bytes in {2}, registered on first access'
+            .format(group, size, os.path.basename(module)))
+
+    return lines
+
+
+def write_groups(filename, output, groups, keys, payloads):
+    """Write the module of every group of a split build, returns the
+    loader text and the (group, (module filename, data size)) pairs
+    """
+
+    modules = group_modules(output, [prefix for prefix, _ in groups])
+    loaded, written, seen = [], [], set()
+    for prefix, entries in groups:
+        group, module = modules[prefix]
+        group_keys = dict(
+            (alias, keys[alias]) for alias, _, _, _ in entries
+            if alias not in seen)
+        if not group_keys:
+            continue
+
+        seen.update(group_keys)
+        tables = resource_tables(group_keys, payloads)
+        write_module(module, python_module(filename, tables))
+        loaded.append((group, (module, sorted(group_keys))))
+        written.append((group, (module, len(tables[2]))))
+
+    return loader_module(filename, loaded), written
+
+
+def compile_qrc(filename, output, level=DEFAULT_LEVEL,
+                threshold=DEFAULT_THRESHOLD, root=None, chunks=None,
+                jobs=None, processes=True, policy=None, measure=False,
+                split=False):
+    """Compile a qrc file into the python module output (the loader of
+    one module per qrc prefix with split), returns the compression stats,
+    with measure the import cost of the module too. With split
+    stats['owners'] maps every alias to the prefix of the module storing it
+    """
+
+    groups = parse_groups(filename, root, level, threshold, policy)
+    entries = [entry for _, group in groups for entry in group]
+    payloads, keys, stats = compress_assets(entries, chunks, jobs, processes)
+
+    if split:
+        text, stats['groups'] = write_groups(
+            filename, output, groups, keys, payloads)
+        stats['size'] = sum(size for _, (_, size) in stats['groups'])
+        stats['owners'] = dict(
+            (alias, prefix) for prefix, group in groups
+            for alias, _, _, _ in group)
+    else:
+        tables = resource_tables(keys, payloads)
+        text = python_module(filename, tables)
+        stats['size'] = len(tables[2])
+
+    write_module(output, text)
+
+    if chunks is not None:
+        chunks.prune()
+
+    stats['keys'] = keys
+    if measure:
+        stats['module'] = (len(text),) + import_cost(text, output)
+
+    return stats
+
+
+def compile_bundle(filenames, shared, level=DEFAULT_LEVEL,
+                   threshold=DEFAULT_THRESHOLD, root=None, chunks=None,
+                   jobs=None, processes=True, policy=None, measure=False,
+                   module=None):
+    """Compile several qrc files into <qrc>_rc.py modules that register
+    their resources against the data of the shared module, imported as
+    module (the shared file name by default). Every distinct asset is
+    stored once, stats['saved'] is what separate modules would have
+    added on top of it
+    """
+
+    if module is None:
+        module = os.path.splitext(os.path.basename(shared))[0]
+
+    entries = []
+    for index, filename in enumerate(filenames):
+        for alias, source, entry_level, entry_threshold in parse_qrc(
+                filename, root, level, threshold, policy):
+            entries.append(
+                ((index, alias), source, entry_level, entry_threshold))
+
+    payloads, keys, stats = compress_assets(entries, chunks, jobs, processes)
+
+    data, offsets, size = [], {}, 0
+    for key in sorted(set(keys.values())):
+        payload = payloads[key][1]
+        offsets[key] = size
+        data += [struct.pack('>I', len(payload)), payload]
+        size += 4 + len(payload)
+    data = b''.join(data)
+
+    separate, stats['outputs'] = 0, []
+    for index, filename in enumerate(filenames):
+        own = dict(
+            (alias, key) for (owner, alias), key in keys.items()
+            if owner == index)
+        separate += sum(4 + len(payloads[key][1]) for key in set(own.values()))
+
+        output = os.path.splitext(filename)[0] + '_rc.py'
+        tables = resource_tables(own, payloads, offsets)
+        write_module(output, python_module(filename, tables, shared=module))
+        stats['outputs'].append(output)
+
+    text = SHARED_MODULE.format(
+        ', '.join(os.path.basename(filename) for filename in filenames),
+        bytes_literal(data))
+    write_module(shared, text)
+
+    if chunks is not None:
+        chunks.prune()
+
+    stats['size'] = len(data)
+    stats['saved'] = separate - len(data)
+    stats['keys'] = dict(
+        (u'{0}:{1}'.format(os.path.basename(filenames[index]), alias), key)
+        for (index, alias), key in keys.items())
+    if measure:
+        stats['module'] = (len(text),) + import_cost(text, shared)
+
+    return stats
+
+
+def parse_arguments(args):
+    """Parse pyside-rcc arguments (see tools.rcc_arguments) plus the
+    built-in -policy JSON, -report, -split and -shared options, returns
+    (qrc files, output, compile_qrc or compile_bundle keyword arguments)
+
+    With -shared every qrc file is compiled into its <qrc>_rc.py module
+    and output is the shared data module, -shared-name sets its import
+    name
+    """
+
+    options = {'level': DEFAULT_LEVEL, 'threshold': DEFAULT_THRESHOLD,
+               'root': None, 'policy': None, 'measure': False,
+               'split': False}
+    inputs, output, shared, module, args = [], None, False, None, list(args)
+    flags = {'-o': 'output', '-compress': 'level',
+             '-threshold': 'threshold', '-root': 'root', '-policy': 'policy',
+             '-shared-name': 'module'}
+    while args:
+        arg = args.pop(0)
+        if arg in flags:
+            if not args:
+                raise ResourceError('{0} needs a value'.format(arg))
+            value = args.pop(0)
+            if arg == '-o':
+                output = value
+            elif arg == '-root':
+                options['root'] = value
+            elif arg == '-policy':
+                options['policy'] = CompressionPolicy(json.loads(value))
+            elif arg == '-shared-name':
+                module = value
+            else:
+                options[flags[arg]] = int(value)
+        elif arg == '-no-compress':
+            options['level'] = 0
+        elif arg == '-report':
+            options['measure'] = True
+        elif arg == '-split':
+            options['split'] = True
+        elif arg == '-shared':
+            shared = True
+        elif arg.startswith('-'):
+            raise ResourceError('unknown option {0}'.format(arg))
+        else:
+            inputs.append(arg)
+
+    if shared:
+        if not inputs or output is None:
+            raise ResourceError(
+                'expected -o shared module and one or more qrc files')
+        if options.pop('split'):
+            raise ResourceError('-split can not be used with -shared')
+        options['module'] = module
+    elif len(inputs) != 1 or output is None:
+        raise ResourceError('expected -o output and one qrc file')
+
+    return inputs, output, options
+
+
+def run(args, emit=None, chunks=None, jobs=None, processes=False):
+    """Compile with pyside-rcc compatible arguments and report to emit,
+    returns the exit status (usable as a builder.jobs.FunctionJob)
+    """
+
+    emit = emit or sys.stdout.write
+    try:
+        filenames, output, options = parse_arguments(args)
+        if 'module' in options:
+            stats = compile_bundle(filenames, output, chunks=chunks,
+                                   jobs=jobs, processes=processes, **options)
+        else:
+            stats = compile_qrc(filenames[0], output, chunks=chunks,
+                                jobs=jobs, processes=processes, **options)
+    except (ResourceError, ValueError, IOError, OSError) as error:
+        emit('{0}\n'.format(error))
+        return 1
+
+    emit('{0}: {1} files, {2} compressed, {3} from cache, {4} bytes\n'.format(
+        os.path.basename(output), stats['files'], stats['compressed'],
+        stats['cached'], stats['size']))
+
+    if options['measure']:
+        for line in report(stats):
+            emit('    {0}\n'.format(line))
+    elif 'saved' in stats:
+        emit('    {0} bytes saved by sharing assets across {1} qrc files\n'
+             .format(stats['saved'], len(stats['outputs'])))
+
+    return 0
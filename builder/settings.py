@@ -0,0 +1,150 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Load SublimePySide settings files outside of Sublime Text
+
+Every setting is checked against SCHEMA, values of the wrong type are
+replaced by their defaults so callers never have to guard them
+"""
+
+import os
+import re
+import json
+
+DEFAULT_SETTINGS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'SublimePySide.sublime-settings'
+)
+
+STRING = (type(''), type(u''))
+
+# (type, default) of the keys of the dictionary settings, keys without a
+# default are left out when they are missing or invalid
+TOOLS_SCHEMA = {
+    'uic': (STRING, None),
+    'lupdate': (STRING, None),
+    'rcc': (STRING, None)
+}
+
+QT_TOOLS_SCHEMA = {
+    'linguist': (STRING, None),
+    'designer': (STRING, None),
+    'qdbusviewer': (STRING, None)
+}
+
+RCC_OPTIONS_SCHEMA = {
+    'output_file': (STRING, 'same_rc'),
+    'compression_level': (int, -1),
+    'no_compress': (bool, False),
+    'root_path': (STRING, ''),
+    'compression_policy': (list, []),
+    'report': (bool, False),
+    'split_modules': (bool, False),
+    'shared_module': (STRING, '')
+}
+
+# (type, default, schema of the keys) of every setting
+SCHEMA = {
+    'sublimepyside_tools_map': (dict, {}, TOOLS_SCHEMA),
+    'sublimepyside_qt_tools_map': (dict, {}, QT_TOOLS_SCHEMA),
+    'sublimepyside_rcc_options': (dict, {}, RCC_OPTIONS_SCHEMA),
+    'sublimepyside_package': (STRING, 'PySide', None),
+    'sublimepyside_data_dir': (STRING, 'data', None),
+    'sublimepyside_library': (STRING, 'PySide', None),
+    'sublimepyside_library_ask': (bool, True, None),
+    'sublimepyside_template_dirs': (list, [], None),
+    'sublimepyside_project_generation': (dict, {}, None),
+    'sublimepyside_conversion_cache': (dict, {}, None),
+    'sublimepyside_jobs': (dict, {}, None),
+    'sublimepyside_lupdate_engine': (STRING, 'pyside-lupdate', None),
+    'sublimepyside_rcc_engine': (STRING, 'pyside-rcc', None),
+    'sublimepyside_ignore_patterns': (list, [], None),
+    'sublimepyside_daemon': (dict, {}, None),
+    'sublimepyside_watch_mode': (dict, {}, None),
+    'sublimepyside_startup_log': (bool, True, None),
+    'osx_st2_path': (STRING, '', None)
+}
+
+
+def _is_a(value, typeof):
+    """isinstance that does not take booleans for integers"""
+
+    if isinstance(value, bool) and typeof is not bool:
+        return False
+
+    return isinstance(value, typeof)
+
+
+def _copy(value):
+    """Return a copy of list and dictionary defaults"""
+
+    return type(value)(value) if isinstance(value, (list, dict)) else value
+
+
+def validate(name, value):
+    """Return the value of a setting checked against SCHEMA, the default
+    when it is missing (None) or has the wrong type. The keys of the
+    dictionary settings with a schema are checked the same way, unknown
+    settings and keys are returned as they are
+    """
+
+    if name not in SCHEMA:
+        return value
+
+    typeof, default, schema = SCHEMA[name]
+    if value is None or not _is_a(value, typeof):
+        value = default
+
+    if schema is None:
+        return _copy(value)
+
+    value = dict(value)
+    for key, (typeof, default) in schema.items():
+        if key in value and value[key] is not None and _is_a(
+                value[key], typeof):
+            continue
+
+        if default is None:
+            value.pop(key, None)
+        else:
+            value[key] = _copy(default)
+
+    return value
+
+
+_comments = re.compile(r'("(?:\\.|[^"\\])*")|/\*.*?\*/|//[^\n]*', re.S)
+_trailing_commas = re.compile(r'("(?:\\.|[^"\\])*")|,(\s*[}\]])')
+
+
+def decode_settings(text):
+    """Decode a sublime-settings document (JSON with comments and
+    trailing commas)
+    """
+
+    text = _comments.sub(lambda match: match.group(1) or '', text)
+    text = _trailing_commas.sub(
+        lambda match: match.group(1) or match.group(2), text)
+
+    return json.loads(text)
+
+
+def load_settings(*filenames):
+    """Load the package default settings overlaid with the given files,
+    missing files are ignored
+    """
+
+    settings = {}
+    for filename in (DEFAULT_SETTINGS,) + filenames:
+        if filename is None or not os.path.exists(filename):
+            continue
+
+        with open(filename, 'r') as fhandler:
+            settings.update(decode_settings(fhandler.read()))
+
+    for name in SCHEMA:
+        settings[name] = validate(name, settings.get(name))
+
+    return settings
@@ -0,0 +1,123 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Command line arguments for the PySide tools
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+
+def uic_arguments(filename, output):
+    """Return the pyside-uic arguments to compile filename into output
+    """
+
+    return ['-o', output, filename]
+
+
+def rcc_arguments(filename, output, rcc_options):
+    """Return the pyside-rcc arguments to compile filename into output
+    honoring the sublimepyside_rcc_options setting
+    """
+
+    options = ['-o', output]
+
+    root_path = rcc_options.get('root_path', '')
+    no_compress = rcc_options.get('no_compress', False)
+    compression_level = rcc_options.get('compression_level', -1)
+
+    if compression_level != -1 and not no_compress:
+        if compression_level >= 0 and compression_level <= 9:
+            options += ['-compress', str(compression_level)]
+
+    if no_compress:
+        options.append('-no-compress')
+
+    if root_path and not isinstance(root_path, bool):
+        options += ['-root', root_path]
+
+    options.append(filename)
+    return options
+
+
+def builtin_rcc_arguments(filename, output, rcc_options):
+    """Return the builder.rcc arguments, rcc_arguments plus the
+    compression_policy, report and split_modules built-in options
+    """
+
+    options = rcc_arguments(filename, output, rcc_options)
+    if rcc_options.get('compression_policy'):
+        options += [
+            '-policy', json.dumps(rcc_options['compression_policy'],
+                                  sort_keys=True)
+        ]
+
+    if rcc_options.get('report', False):
+        options.append('-report')
+
+    if rcc_options.get('split_modules', False):
+        options.append('-split')
+
+    return options
+
+
+def shared_rcc_arguments(filenames, shared, rcc_options):
+    """Return the builder.rcc arguments that compile every qrc file of
+    filenames against the shared data module (split_modules is ignored)
+    """
+
+    options = builtin_rcc_arguments(filenames[0], shared, rcc_options)
+    if '-split' in options:
+        options.remove('-split')
+
+    return options + ['-shared'] + list(filenames[1:])
+
+
+def lupdate_project(sources, catalog):
+    """Return a qmake project that lists sources and targets the catalog
+    TS file, pyside-lupdate reads it instead of a command line that does
+    not scale to thousands of files
+    """
+
+    def quote(filename):
+        filename = filename.replace('\\', '/')
+        return '"{0}"'.format(filename) if ' ' in filename else filename
+
+    return 'SOURCES = \\\n    {0}\n\nTRANSLATIONS = {1}\n'.format(
+        ' \\\n    '.join(quote(filename) for filename in sources),
+        quote(catalog)
+    )
+
+
+def write_lupdate_project(sources, catalog):
+    """Write the lupdate_project of sources into a temporary file named
+    after the catalog (so build signatures stay stable) and return the
+    pyside-lupdate arguments that use it
+    """
+
+    digest = hashlib.md5(os.path.abspath(catalog).encode('utf8'))
+    filename = os.path.join(
+        tempfile.gettempdir(),
+        'sublimepyside-{0}.pro'.format(digest.hexdigest())
+    )
+
+    with open(filename, 'w') as fhandler:
+        fhandler.write(lupdate_project(sources, catalog))
+
+    return [filename]
+
+
+def remove_lupdate_project(arguments):
+    """Remove the temporary project of write_lupdate_project arguments
+    once pyside-lupdate is done with it
+    """
+
+    try:
+        os.remove(arguments[0])
+    except OSError:
+        pass
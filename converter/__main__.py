@@ -0,0 +1,14 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Command line entry point: python -m converter --to PySide path [path ...]
+"""
+
+import sys
+
+from .batch import main
+
+sys.exit(main())
@@ -7,6 +7,8 @@
 Base class for converters
 """
 
+from .engine import get_engine
+
 sip_api_2 = '''# PyQT4 API 2 SetUp. Comment or remove if you are using Python 3
 import sip
 
@@ -29,18 +31,66 @@ class BaseConverter(object):
         super(BaseConverter, self).__init__()
         self.view = view
         self.pattern = pattern
+        self.engine = get_engine(pattern)
 
     def convert(self, st_edit):
         """Try to convert the file"""
 
-        edit = st_edit if st_edit is not None else self.view.begin_edit()
+        import sublime
 
-        for key in self.pattern:
-            matches = self.view.find_all(key)
-            matches.reverse()
+        edit = st_edit if st_edit is not None else self.view.begin_edit()
 
-            for item in matches:
-                self.view.replace(edit, item, self.pattern[key])
+        for begin, end, replacement in self.engine.regions(
+                self.view.substr(sublime.Region(0, self.view.size()))):
+            self.view.replace(edit, sublime.Region(begin, end), replacement)
 
         if st_edit is None:
             self.view.end_edit(edit)
+
+
+def remove_api_imports(text):
+    """Remove the PyQt4 API 2 setup block from an already converted text
+
+    Text counterpart of PyQt42PySideWorker.remove_api_imports
+    """
+
+    line_one = text.find('# PyQT4 API 2 SetUp.')
+    if line_one == -1:
+        line_one = text.find('from sip import setapi')
+
+    line_two = text.find('from PySide')
+    if line_two == -1:
+        line_two = text.find('import PySide')
+
+    if line_one == -1 or line_two == -1:
+        return text
+
+    line_two = text.rfind('\n', 0, line_two) + 1
+    if line_two <= line_one:
+        return text
+
+    return text[:line_one] + text[line_two:]
+
+
+def insert_api_imports(text):
+    """Insert the PyQt4 API 2 setup block before the first PyQt4 import
+
+    Text counterpart of PySide2PyQt4Worker.insert_api_imports
+    """
+
+    pyqt4import = text.find('from PyQt4')
+    if pyqt4import == -1:
+        pyqt4import = text.find('import PyQt4')
+        if pyqt4import == -1:
+            return text
+
+    insert_import_str = '\n' + sip_api_2 + '\n'
+    line_begin = text.rfind('\n', 0, pyqt4import) + 1
+    line_end = text.find('\n', pyqt4import)
+    if line_end == -1:
+        line_end = len(text)
+
+    if insert_import_str.rstrip() in text[:line_end]:
+        return text
+
+    return text[:line_begin] + insert_import_str + text[line_begin:]
@@ -0,0 +1,231 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Headless PySide <--> PyQt4 conversion of whole source trees
+"""
+
+import os
+import sys
+import time
+import shutil
+import fnmatch
+import tempfile
+import multiprocessing
+
+from . import pyqt2pyside, pyside2pyqt
+from .base import remove_api_imports, insert_api_imports
+from .diff import unified_diff
+from .engine import get_engine, apply_regions, diff_region
+
+TARGETS = {
+    'PySide': (pyqt2pyside.PATTERN, remove_api_imports),
+    'PyQt4': (pyside2pyqt.PATTERN, insert_api_imports)
+}
+
+IGNORE_DIRS = ['.git', '.hg', '.svn', '.bzr', '__pycache__', '.tox']
+
+
+def convert_text(text, target):
+    """Convert the given text to the target library syntax ('PySide' or
+    'PyQt4') including the PyQt4 API 2 setup block handling
+    """
+
+    pattern, api_imports = TARGETS[target]
+    return api_imports(get_engine(pattern).rewrite(text))
+
+
+def conversion_diff(text, target, filename='', converted=None):
+    """Return the unified diff of converting text to the target library
+    """
+
+    if converted is None:
+        converted = convert_text(text, target)
+
+    return ''.join(unified_diff(
+        text.splitlines(True), converted.splitlines(True),
+        filename, filename))
+
+
+def conversion_edits(text, target, checkpoint=None):
+    """Return the list of (begin, end, replacement) edits that convert the
+    given text to the target library syntax
+
+    Edits must be applied in order, each one is relative to the text as
+    left by the previous one. See RewriteEngine.regions for checkpoint
+    """
+
+    pattern, api_imports = TARGETS[target]
+
+    edits = get_engine(pattern).regions(text, checkpoint)
+    text = apply_regions(text, edits)
+
+    change = diff_region(text, api_imports(text))
+    if change is not None:
+        edits.append(change)
+
+    return edits
+
+
+def atomic_write(filename, data):
+    """Write data (bytes) to filename so readers never see a partial file
+    """
+
+    dirname, basename = os.path.split(os.path.abspath(filename))
+    fd, tmpname = tempfile.mkstemp(
+        prefix='.{0}.'.format(basename), suffix='.tmp', dir=dirname)
+    try:
+        with os.fdopen(fd, 'wb') as fhandler:
+            fhandler.write(data)
+            fhandler.flush()
+            os.fsync(fhandler.fileno())
+
+        shutil.copymode(filename, tmpname)
+        getattr(os, 'replace', os.rename)(tmpname, filename)
+    except Exception:
+        os.unlink(tmpname)
+        raise
+
+
+def convert_file(filename, target, write=True, diff=False):
+    """Convert a single file, returns a (filename, size, changed, error,
+    diff) tuple so it can be used from a process pool
+    """
+
+    patch = ''
+    try:
+        with open(filename, 'rb') as fhandler:
+            data = fhandler.read()
+
+        try:
+            encoding, text = 'utf-8', data.decode('utf-8')
+        except UnicodeDecodeError:
+            encoding, text = 'latin-1', data.decode('latin-1')
+
+        converted = convert_text(text, target)
+        changed = converted != text
+        if changed and diff:
+            patch = conversion_diff(text, target, filename, converted)
+
+        if changed and write:
+            atomic_write(filename, converted.encode(encoding))
+    except (IOError, OSError) as error:
+        return filename, 0, False, str(error), patch
+
+    return filename, len(data), changed, None, patch
+
+
+def _convert_file(args):
+    """Pool helper, unpacks the arguments for convert_file
+    """
+
+    return convert_file(*args)
+
+
+def walk_sources(paths, exclude=None):
+    """Generator of python sources under the given files or directories
+    """
+
+    exclude = list(exclude or [])
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(
+                d for d in dirs if d not in IGNORE_DIRS and not any(
+                    fnmatch.fnmatch(d, pattern) for pattern in exclude))
+
+            for filename in sorted(files):
+                if not filename.endswith('.py'):
+                    continue
+
+                if any(fnmatch.fnmatch(filename, p) for p in exclude):
+                    continue
+
+                yield os.path.join(root, filename)
+
+
+def convert_tree(paths, target, jobs=None, write=True, exclude=None,
+                 diff=False):
+    """Convert every python source under paths using a process pool
+
+    Returns a generator of convert_file results in completion order
+    """
+
+    tasks = ((filename, target, write, diff)
+             for filename in walk_sources(paths, exclude))
+
+    if jobs == 1:
+        for task in tasks:
+            yield _convert_file(task)
+        return
+
+    pool = multiprocessing.Pool(jobs or multiprocessing.cpu_count())
+    try:
+        for result in pool.imap_unordered(_convert_file, tasks, 16):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m converter',
+        description='Convert source trees between PySide and PyQt4 syntax')
+    parser.add_argument('paths', nargs='+', help='files or directories')
+    parser.add_argument('--to', dest='target', required=True,
+                        choices=sorted(TARGETS), help='target library')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: number of cores)')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='glob of file or directory names to skip')
+    parser.add_argument('-n', '--dry-run', action='store_true',
+                        help='report files that would change, do not write')
+    parser.add_argument('--diff', action='store_true',
+                        help='print a unified diff, implies --dry-run')
+    parser.add_argument('--check', action='store_true',
+                        help='exit with status 1 if any file would change, '
+                        'implies --dry-run')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+    args.dry_run = args.dry_run or args.diff or args.check
+
+    start = time.time()
+    files = changed = errors = size = 0
+    for filename, length, modified, error, patch in convert_tree(
+            args.paths, args.target, args.jobs, not args.dry_run,
+            args.exclude, args.diff):
+        files += 1
+        size += length
+        if error is not None:
+            errors += 1
+            sys.stderr.write('{0}: {1}\n'.format(filename, error))
+        elif modified:
+            changed += 1
+            if args.diff:
+                sys.stdout.write(patch)
+            elif not args.quiet:
+                print('{0} {1}'.format(
+                    'would convert' if args.dry_run else 'converted',
+                    filename))
+
+    elapsed = max(time.time() - start, 1e-6)
+    report = sys.stderr if args.diff else sys.stdout
+    report.write('{0} files, {1} {2}, {3} errors in {4:.2f}s '
+                 '({5:.1f} files/s, {6:.2f} MB/s)\n'.format(
+                     files, changed,
+                     'would change' if args.dry_run else 'converted',
+                     errors, elapsed, files / elapsed,
+                     size / elapsed / 1024 / 1024))
+
+    if errors or (args.check and changed):
+        return 1
+
+    return 0
@@ -0,0 +1,121 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Benchmark the single pass rewrite engine against the per key loop
+
+Usage: python -m converter.benchmark [--lines N] [--repeat N] [file ...]
+"""
+
+import re
+import sys
+import time
+import argparse
+
+from . import pyqt2pyside, pyside2pyqt
+from .engine import RewriteEngine
+
+SAMPLE = '''from PyQt4 import QtCore, QtGui
+from PyQt4.QtCore import pyqtSignal, pyqtSlot, pyqtProperty
+
+
+class Widget{0}(QtGui.QWidget):
+    """Generated with pyuic4 and pyrcc4, translated with pylupdate4"""
+
+    changed = pyqtSignal(int)
+
+    @pyqtSlot(int)
+    def on_changed(self, value):
+        self._value = value
+
+    value = pyqtProperty(int, lambda self: self._value)
+
+'''
+
+
+class LegacyBuffer(object):
+    """
+    In memory buffer that mimics the view operations used by the per key
+    loop: one full scan per key and one splice per match
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    def find_all(self, key):
+        return [m.span() for m in re.finditer(key, self.text)]
+
+    def replace(self, region, replacement):
+        self.text = self.text[:region[0]] + replacement + self.text[region[1]:]
+
+
+def legacy_convert(text, pattern):
+    """The per key loop as it was done by BaseConverter.convert
+    """
+
+    buf = LegacyBuffer(text)
+    for key in pattern:
+        matches = buf.find_all(key)
+        matches.reverse()
+
+        for item in matches:
+            buf.replace(item, pattern[key])
+
+    return buf.text
+
+
+def engine_convert(text, pattern):
+    """Single scan conversion plus the splice of the changed lines
+    """
+
+    return RewriteEngine(pattern).rewrite(text)
+
+
+def measure(function, text, pattern, repeat):
+    """Return the best wall time of `repeat` runs
+    """
+
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        function(text, pattern)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m converter.benchmark',
+        description='Compare the rewrite engine with the per key loop')
+    parser.add_argument('files', nargs='*', help='PyQt4 sources to convert')
+    parser.add_argument('--lines', type=int, default=20000,
+                        help='size of the generated sample (default 20000)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.files:
+        text = ''.join(open(name).read() for name in args.files)
+    else:
+        chunks = SAMPLE.count('\n')
+        text = ''.join(
+            SAMPLE.format(i) for i in range(max(1, args.lines // chunks)))
+
+    print('{0} lines, {1} bytes'.format(text.count('\n'), len(text)))
+    for name, pattern, source in (
+            ('PyQt4 -> PySide', pyqt2pyside.PATTERN, text),
+            ('PySide -> PyQt4', pyside2pyqt.PATTERN,
+             legacy_convert(text, pyqt2pyside.PATTERN))):
+        legacy = measure(legacy_convert, source, pattern, args.repeat)
+        engine = measure(engine_convert, source, pattern, args.repeat)
+        print('{0}: per key loop {1:.3f}s, engine {2:.3f}s ({3:.1f}x)'.format(
+            name, legacy, engine, legacy / max(engine, 1e-9)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
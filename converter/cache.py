@@ -0,0 +1,180 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Content addressed cache of conversion results
+"""
+
+import os
+import hashlib
+import tempfile
+import threading
+
+from .base import sip_api_2
+from .batch import TARGETS, convert_text
+
+ENGINE_VERSION = 1
+
+
+def ruleset_version():
+    """Return a digest of the conversion rules, it changes whenever the
+    pattern tables, the API 2 block or the engine change
+    """
+
+    digest = hashlib.sha1()
+    digest.update(str(ENGINE_VERSION).encode('utf-8'))
+    digest.update(sip_api_2.encode('utf-8'))
+    for target in sorted(TARGETS):
+        digest.update(repr(sorted(TARGETS[target][0].items())).encode('utf-8'))
+
+    return digest.hexdigest()[:12]
+
+
+class ConversionCache(object):
+    """
+    Bounded LRU cache keyed by (content hash, rule set version, target)
+
+    Entries are kept in memory and, if a directory is given, also on disk
+    so they survive editor restarts
+    """
+
+    def __init__(self, max_entries=64, directory=None, max_disk_entries=512):
+        super(ConversionCache, self).__init__()
+
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.version = ruleset_version()
+        self.entries = {}
+        self.order = []
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.disk_hits = 0
+
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def key(self, text, target):
+        """Return the cache key for the given text and target"""
+
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return digest, self.version, target
+
+    def get(self, text, target):
+        """Return the cached conversion of text or None"""
+
+        key = self.key(text, target)
+        with self.lock:
+            converted = self.entries.get(key)
+            if converted is not None:
+                self.order.remove(key)
+                self.order.append(key)
+                self.hits += 1
+                return converted
+
+        converted = self._load(key)
+        with self.lock:
+            if converted is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, converted)
+
+        return converted
+
+    def put(self, text, target, converted):
+        """Store the conversion of text"""
+
+        key = self.key(text, target)
+        with self.lock:
+            self._store(key, converted)
+
+        self._save(key, converted)
+
+    def convert(self, text, target):
+        """Return the conversion of text using the cache"""
+
+        converted = self.get(text, target)
+        if converted is None:
+            converted = convert_text(text, target)
+            self.put(text, target, converted)
+
+        return converted
+
+    def clear(self):
+        """Drop every in memory entry and reset the counters"""
+
+        with self.lock:
+            self.entries.clear()
+            del self.order[:]
+            self.hits = self.misses = self.disk_hits = 0
+
+    def stats(self):
+        """Return the cache counters"""
+
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'directory': self.directory
+            }
+
+    def _store(self, key, converted):
+        """Insert in memory evicting the least recently used entries"""
+
+        if key in self.entries:
+            self.order.remove(key)
+
+        self.entries[key] = converted
+        self.order.append(key)
+        while len(self.order) > self.max_entries:
+            del self.entries[self.order.pop(0)]
+
+    def _path(self, key):
+        """Return the disk cache file name for the given key"""
+
+        return os.path.join(self.directory, '{0}-{1}-{2}.py'.format(*key))
+
+    def _load(self, key):
+        """Load an entry from disk"""
+
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self._path(key), 'rb') as fhandler:
+                converted = fhandler.read().decode('utf-8')
+            os.utime(self._path(key), None)
+        except (IOError, OSError):
+            return None
+
+        return converted
+
+    def _save(self, key, converted):
+        """Save an entry to disk and keep the directory bounded"""
+
+        if self.directory is None:
+            return
+
+        try:
+            fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            with os.fdopen(fd, 'wb') as fhandler:
+                fhandler.write(converted.encode('utf-8'))
+            getattr(os, 'replace', os.rename)(tmpname, self._path(key))
+
+            names = [
+                os.path.join(self.directory, name)
+                for name in os.listdir(self.directory) if name.endswith('.py')
+            ]
+            if len(names) > self.max_disk_entries:
+                names.sort(key=os.path.getmtime)
+                for name in names[:len(names) - self.max_disk_entries]:
+                    os.unlink(name)
+        except (IOError, OSError):
+            pass
@@ -0,0 +1,145 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Streaming line diff for conversion previews
+
+Conversions change lines in place and insert or remove the PyQt4 API 2
+block, so instead of the quadratic worst case of difflib.SequenceMatcher
+both sequences are walked in parallel and resynchronized looking ahead a
+bounded number of lines. The output uses the unified diff format.
+"""
+
+
+def opcodes(a, b, window=64, sync=3):
+    """Generator of difflib like (tag, i1, i2, j1, j2) opcodes
+
+    After a difference both sequences are resynchronized at the closest
+    equal line, among equally close ones the first followed by `sync`
+    consecutive equal lines wins
+    """
+
+    i = j = 0
+    n, m = len(a), len(b)
+    while i < n or j < m:
+        start_i, start_j = i, j
+        while i < n and j < m and a[i] == b[j]:
+            i += 1
+            j += 1
+
+        if i > start_i:
+            yield 'equal', start_i, i, start_j, j
+
+        if i == n or j == m:
+            if i < n:
+                yield 'delete', i, n, j, j
+            elif j < m:
+                yield 'insert', i, i, j, m
+            return
+
+        ahead = {}
+        for dj in range(min(window, m - j)):
+            ahead.setdefault(b[j + dj], []).append(dj)
+
+        best = None
+        anchored = False
+        for di in range(min(window, n - i)):
+            if best is not None and di > sum(best):
+                break
+
+            for dj in ahead.get(a[i + di], ()):
+                distance = di + dj
+                if best is not None and (distance > sum(best) or
+                                         distance == sum(best) and anchored):
+                    break
+
+                anchor = a[i + di:i + di + sync]
+                matched = anchor == b[j + dj:j + dj + len(anchor)]
+                if best is None or distance < sum(best) or matched:
+                    best, anchored = (di, dj), matched
+
+        if best is None:
+            best = min(window, n - i), min(window, m - j)
+
+        di, dj = best
+        if di and dj:
+            tag = 'replace'
+        else:
+            tag = 'delete' if di else 'insert'
+
+        yield tag, i, i + di, j, j + dj
+        i += di
+        j += dj
+
+
+def hunks(codes, context=3):
+    """Group opcodes in hunks with up to `context` lines of context
+    """
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == 'equal':
+            if not group:
+                group.append((tag, max(i1, i2 - context), i2,
+                              max(j1, j2 - context), j2))
+                continue
+
+            if i2 - i1 > context * 2:
+                group.append((tag, i1, i1 + context, j1, j1 + context))
+                yield group
+                group = [(tag, i2 - context, i2, j2 - context, j2)]
+                continue
+
+        group.append((tag, i1, i2, j1, j2))
+
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        if group[-1][0] == 'equal':
+            tag, i1, i2, j1, j2 = group[-1]
+            group[-1] = (tag, i1, min(i2, i1 + context),
+                         j1, min(j2, j1 + context))
+        yield group
+
+
+def _range(start, stop):
+    """Format a unified diff range like difflib does
+    """
+
+    length = stop - start
+    beginning = start + 1
+    if length == 1:
+        return '{0}'.format(beginning)
+
+    if not length:
+        beginning -= 1
+
+    return '{0},{1}'.format(beginning, length)
+
+
+def unified_diff(a, b, fromfile='', tofile='', context=3):
+    """Generator of unified diff lines between the a and b line lists
+    """
+
+    started = False
+    for group in hunks(opcodes(a, b), context):
+        if not started:
+            started = True
+            yield '--- {0}\n'.format(fromfile)
+            yield '+++ {0}\n'.format(tofile)
+
+        yield '@@ -{0} +{1} @@\n'.format(
+            _range(group[0][1], group[-1][2]),
+            _range(group[0][3], group[-1][4]))
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+
+            for line in a[i1:i2]:
+                yield '-' + line
+
+            for line in b[j1:j2]:
+                yield '+' + line
@@ -0,0 +1,164 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Single pass rewrite engine for PySide <--> PyQt4 converters
+"""
+
+import re
+
+from .diff import opcodes
+
+
+class ConversionCancelled(Exception):
+    """Raised from a checkpoint to abort a running conversion
+    """
+
+
+class RewriteEngine(object):
+    """
+    Compiles a conversion pattern dict into one regular expression and
+    rewrites a whole buffer in a single scan.
+
+    Keys are tried longest first so overlapping keys are always resolved
+    the same way regardless of the dict order. Replacement values that
+    contain a key (like `pyqtSignal` contains `Signal`) are protected so
+    an already converted token is never converted twice.
+    """
+
+    def __init__(self, pattern):
+        super(RewriteEngine, self).__init__()
+
+        self.pattern = pattern
+        self.table = dict(pattern)
+        for value in pattern.values():
+            if value not in self.table and any(
+                    key in value for key in pattern):
+                self.table[value] = value
+
+        keys = sorted(self.table, key=lambda key: (-len(key), key))
+        self.regex = re.compile('|'.join(re.escape(key) for key in keys))
+
+    def edits(self, text):
+        """Generator of (begin, end, replacement) tuples for the given text
+        """
+
+        for match in self.regex.finditer(text):
+            token = match.group(0)
+            replacement = self.table[token]
+            if replacement != token:
+                yield match.start(), match.end(), replacement
+
+    def regions(self, text, checkpoint=None):
+        """Return the (begin, end, replacement) edits that convert the
+        given text, the last one first
+
+        Changed tokens of the same line are merged in one edit, unchanged
+        lines are never part of an edit. Applied in the returned order all
+        of them can be done in one buffer edit with the offsets of the
+        given text. If given, checkpoint is called with the position of
+        every change, it can raise ConversionCancelled to abort the
+        conversion
+        """
+
+        regions = []
+        for begin, end, replacement in self.edits(text):
+            if checkpoint is not None:
+                checkpoint(begin)
+
+            if regions and text.find('\n', regions[-1][1], begin) == -1:
+                first, last, parts = regions[-1]
+                parts.extend((text[last:begin], replacement))
+                regions[-1] = (first, end, parts)
+            else:
+                regions.append((begin, end, [replacement]))
+
+        regions.reverse()
+        return [(begin, end, ''.join(parts)) for begin, end, parts in regions]
+
+    def rewrite(self, text):
+        """Return the converted text
+        """
+
+        return apply_regions(text, self.regions(text))
+
+
+_engines = {}
+
+
+def get_engine(pattern):
+    """Return a (cached) compiled engine for the given pattern dict
+    """
+
+    key = tuple(sorted(pattern.items()))
+    engine = _engines.get(key)
+    if engine is None:
+        engine = _engines[key] = RewriteEngine(pattern)
+
+    return engine
+
+
+def apply_regions(text, regions):
+    """Return the text with the (begin, end, replacement) edits given last
+    one first (see RewriteEngine.regions) applied
+    """
+
+    parts, last = [], len(text)
+    for begin, end, replacement in regions:
+        parts.extend((text[end:last], replacement))
+        last = begin
+
+    parts.append(text[:last])
+    parts.reverse()
+    return ''.join(parts)
+
+
+def line_regions(old, new):
+    """Return the (begin, end, replacement) edits that turn old into new,
+    the last one first, one per block of changed lines
+    """
+
+    old_lines, new_lines = old.splitlines(True), new.splitlines(True)
+    offsets = [0]
+    for line in old_lines:
+        offsets.append(offsets[-1] + len(line))
+
+    regions = [
+        (offsets[i1], offsets[i2], ''.join(new_lines[j1:j2]))
+        for tag, i1, i2, j1, j2 in opcodes(old_lines, new_lines)
+        if tag != 'equal'
+    ]
+    regions.reverse()
+    return regions
+
+
+def diff_region(old, new):
+    """Return the (begin, end, replacement) edit that turns old into new
+    using their common prefix and suffix or None if they are equal
+    """
+
+    if old == new:
+        return None
+
+    limit = min(len(old), len(new))
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+
+    prefix = low
+    low, high = 0, limit - prefix
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[len(old) - middle:] == new[len(new) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+
+    suffix = low
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
@@ -7,12 +7,17 @@
 Converts a PyQt4 script to PySide
 """
 
-import sys
+from .base import BaseConverter
 
-if sys.version_info < (3, 3):
-    from converter.base import BaseConverter
-else:
-    from PySide.converter.base import BaseConverter
+PATTERN = {
+    'PyQt4': 'PySide',
+    'pyqtSignal': 'Signal',
+    'pyqtSlot': 'Slot',
+    'pyqtProperty': 'Property',
+    'pyuic4': 'pyside-uic',
+    'pyrcc4': 'pyside-rcc',
+    'pylupdate4': 'pyside-lupdate'
+}
 
 
 class Converter(BaseConverter):
@@ -21,16 +26,7 @@ class Converter(BaseConverter):
     """
 
     def __init__(self, view):
-        pattern = {
-            'PyQt4': 'PySide',
-            'pyqtSignal': 'Signal',
-            'pyqtSlot': 'Slot',
-            'pyqtProperty': 'Property',
-            'pyuic4': 'pyside-uic',
-            'pyrcc4': 'pyside-rcc',
-            'pylupdate4': 'pyside-lupdate'
-        }
-        super(Converter, self).__init__(view, pattern)
+        super(Converter, self).__init__(view, PATTERN)
 
     def convert(self, edit):
         """Convert a PySide syntax file to PyQt4"""
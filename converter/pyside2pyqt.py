@@ -7,12 +7,17 @@
 Converts a PySide script to PyQt
 """
 
-import sys
+from .base import BaseConverter
 
-if sys.version_info < (3, 3):
-    from converter.base import BaseConverter
-else:
-    from PySide.converter.base import BaseConverter
+PATTERN = {
+    'PySide': 'PyQt4',
+    'Signal': 'pyqtSignal',
+    'Slot': 'pyqtSlot',
+    'Property': 'pyqtProperty',
+    'pyside-uic': 'pyuic4',
+    'pyside-rcc': 'pyrcc4',
+    'pyside-lupdate': 'pylupdate4'
+}
 
 
 class Converter(BaseConverter):
@@ -21,16 +26,7 @@ class Converter(BaseConverter):
     """
 
     def __init__(self, view):
-        pattern = {
-            'PySide': 'PyQt4',
-            'Signal': 'pyqtSignal',
-            'Slot': 'pyqtSlot',
-            'Property': 'pyqtProperty',
-            'pyside-uic': 'pyuic4',
-            'pyside-rcc': 'pyrcc4',
-            'pyside-lupdate': 'pylupdate4'
-        }
-        super(Converter, self).__init__(view, pattern)
+        super(Converter, self).__init__(view, PATTERN)
 
     def convert(self, edit):
         """Convert a PySide syntax file to PyQt4"""
@@ -6,6 +6,17 @@ ${PyQT_API_CHECK}from ${QT_LIBRARY} import QtCore, QtGui
 import application_rc
 
 
+def resource(path):
+    """Register the resource group of path on first use when
+    application_rc is a split resource loader and return path
+    """
+
+    if hasattr(application_rc, 'resource'):
+        return application_rc.resource(path)
+
+    return path
+
+
 class MainWindow(QtGui.QMainWindow):
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -71,18 +82,18 @@ class MainWindow(QtGui.QMainWindow):
         self.setWindowModified(self.textEdit.document().isModified())
 
     def createActions(self):
-        self.newAct = QtGui.QAction(QtGui.QIcon(':/images/new.png'), "&New",
-                                    self, shortcut=QtGui.QKeySequence.New,
-                                    statusTip="Create a new file",
-                                    triggered=self.newFile)
+        self.newAct = QtGui.QAction(
+            QtGui.QIcon(resource(':/images/new.png')), "&New", self,
+            shortcut=QtGui.QKeySequence.New, statusTip="Create a new file",
+            triggered=self.newFile)
 
         self.openAct = QtGui.QAction(
-            QtGui.QIcon(':/images/open.png'), '&Open...', self,
+            QtGui.QIcon(resource(':/images/open.png')), '&Open...', self,
             shortcut=QtGui.QKeySequence.Open,
             statusTip="Open an existing file", triggered=self.open)
 
         self.saveAct = QtGui.QAction(
-            QtGui.QIcon(':/images/save.png'), '&Save', self,
+            QtGui.QIcon(resource(':/images/save.png')), '&Save', self,
             shortcut=QtGui.QKeySequence.Save,
             statusTip="Save the document to disk", triggered=self.save)
 
@@ -96,19 +107,19 @@ class MainWindow(QtGui.QMainWindow):
             triggered=self.close)
 
         self.cutAct = QtGui.QAction(
-            QtGui.QIcon(':/images/cut.png'), 'Cu&t', self,
+            QtGui.QIcon(resource(':/images/cut.png')), 'Cu&t', self,
             shortcut=QtGui.QKeySequence.Cut,
             statusTip="Cut the current selection's contents to the clipboard",
             triggered=self.textEdit.cut)
 
         self.copyAct = QtGui.QAction(
-            QtGui.QIcon(':/images/copy.png'), '&Copy', self,
+            QtGui.QIcon(resource(':/images/copy.png')), '&Copy', self,
             shortcut=QtGui.QKeySequence.Copy,
             statusTip="Copy the current selection's contents to the clipboard",
             triggered=self.textEdit.copy)
 
         self.pasteAct = QtGui.QAction(
-            QtGui.QIcon(':/images/paste.png'), '&Paste', self,
+            QtGui.QIcon(resource(':/images/paste.png')), '&Paste', self,
             shortcut=QtGui.QKeySequence.Paste,
             statusTip="Paste the clipboard's contents into "
                       "the current selection",
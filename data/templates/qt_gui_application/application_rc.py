@@ -1,21 +1,68 @@
 # -*- coding: utf-8 -*-
 
-# Resource object code
+# Resource loader
 #
-# Created: sáb may 5 16:36:37 2012
-#      by: The Resource Compiler for PySide (Qt v4.7.4)
+# Created by: SublimePySide resource compiler from application.qrc
 #
 # WARNING! All changes made in this file will be lost!
+#
+# Every resource group lives in its own module, a group is registered the
+# first time resource() is called with one of its paths (or a directory
+# that contains them), qInitResources() registers all of them
+
+import sys
+
+GROUPS = {
+    'images': 'application_images_rc',
+}
+
+PATHS = {
+    u':': ('images',),
+    u':/images': ('images',),
+    u':/images/copy.png': ('images',),
+    u':/images/cut.png': ('images',),
+    u':/images/new.png': ('images',),
+    u':/images/open.png': ('images',),
+    u':/images/paste.png': ('images',),
+    u':/images/save.png': ('images',),
+}
+
+_loaded = {}
+
+
+def load(group):
+    """Register a resource group, returns its module"""
+
+    if group not in _loaded:
+        package = __name__.rpartition('.')[0]
+        name = (package + '.' if package else '') + GROUPS[group]
+        if name in sys.modules:
+            sys.modules[name].qInitResources()
+        else:
+            __import__(name)
+        _loaded[group] = sys.modules[name]
+
+    return _loaded[group]
+
+
+def resource(path):
+    """Register the groups of a :/path (or qrc:/path) and return it"""
+
+    key = path
+    if key.startswith('qrc:'):
+        key = ':/' + key[4:].lstrip('/')
+    for group in PATHS.get(key.rstrip('/') or ':', ()):
+        load(group)
+
+    return path
 
-from ${QT_LIBRARY} import QtCore
 
-qt_resource_data = "\x00\x00\x03T\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x04gAMA\x00\x00\xd6\xd8\xd4OX2\x00\x00\x00\x19tEXtSoftware\x00Adobe ImageReadyq\xc9e<\x00\x00\x02\xe6IDATX\xc3\xd5\x97\xcdN\x13a\x14\x86\xeb5\x94\x95{q\xe1\xd2\xc4\xe0\x05\xb8\xe2\x0e\x5c\xb8\xf4\x02\x5c\xb10\xea\x05\x18\x96&bX\xb8\xb0\x91X \xd1\x9d\xbf\x89\xa4\x14\xb1R\xa4HE\x94\xfe\xd0\x02C\xff\xa6\x9d\x19\xa6e\x80\xe3y{\xfa\x85QJ\x82\xc9!\x86I\xde\x9c3\xa7\xf3\xcd\xfb\x9c\xf3M\x9bN\x84\x88\x22\xffS\x91s\x01\xc0\xc7\xd5\x90n\xff\xa5\xfb\xac\xc7==d\x0d\xa9\x02\xf012<<\xbcj4::\xba\x19V<\x1e\xaf&\x93\xc9V:\x9dv\x13\x89Dk`` \xcdknh\x02\xa48\xd2\xe1\xe1q\x99\xba\xef\xb7\xc9\xb2,\xda\xdf\xdf'\x86\xf1x\xcd\x18\xeb\x8a\x1a@?\xf3\xb0\x1c\xc7\xa5Lf\xb9\x0b\x14\x04\x01\xc5b\xb1:\xaf{p\x1a\x88S\x01\x1c\x1c\x10ww\xb2l\xdb\xa1\xf9\xf9\xcfd\x0e\xd7u\xe9\xf9\xc4D\x17B\x05\x00&{\xc1\xc9\xaa7\x1cJ\xce\xcdS\xf8p]\x0f\x8b\x17T\x00\x82\x10@gO\x14\xce\xed\xa6G\x1fgf\xe9\xf5\x9b\xb7\x14\x9f\x9c\xa4\xa9\xa9iz\xf7\xfe\x03E\xa3\xd1e^\x7fA\x05\xc0\xef\x10\xed\xb6%\x86\x85\x9a\xe3\x05\x94]\xcd\xd1\xe4\xf4+z2\xfe\x94\x9e\xc5^\xd0Lb\x0e\x8b\x17U\x00\xda\x81\x18\xf5\x13 <\xff\x90j\xcd6\x157\xab\x94/nS\x89c\x8d\xb7\x85\xd7~Q\x01\xf0y\xcc\xcd]\x1e\xb5\xc7{\xdb\xee\x9f;\xbe\xe4\x88]\xb8\xbd\xee\xe2\x94\xca3\xe0u\xe4\xc6uWb\xd8\x109\xea\xe63D\xd4\x01\xa7\x06\xe0\xf4:\xad9\x22\x98\x98hr\x80\x98kPS\x9d\x00\x00*-\xb91\xe2NS\x8c\x10\x0d\x04\xf2m\xfb(\xb6|E\x00\x9b;\xdbj\xfci\x8e<l\x88\x1a\xae9\x13\x80:\x8f\xb7T#*\xd7\xc5\x04\x06\x06\x005(\x9c\x17\xab\xbc%\xbb\xca\x13\xc0Ma\x0e\x15*rn\xcc~Z\x02hj\xdd\xad\xf1\x94'\x00S\xdc\x1cqm[@`\x9a\xab\x1cu\x9e\xeb\x81A\x15G\x11\xc0j\x891\x0c\xd6w\x04 \x0cd&b\xb6iu\x8b\xa8\xaa\x09P\xb6\xc5\xbc\xd0\x03\xf8\xbe)c\x87)`\x0c\x18\x84\x1c\x00[ME\x00t\x03S\x98\xad\x94\xc5\x1c\xe7F\xe6\x1c\x00\xc8q]\xa9\xa1\x08\x80\xfd\xfcV\x12s3\x01\x085\x18B\xe8\xda|\x8e)\xa8N\x00[\x00\x03\xc8\x98g6\x04\x002\xe6\x85\xde\xf8\x17\x0b\xfc,\xd8\x8a\x00\x18g:O\xb4T\x14#\x98\x02\x00\x02\x0c>\xfb\xc5S(\xf0C\xb8fI\xf7k\xf9R\x87\xd7\xbeT\x01\xc8U\x8f\xbaN\xadK\x0e\x90\xaf\x85\xde\xb7\xc2\x92=O\xa6\xb3\xde\xa3\xb1q\xeb\xda\xd0\xf5\x15\x98\xb3n\xa9\x00l4\xa4k\x18\xff\xe0\x11\x7fZ\x17S\xd4\x13\x0bYo\xe4\xee\xbd\xe2\xa5\xc1\xcbK|m\x8cu\x875\xa8\xfa\xb7\x1c\xdde\xd9<\x8f\x1f\x19\xfe\x9e\xcf\x1e7\xbd\xc9\xbax&oF\x00h\xf2\xff\x81\x99\x94\x9e\xe9?\xbf\x19\x01B\xd3\xf4\xfc\xbd\x9c\x9e\xa5~\x03Ql%\xa1\x92\x95\x0aw\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x05:\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x04gAMA\x00\x00\xd6\xd8\xd4OX2\x00\x00\x00\x19tEXtSoftware\x00Adobe ImageReadyq\xc9e<\x00\x00\x04\xccIDATX\xc3\xb5\x97]L[e\x1c\xc6wo\xbc\xd9\xe5\x12I q\xd7&\xe3N\x13\xb8p\xd1\x85D\xbdP\xe3\x10\x18\xe5+.&J\x04'\x86\xaa\x8b\x99\xe0\xd0\xa2l\x19\x869\x17\xdc\x1a\x16\x98\x80@l\xa6C\xca +\x83\x1e(\xcc\xda\xd1\x96\xd2\xd2J{\xfa\x01\xa5\xd0\xef\x16\x1e\xdf\xff\xdb\x1d\xc7\xcc\x04*\x87\x93<9o!\x9c\xe7\xf7<\xefG\x0f\x87\x00\x1c\xcaF\xcf\xbd\xfa\xe9\xbbLZ&a\x0fj`\xca\xd9\xe9y\xd9\x9a?]P\xf2\xa5\xc1\xe9\x8f\xa7W\xc3@0\x02\x84\xa2\x19\xad\xc72\x8a'\x81X\x22s\xbfyk\xdaK\x10r\x02\x1c{\xe7\xac\xda\x1c\xd8\xc8\x98\x12@\x84\x99\x85\xe3\x19\x911)\x1aKa%\x94D8\x9aBs\x87\xc6\xbe\x13\xc4\xff\x02\x90\x12\x93y$\xf1\xc8X\x92\xcf\x1f\x84]\x8c\xc2\xe5\x09\x22\x12K\xa3\xf4\xc3\xefM4uY\x01\xb0\xeb\xd86\xd5\x90\x9e:\xfc\xcc\xb9\xe7_.\x11?V\x9eEEU\x0d*\x99\xde\xaf\xad\xc3\x9d\xb1\x89\xc7\x00\xac\xb6%\xfc\xb9\xe8\x87k\x15X\xf6\x04\x10\x08\xc6\xd2\xaf\x9c\xbep\x9fA\x1c\xd9\x15\x80]\x87\x99\x1a\x8a\x8a\x8a\xcc\x92Z[[\xdd\xa4\xafU\xad\xfe\xafT\xdf\xa6\x06\x06\x06195\x85\xd9\xb99\xe8&&PPP\x80!\xcdo|\xdeI\xa6\xf9\x05\xcc\x98\x5c\x1c\xc0\xe1OA\xf4\x85\xf0C\xaf\xce\xcd\x00j\xf6\x02PCf\xd8\xe5\x8a\xc7\xe3\xf0z\xbdH\xa7\xd3\x98\x9c\x9cDee5fg\x8d\xbc\x81\x07f\x1bt\xd3\x16\x0e@2-x\xf0\xdd\x8dQ\x8f\xac\x00\xe1p\x18F\xa3\x91\x8fS\xa9\x14~\xea\xedE\xe3'\x9fa\x86A8\x96\xdcPwu\xe3LC#\xce5\x9d\xc7\xed\x91q\x5c\xbc>,/\xc0\xc6\xc6\x06\xf4z\xfdc@}}\xfdP2\x88\xd0F\x1cf\x9b\x0b\x82\xc1\x88\xa9\x19\x13\xac\x0e\x11\x97\xbadn\x80\x00\xa6\xd8:\xd8~E\x22\x11\x94+*0\xae\x13@\xe7\x04mW\xda\xaa4\xbe|S\xe65@f:\x9d\x0e\xc3\xc3\xc3\xe8e\xf5\xf7\xf7\xf7C\xab\xd5\xa2\xaa\xba\x06cw\xf5\x90\x0e*w\x90\xed\x04\xb6\x0e\xda\xbbe\x06\xa0y\xb7\xdb\xed\x18\x1a\x1aBgg'zzz8PIi\x19ni\xf5\x10\xd7\x00o\x08\xb0\xf9\x00g\x00\xb8\xd0%3\xc0\xd6\xd6\x16\xdf\x09\x81@\x00\xa2(\xc2\xef\xf7cmm\x0d\xa7\x14\x95\xd0\xfc\xae\xe7\xa9\xc9|\xc1\x0b\x98=@\x9b\xdc\x00\xdbA677\xf9v\xa4V\x14\x15\xd5\xe8\xfbU\xe0\xa9\x1d\x81G\x00\xe7;\x0f\x00\x80\xcc%\x80$3O$\x12(+\xaf\xe2\x00\x7f\xb8\x00\x8b\x98\x01\xa06Z\xd5\x070\x05\xff\x98'\x93<=MI\xc9\xa9J\x0e\xa0\xb7\xb3\x03\x89=\xc5\xf8\x170\xb1\x00|q\xf5\x00\x00\xa4\xea\xc9\x98\x14\x8b\xc5P\xa6\xa8\x82zH\xc0\x98\x19\xb8k\x05\xe6\x9c\x99\xfb\xe7Wd\x04\x90\xd2Sj\x02\x88F\xa3\xdc<\x14\x0a\xa1\xb8\xb4\x02\xd7\x06\x05\xdcf\x87\xe4\xa0\x01\x1cd\xc4\x04(;d\x06H=\x9cs\x12\x99\xd3\xb9@ \xc5eU\xb8\xd8-\xa0\x7f:c\xae}\x90i\xe0\xa3v\x99\x00\xfe]=\xa5&\xad\xae\xaer\x88\xb7J*p\xb9W\xc0=\x1b\xb8~\x9e\x01\xee\xcc\x03g.\xed\x13@\xaa\x9dD\x8b\x8e\x92\xd3qL\xdf\x01+++X__\xe7\x10'Y\x03\xdft\x09PO\x00\xbf\xcce\x1a\xb82\x064\xec\xa7\x01\xc9X\xda\xebdNi)9\x1dD\x04@\xf5\xd3\xcf\xde|[\x81\x96\xeb\x02O~u\x1c\xb8q\x0f\xf8q,\x9e~\xbdNm\xa67\xaa\xac\x00\x9ed,m72%\x00\xd1#\xf2\xe4\x12\xcc\x1b'\x15h\xef\x11\xa0\xbcf[\x7fO5\xe2<q\x9a\xbf\x8ei\xf7\xfcJ&\x01\x90\xa9$i\xb5SB2\x0f\x06\x83p\xb9\x5c\xdc\x90^J\xe8\xb3\xc7\xe3\x81\xdb\xed\xc6\xf1\x13\xaf%\x9f}\xa1\x9cL;\x98\x8a\x99\x8e>\xc9xG\x00\x95J\xc5\x01\xa4\x15.\xcd7\x19RR:\xf7)\xb5\xc3\xe1\xe0\x22\xe3\xc5\xc5E\x0e\xf5\xe2\xf1\x97\x5c\xf4\x1e\xb9\x93\xe9\xae\x00---n\xe9`\xa1\xd4\xd2\x97\x0d\x8d\x97\x97\x97\xe1\xf3\xf9`\xb3\xd9\xf8}ii\x89C\x10\x00\x8d\x0b\x0b\x0b\xcd\xb2\x00\xd0\xa2\x92R\x93\x11\x8d\xe9N\xdfxT;5`\xb5Zy\xf5\xd4\x0a\xfd\xce`0$\xf2\xf2\xf2\xee\xb3g\x1c\xd9\x17@SS\x93[\x9agJO\x22\x13\xaa\x9a\xc6\x16\x8b\x997@\x9fGGG#mmm\xde\xfc\xfc|\x13\xfb\xdbA\xa6\xb2\xbd\x9a\xff'@ss3\x9f\x02JG\x10T?U???\xcf\xeb\xd6h4\x91\xba\xba:\xe7\xc3\xb4]L\x1f0\x1d\xcd\xc6xG\x00\xa5R\xe9v:\x9d\xbcbJJo>\x94\xb4\xbe\xbe\xde\x99\x93\x93#\x99\x16gSuV\x00\x8d\x8d\x8dn\x8b\xc5\x82\x81\x81\x81Hmm\xad377WV\xd3\xdd\x00\xf8\x7fFL\xc2A\x99n\xd7\xdfC9V\x18\x85p\xc8\x04\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x05+\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x04gAMA\x00\x00\xd6\xd8\xd4OX2\x00\x00\x00\x19tEXtSoftware\x00Adobe ImageReadyq\xc9e<\x00\x00\x04\xbdIDATX\xc3\xedWkL\x93W\x18>#q\xc92\xe9\x16\x97\xa8Te8\x9d\x02\x15\xf6\x03\x872\x93\x01f,[p\xc40\xff`\xa2.\x1a:\x1dN\x03\xba1\x89[\xb3\x80\xd9\x0c\x84\x02\x19X\x1c\x14\x8b\x85\xb2\x82\x95^\xe4f\x0b\x8e1\xf8\xc3F\xcb-\x81\x15\xdc\xa8\xc2\x1c\x1b\xb7ji\x91\xf2\xee\xbc\x87\xaf\x0c\xdc\xb8\x0da\xd9\xb2\x93<\xed\x97\xf3}\xfd\xde\xe7\xbc\xef\xf3^J\x00\x80\xfc\x93 \xff\x0a\x02t\x09(D\x14\xd9\x14q\x14\x01+F\x80\xae\xddd\xdd\xc6f\x22L\xf8\x95\xc4\x8bG\xc8\xa1\xd3\xf7\xc8\x8e\x97;82a+A \x85\x9c\xbe0H.\xdd\x80\x19@2\xabyM\xf4\xbe\xfbr\x13hd\x06\x91\x04^\xa3Q\xf4\x06\xee\x85G\xf5\xd0\xbd\x83\xcbM \x9b\x9d\xf6@t/\xbd\x162= \x89?H\xa5,\x1b\x01\x8c1y\xc1\xbb\x9d\x88K\xc6\xd7\xc6&\x0e\xa0\x10\xb9\xfdB\xfe\xc5+6F\x8c\x12\x5cN\x02\x93\xa7\xa7\xa7\x0d\xcc\xd39\xb9\x98c6\x14\x0a\xd2\xe4\xa3+A \x8c)\x9e*\xdf7G\xeb\xdc{\xb5\xcc\x89\x9e@D\x96T\x83+,\x0b6FH\x08\x13\xf5d*{.T\x03\x01\xf8\x037\xbf\xc0\x0e4*T\xdfb\x88R\xd5,X\x03t\x1d\x16\x08\x04zEU\xf5\xc8\xa0mt\xc2\xd4s\xf7!\xbesQ\x95\x90\xae\x8f\xd0\x13\xcf\xe5\x94\x83\x87\xb4\x02\x9e\xcc.\x03\xd4\x06\xdd\xaf\x99\xcb\xb0\xaf\xaf\xaf>\xbf\xd2`\xb5\xdb\xed\x80\xf8y\xe4>\xc4^\xab\xb4\xb9\x88/\x86\x80'\xd3\xc0g\xf9\x8e\x19\xf5`\xd7^3\xbav\xdas\xeeh\xd8\xc7\xc7G\x9f\xab\xab\xb0\x0e\x0f\x0d\xc1\x10\x87\xb2\xf6.\xe7\x967\xf7wsa\xd8\xbd\xe8^\x80/f\x9a\xa0\x86\xdf\xa96B\xf7\xf0\x03\xd8\x19\x9f\xd4\xcf\xa5\xe7\x1a\x8a\x98-~\xfem\x97T\x1ak__\x1f\xb8\xd0\xd1s\x07br\x15VN\xc4\x87\x97\xd4\x8c0\x14\xe9\x15\xb7\x1e8\x1c\x0e@\xa4\xd6\x191\x9e\x85\x9b\x05~m\xa9%\x1a[\x97\xd9\x0c\xe6.\x0a\xf3$\x14\xdf6\x8e{\xbd\x1e\xd1\xcdB\xc8\x09o\xa9\x04<\xd1\xbdV\xab\x15\x10w\x7f\x1b\x84\xf3\x92\x5c\xbbR\xa9\x84\xfa\xfaz0\x99L\x0cu\xdf5\xc1Q\xb1d\x18\xc9QD>\xb6v\xcc\xb4@O\x93_~\xd3\xd6\xdf\xdf\x0f2\x99\x0cD\x22\x11\xa8T*\x90J\xa5\xa0\xd1h K[9\xbe\xe9\x95\xe0\x1f\xb8S\xafy,\xf3\x00\x97\x8e\x22\x9e\xc7\x86\xe6S)\x19\xf6\x82\x82\x02\xe6\xe2\xa0\xa0 \xe0\xf1x`\xb1X@[^\x01\xfb\xcf&\x0c-\xa6S\xceg\x94\xcf\x09L\x83\xe2[{\xe6\xc2`\x9a\xb2\x14\x14\x0a\x05\x88\xc5b\xc8\xcc\xcc\x84\xa2\xa2\x22P\xab\xd5\xd0\xd9\xd9\xc9`\xec\xfe\xc9\xb9\xc9\xdb\xa7u.\xb7\xcfK\x80\xae\xb7\xd8)p\x0e\xc0j\x97\xacx\x88\xca\x7f\x82\xe2)\x89\x0e>\x97+![\x96\x0f\x07c\xe3G\x84\x1f&\xd8\x92rd\x8eo\x1a\xbf\x07\xa3\xd1\x08-\xad-\xf0\xcb\xc0 \x1c8\xf1\xbe\x05\xb3b\xc1\x04\x5ci\x84\x85\x85\x84F\xdc&\xe72\xac,\xcf3\xb5\x13\xec;\xe3\xba\xd33\xaf\x82\xe5\xfez\x89\x06\x9e\xde\xfcb\x1b\xf7<\x92\x8d{f\xabO[\xca5\xedXCC=444\x80\xa5\xb7\x172\x14\xc5\xc3\xf3\xe9\xc0e<\x92\xe5(\x9e6]\xe5\x9c*2x}\xf4\x83.Zl\x121\x0c\x1b%\xeaq\xf7/\xcb'\xef\x05\x87_\xfe\xd3\xe4D\x0bLh\xf4\xc9>u\x95\x1e\x0c\x06\x03\xb4\xb7\xb7\xc3\xd7\xc6\x961\xae\x81\x09f\xf16m8h<I::e\xf8b\x81\x83D\xbdWC\xb6\x0a^\x9b*\xc3\x94\x5c\xb0B\x0f\xab$\xb4\x04\x9fJ\xaa\x9bC71(\xd4O\xf2\x0a\xc7t:\x1d\xd4\xd6\xd6\x82\xc9|\xdb\xb9a\x9b\xf7_\xeab\xb2\xe5~\x9cu\x1f\x0d\xf3\xb2\xd4N\xf2\xf6\xb1\xeb.\xb6\xae\x94\xc3\x90l\x97U\xc1KW\xab\x80\x9cMnZ\xd0\x1cI\xbd\xb1\xe7\x88\xb0\xef\xcaW\xc5PZZ\x0a\x1d?\xf6L\x04\x06\x87t<\xaa\x0b\xc2\x84F\x8d\x07\xc8o\x02\xd9\xf9\xaa~\x9a\xf10F\x8e6 \xaf\xbcJxCi\x00\x92(\x1d\x98\xcd\x95\xb3y\xc3}=\xbf\xf9Dj\xa6].\x97CSK+D\x1c{\xf7\xce\xf4\x14%\xae\xf1\x8a\xf5w\x9c\xf5p\x02\xc2\xd9\x0f\x89\xd1\x81\x03O\x8e\xf7\xdc\xd2i\xe7\xf3\xdfu\xfco\x14.6\xd2\xef\xd8\x17iI\xbe,\x9d\xc8\xd3\x96;\xa7\x0f1\x8c%\xc6\xdf\x9f\xbaw_q5\xa0Al\xb5\x08\x8c\xf9\x94\xf1\xe0\xf03K\x9a|h\x13Z\xbd\xce\xa3\xd9kOH\xf7\x0c\x0f\xb0\x0f\xfe\xf3\x87\xc8\xf9/\xee\xb9In\x00\xf6{>\xed\xf7\x08\x1e*>]\xe5X\xaa\xf1GZ\xf5\xb6Y\x0b\x11\x1d\xb3C\xc9\x918\x099\xf9\xa9\x96!\xfa\x5c\x1a\x0d\xcf\xb3\xff\xff7\xfcO\x13\xf8\x1d\xe7\x87\x19\xb9D\xc3\x01\xcf\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x04\xa3\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x04gAMA\x00\x00\xd6\xd8\xd4OX2\x00\x00\x00\x19tEXtSoftware\x00Adobe ImageReadyq\xc9e<\x00\x00\x045IDATX\xc3\xe5\x97\xcd\x8fTE\x14\xc5\x7f\xb7\xea\xd6{\xaf\xdbn\xc7\xf9@\x9d\x89FM4\x99D\x8d\x1aH\x98\xc4\x8c\x1f\x1b\xfe\x02L\x5c\xf1\x07\x18\x16.M\x5ckX\xc3\x8e\xc4\x8d\x1b\x17\xce\x82htA\x5c\x18\x0d\xe2\xc4\xc6\x00=`PQ\x19`\x02\xa2\x0e\x0c\x83\xd3\xfd^\xf7\x94\x8b\xaa\xee\xf9`\xe6\x0d\x84Q\x16VR\xa9\xce{\xb7\xeb\x9e:\xf7\xd4\xa9z\xea\xbd\xe7~6\xe5>\xb7>\x80]\xbbv\xbd\x03\xec\xfd\x8f\xf2N5\x1a\x8d\x03\xeb\x19\xd8\xbb\xef\xbd\xa3;\x1f\x1fv\x00\x9c<:\xcf\xcc\x977X\x9c\xef\xdcS\xa6\xda\xa0\xf2\xdck\x03\xbc\xb8g\x10\x80\x8b\x7f\x16|\xf8\xee\x1e\x80\xdb\x00p\xfc\xec\x1c\xdf?0\x04x.\xfd\xb8\xc0\xfe\xb7\xceo\xcbr\x0f\x1dy\x9a\x0b#\x96\xd3\x9f\x1fd\xfc\xd5}\x9bk@E\xb0\x16@xp,#\xcb\xb2m\x0100\x96a\x8dP\x1b|\x14#%\x22\x14+\xd8\x18\x91\xd5\x95s\xe7\xce\x83*\xb8\x04\xd2\x14\xb2\x0c\xd2,\x8cI\x0aI\x12\xdew:\x90\xe7\x90\xb7\xa1\xd5\x82v+\x8em(r\xb2\xfa8\xd6\x0a\xe3\xaf\xbcIk\xf1\xfa\xe6\x00\xac\x15\xac\x15\x04\xb0F\xd8\xbd{\xe7\x16k\xeb\x86\xae\x80Z\xa8V\x81\xeamQ\x8d\xaf\x04\xb5\x82\xf7\xa0\xa6\x84\x01g\x055\x82\x08\xa8\x0a\x95,\xc3# \x1e\x08\xc0\xf0\x1e/\x02\xde#\x12&\x15|\x88#\xc4!\x1e<!^@MX\x18@\xd7J\x89\x06\xac\xa0\xdac\x00\x9a3\xbf\x05\x8aS\x07i\x02\x95\x04\xb24\xf6\x04\x12\x07N\xa1\xe8@^@+\x8f\xbd\x05K9\xb4s\xc8\x0bT\x87q=\x00*\xe5%p1@\xd509\xf9\xd2\xd6\x0a\xf3>\xd0\xaf\x16\xaa\x1b\x8b\xf6\xd8'aa\xbd\x1c%% \x00\xf0\x81\x8d4M\xa3:\xc3\xb3\x98\x11\x89l\x07\xdac\x09V\x98_)F\xfca\xcdr\x7fa\x1d-\xd1\x80:\x09TI\x18O4/\xe0\x9d\x85\xc4!\x89\xc3g\x09\x92i\xd8\x11\x89\xe2\x13\x87X\x8b\xefv\x91\xbc\x80\xbc\x03\xed\x02\xdfj#\xed\x02\xf2\x02\x9fwP\x1dE\xd5 x:\xebTx\x9b\x06\x9c3x\x0f\x03\x8f$\xbc\xfe\xf2\xf3wh\xe86h\xa4\xbe\xf1\xeb\xc6\xfc\xdf\xb1\x04R^\x82DM_\x84\x8f\x0d\xa58\xe7\xb6\xc5\x88\x9e\x18K\xb9v\xb3\x03\x08\x9dR\x11\xaa\x90\xb8P\xefZ\xc50}\xb1\xcb@\xc5\xb0\x0e\xf4&\xadW\xf9U.\xe1\xe1\xc6\xd22\xf5\xccp}\xc9\x84-\xe9J\x19\x10\x9c\x1a\xc0s\xe5f\x97+7\xbb\xacQW?\xd7\xaad~\xc5'\xa2)\xac\x05\x15\xc3\x9c\x0b\xb5w\xa6l\x17\xa8\xc1\xa9 \xc8\x1a5\xaf\x9b5\x1a\x8fY1\x9e\xfe{\xe9\xef\x14\x00\xf1\x82\xef\x9bX0+WV\x02U!\xd1\x90\xfc\xe7S\xdf\xf2\xeb\x99\x13,-\xde\xb8\xa7\xfaWj\x03<\xf5\xecN\x9eya\x02\x0f\xa83[1\x10\x03|\x87\xf7\xf7\xbf\xc1\xc2\xc2\x02\xb7n\xdd\xa2(\x0aD\x04k-\xd6ZT\x15U\xc59\x87\xaab\xad\xc5\x98\xf0\xdf\xe5\xe5e\xf2<\xef\xf7#\xcd\xf9\xb8\xf2-\x18pVP\x17\x18\xdc1:\xb6rO8~\x9c\xe9\xe9i\x8c1x\xef\x99\x98\x98`rr\xf2\x8eY\xd81:\xd6\xdf\x86\xae\xd4\x09Up6\xac\xa2V\xaf\xf7k933\xc3\xd0\xd0\x10\xd6Z\xbc\xf74\x9b\xcd\xbb\x02P\xab\xd7p\xd1\x88\xb4\xd4\x88\x14\x9c\x0b'\x5c\xa0*\x00\xa8V\xabdY\xd6\xa7\xb87\xdeis\x1a\xa9\x17AK\xad8\x1e\xc7\xbd#\xb4\xd7\x8c1\x88D\xdf\x8f:\xb8\xab\x9b\xaf5\xa8\x0d\xf3\xf6\x18.=\x8e\x83)m\xe3\xd5\xdb\x12\xa9\xf7\xe5Vl\xad\xf4\x91\x0e\x8e\x0c\xc3\xf2\xef\xdb\x02\xe0\xa1\x91a\xd4\xc2\xb5+\x97Y\x9c\xbf\xbe\x05\x036\xf8\xc0`\xad\x02\x0b\xdb\xc3\xc0P\xad\xc2\xec\xc5K\x9c\xfd\xee\x1b\xce\x9f\x9c\x9e\x03\xa66\x04`$^J\x05\x12\x0b\xed\x91'\xa9=\x0co\x1f8\xc8f\xc7\x81':\xf1*\xe75\x1e2\x81\x14(\xbap\xf9\xeaU\xce4\x8e\xd1\xfc\xfa\x8b\xb9\xd9\x1fN\x1d\x02\x0eo\x08\xe0\xb3\x8f>\xe0\xa7\xd3'W\x99\xe9\xda\xa3\x86U\xe6\xbb\x1e\x04\x1b<_\x1do|w\xee\x8f\xd9_\x0e\x01\x87\x1b\x8d\xc6_\x1b\x01\x98\x9a\xfe\xf4\xe3\x7f\xf5sl}\xf25\x00\xe2\xb7\xda\x81\xff\xdd\xd7\xf1?M\xf0K\xb9\xe8F\x89\xaf\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x06m\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x064IDATx^\xad\x97[lT\xc7\x1d\xc6\x7fs\xce\xd9\x8b\xbd\xf6\xfa\x16\xa0\xbe\x00\x0e\xb2ic$BJ!\x22\xa1-\x95b\xa5/\xeeKh+\x95\xa6U\xa5\xc6`U\xaa\xda\xb4\xaa\xfaV\x09U\xca\x03\x94'\xda\x07\x84\x14)\xad\xc4\x8b\xa5R\x83y\x08\xc5\x189\x0ei\xd3\x84\x9a\x9bcj\xec\xb2\x04\x1b;\xbb\xf6z\x8f\xbd\xbb\xde\xb3g\xa6\xc3h\x85\xe5rl\x88\xc9'}\xfa\x9f\x9d\x87\xfd~\xf3\x9f\x99s\x11J)\x82$\x84x\x05x\x9e\xc7kH)\xf5w\xd6(' \xb8C\xbb\x01h\x97R\xbe\xc6cdY\xd6\x07\x1a\xf6\xbb@\xb7\x069\xff\x14\x00&\xfc\xb7\xed\xf5\xe2`]DDn\xce\x89\x8a+W\xaeP]S\x8d@\x00\xa0P\x08e(A)f\xd3i^\xa9\x17/\xbc\xb4Nl;\xf1\x1f\xb9G\x83|[CL<M\x07\xf6\xff`\x8b\xdd,%\xf8J2<<Lee%+\xc9u]\x1e\xc0n\xa9\xb0\x22\x1b\xa2*r?\xa7\xea\x81\xb5\x03\x08-\x05H\xa1\x0d\xf4]\xbcH.\x97\xc3/\x16QJ\x91\xcf\xe7Y\x5c\x5c\xa4P(P\xd4c\xb5\xb5\xb5\x94\x01X\x80\xf8\x82\xf6\x80\x01\x006D\x05\x1f\x0f\xbcK>;\x8f\x85D\x952\xe2\xb6\xc4\xb6\x04!!p>Sl\x8c;\x80D*\x04\xf0\x9c\x10\x02\xe0\xcb@\x05P\x0f4`\xc4Hi\x9f$\x02\x01N\x9c8!\x00\x81\x05\xd2\x87\x96\x96g\x09em\x14\xe5(\xa5\xb4A\x08XW\x19%\xe2\xd8DB\x16\xc3\x13s\x5c\xbc=A\xf7X\x8e\x5c$\xbe\xa9\xbd}\xf7\xef-\xcbZ\xdc\xb1cGYUU\x95\xd3\xd8\xd8\x18~\xe0\x86\x86\x86\xd0\xa5K\x97\xdc\xae\xae\xae\x08\xf0\xd6\xaa\x1d\x00\x13DU,\xc2s\xd51\xf2\x9eO\xa1(\x91Ja\x09A\xd8\xb1\x88\x86l\xe6r\x05\x12\xa2\x8e?\x9f\xff+\x0dM\x1b\x01\x22\xc0f\x96\x84\xef\xfbx\x9eGuu\xb5\x9ePK\xf4\xea\xd5\xab\x87\x84\x10(\xa5\xdeZ\x11\xc0\xb2A\x00\xb6-\x90\xda\xb6\x148\x08\xa4\x12X\xc2\x8c\x1b\x8fL\xb9\xec{\xf5;\xd476\x11|/\xc1\x84g2\x19\xca\xcb\xcb\xcdf>v\xec\xd8&\xbd\x7f\x0e.A,\x01\xd0\xd9\xd9\xa9\x0e\x1d:\xa4l!\x08Y\x10\xb6-\x1c\xc7\xc6BP\xb4\xcd\x1a\x1b\x00\xc7\xb2\x888\x96\xae\x02`Yx\x10\xc0\xdc\xdc\x1c555\x06 \x1a\x8dr\xe4\xc8\x91\xcd\xc0\x03\x88\x1b\x1a\xa2\xc7b\xb9\xb0mt0f\x8d\xcb#6\xb1\xa8\xa3\xc7,2\x8b\x1e\x93\x99\x1cc\xa9y\xee\xcc.\xe8\xdfEr\xf9<\xab\xc8,A6\x9b5\xa7f\xe9\xffm\x0e\x1c8\xb0\x1e\xe8\x00X\x06\xa0\xb4t\x16\x8e\x0d\xe1\x90\xc0S\x8a\xb1\xa4\xcb\x8d\x8c\x83\xd3\xb2\x97\xa6}\xaf\xb3\xb5\xe3\x17\xac\xdb\xfb:\x0d/\xb4s\xfb\xce$\xfd\xfd\xfd$\x93I\x94R\xe6\xfa\xf8\xf1\xe3\xe8\xba\xac3\xe7\xce\x9d\xe3\xe8\xd1\xa3\x1c>|\x98\xde\xde^\x12\x89\x84\x04,\xa1\x15\xdc\x01\xed\xff\xce\xe6\xf8\xe7\x94Ok\xc7\xcf\xf8\xe6/\xdf&\xf6\xf57\x99|\xa6\x83k\xfe.\xae\xf1-dk\x17\xad{\x7fN^Vs\xfaog\xd1wM\xee\xdc\x9d\xe2\x1b\xafvr\xfd\xfau\x03\xa0gk\xd6?\x16\x8b\x99\xebx<\x8e\xe38%8\x04\xc0#\x00\x96%\x98\xcaA:\xde\xca\xfe\xdf\xbdM\xd5\xae\xd7(\x84b\x08\xdbBY\x82lAr\x7ff\x91O\xeef\x18\xb8\xear\xfa\x1fad\xd5^\xae\x8f\xdcg2\xd7\xc6\x85\x0f\xee\x9b\x00\xed\x87\xa1\xcd\xcd\xcd\xb4\xb5\xb5\x19755\xa1\xa1\x14 \x83\x1fF\x16\xdcq\x15\xdf\xff\xe9o\xa8l\xd8H\xe2\xec;L\x8f^\xc3\x89\x94\xb1\xb5y\x07\x9b[\xb6\xf3Iy%c\x09\x97\xcff\xf2\xdc\x9d\xce2\xa1\xed\x88\x0dL'\xe7\xd8\xb7+\xca\xfa%\x003{=k\xea\xea\xea\x00\xccu*\x952\x00J+\x10\xa0\xb9Zp\xe1\x9dc(,\xca\xe6\xc6\xd9\x10\x8fR\x94\x92{\xc3}$e\x05\xdb\xda\x7fLM\xdb\xcb|<\x9cf\xd2_\xc0\xcdx,\xcck/x \x00\xb5t:B\xa1\x90\x09-\xdd\xea\x1f\x8e\x01*\xf8>`\xc1\xc6\xb8\xa0P\x1c#\x1c\x8bS\xb7\xa5\x96\x92xv}\x05\xe9\xac\xc7h\xff\x9f\x98\xae\xbcL\xcb\xf6\x83\xb8\x0ba\xbc\x82\xa4X\x94x\xda!\xc7B-\xaa\x80\xe3i\xa0\x96\xd5\x15\x01\x00\xd6\xc7C\x84\xca#\xfc\xbfjc!\x9e\xa9\x0cs\xe1\xdf\x83\xec\xd9\xf9\x13\xca\xa3\x0e\xb92G\x03(\x03ak\x00\x16K!\xa5\x1c%0*\x15\xa4\x5c\x05@X\xa5*\xcc\xf5#\xfapl\x86\xf1Y\x8f\xef\xfd\xfa\x8f\xdc\xca\xd4\xe0D\x5c\xa2\x11\x1b\xcf\x93\x14=\x07\xd3\x01\xa5\x90R\xf2PjY\x01V\x05\x10\x08L\x0d\x04\x18\x9dv\xf9\xd5_\x86\x18\xbd\xb7\x80=\x93g\xd3\xba2\xf2y_\xbbh\xea\xce\xaf\xd4p\xf9\xdd\xe0%\x00\x9ex\x09L\xb8\x10<\xa2\xd6/U\xf2\x87\x1f>\xcf\xf5O3D\x1b\xb7\xb1\xf3\xc5\x97Y\x12\x5cN`\x8e\xdbS\x01(\xc0\x12%\x00m\xd4R}\xb1\xb5\x96\xdd[\xe2t\xbf\x97\xa5j\xf7W\xf9\xd1\x1bo\x10\xa0\xb5\x03\x98\xb57\xd5\xd8\x08\x01\xd2\xcbSpSx\xf33\x14\xb3i\x0a\x19\x1f%\xfd\xd5\x82\xd6\x08\xf0\xf0)\xe7\xe3\xe73\x14\xe6u\xa8\x0e\xd6\x00\xcb\xf7\x89\x10\xc13}\xfa\xd7r\x8c\xb2\x137\x03\xc7\x01\xb2\x1e\xfe\xad\x94\xcco\xf7DT\x03\xd8_p\x07\x08\x92\x09\xfd\xd7=?\xfd~B\xa6\xcf\xdf\xf6\xef\x02\xeev;\xfc\x92\x06\xa8\xe3s\xcau]\x1fpW\xed\x00@2\xab\x0a\x1f~*\xd3\xbd\xb7\xfc\xd4\xcdi9\x05\xf4\x03\x97th\xbf\x10\xa2\xd3\xb6\xed\xaf}\x9e%XXX\xf0\x07\x06\x06\xd2'O\x9e\x9c\x06\xba\x83\x00>\x1aI\xca\xad\xe3\xb3*\xd7;\xe2\xa7nL\xcb\xd1R\xe8Y\x1dt\x8b\x00=\x09\xc0\xd0\xd0\x90\xdb\xd3\xd3\x93\xd2N\xcf\xce\xce\x9e.\xbd\x1d\xdf\x08\x02\xe8\xee\xea)\x00\x8c\x04\x84\x06\x85\xaf\x08055U\xd0/\x22\xa9S\xa7N%\xc7\xc7\xc7/\x03g\x81~\x1d\xec\xae\xb8\x09K\xdfv\xdaO&\x85\x01@\x08@aZ\xfc\xde\xe0`\xba\xbb\xbb;\xa5\xdf\x8a\xcc$\xd0^\xeds\xcda\xed\x9aw3n\x11`p\xf0\xfdt___\xfa\xcc\x993\xa6\xc5\xa5\xd0\x8fx\x02\x89\xb5\x9ec!D\x18x\x13\xd8Ois\x06\xb4\xf8\xb1\xfa\x1f\xbd\xfa*_\xf2\xd8\x15\x9d\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x08\x19\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x04gAMA\x00\x00\xd6\xd8\xd4OX2\x00\x00\x00\x19tEXtSoftware\x00Adobe ImageReadyq\xc9e<\x00\x00\x07\xabIDATX\xc3\xadW[P\x93g\x1a\xf6\xca\xce\xec\xcc\xf6b/\xbc\xd9\xe9\xce\xecn\xbd\xda\xd9\x9b\xb5\xce\xba;{\xb0\xad\xccz\xb1\xce\xce:\xb3vTpu\xdb\xe2\x81\xd6\xb6T\x04\xbb\xa5 m\xc1\x82\x06\x08\x07QB\x80\x80\x80\x02!\x81\x10\x92@H\x10s$!gr\x80\x04B \x9c\x09G\xb5Tx\xf6\xfb~\x13\x160X\x8b}g\x9e\xf9/\x92\xfc\xcf\xfb>\xcf\xfb\xbe\xdf\x97]\x00v\xfd\x98 \xf1\x0b\x82\x14\x02\x03\xc1u\x82\x03\xcf\xfd\xfe\x8fH\xbc\x9b \xe1W\xaf\xef\xb5*\x8c\xd6e\xdb\x02`\x19\x1e[\x09'\xf13\xfa\x19\x81\x22\xfc\xdc>vH~\x8a\xa0\xb9\xb6Y\x1c2\xcf\xadB9\xfe\x1dD\xf6Q\xd8\xc7\xe6\xe8\x87\x86={\xf6XSR\xae,\xca::\x10N\xe2\xe5I\xc3\xc41\x04\xb7>I\xf9,`\x9b]YSM\x03M\xb6\x114\xeb\xfb 1y`\x19\x9d\xc5\xbb\xef\xbe?\xc5\xab\xbe\x83\xf1\x89)LO\xcf\xae\x92\xef\xd7\xbct\x02\x11\x9f\x0f\xbe\x1d\xe3\xb2\x04CO\xb43@\x8b{\x06\xcd=.4\xeb\xec\xa8W\xf6 \x87S\x852^5C\xbc\xb0\xf4\x90\x81\xc1`\x5c&\xbfK|\xe1\x04H\x1c$8A\xfd\xdd\xeas'\xf1\xb9'\x04H\x87\x97\xc1\xd7\xbb \x22U7\xdc7\xa2\xb8N\x88,V>\xccV\xdb:q\x04,\x16k,\xfc\xce\xe7'\x10\x916\x93\x95?F}\xa5\xfe\x12\xc4o\xf4Y1\xb6\x02~\xef Z{\x9c\xe0?0\xa1L(CF\x0e\x1b\xb2\x0e\xf9&\xd2\xf9\xc5e\xcc-,!4\xbf\x88\xbd{\xf7Z\xc9;~\xbam\x02$~C\x90F=5\x13iu\xb3\x80\xd2?\x0f\xcb\xc4\xe2\x9aP\xa1Z\xb4l\xf1Y\xa0\xb6\xa0\xa6]\x8d/\xb2sq\xb7\x9e\xff\x0c1%\x9d\x09\xcdcbj\x06\x83C\x81'\xe4\xdd\xbc-\xd3\xb0;\x92\x033&\xd4S\xb5\xd3\xfbXO\x88\xc5\x03!\x88,CP\xbaF\xd0\xed\x09B\xe5\x9bB\x9bs\xfc\xa9\xcfZ\x1b\xee*t\xc8\xbc\xc9E\x09\xa7l\x93\xcf\x9b\x88'\xa7\x11\x18\x1d\xc3\x80o\x08\xa2\xd6\xd6%\xc2Q\xdb(\x12\x87\xc6\x1f\xaf\x82/b\x94M\x89$\x90\x22\xeaR-\x9aB\xab\xe8\x18y\x04\xa1\xc5\xcf\x10St\xf6\x0d\xa3\xd3\xe1\x87\xd4<\x80\x16\xbd\x03\x0d]\x06\x14\xd5\x0a\x90\x91\x95\x0d/y\xf1\xc6\xaa\xa9\xd4\xb3s\x0bL\xc5\x94\xd8\xdd\xef\x85\xc9b\x05\xb7\xbc\x12\xa5\xe5\x95K\x13\xf3\xcb\xab#\x0f\x017\xd9\x11\xe6\xd9\x15\x84\x97\x15\x13\x06\xcb<\xd0h\xf2\xa3\xdd\xee_'\x96;\x86 \xb3x\xd7}\xe6\x08\xa4\xf8<3\x1b*\x8d6\xaa\xdcS3!\x8c\x8e\x8d3\x15\xd3&\xe47\x09\xf1\xc1\xc5\x8fQs\xaf\x01\xbee`\xfc\x11\xa0#\x13#\xf2\xce\xa1\xbe]\xb9\xb8Q\x01\x83\x81ttM\xa7\x1e\x0ag\x80\xa9\xb8\xdd\xea\x83\xd8\xe8B\x93\xca\xcc\xf8|\xe5\xcb,\x88\xda$Q\x89\xa7g\xe7\x18\x1b\x86\x86G`w8I\x82:$|\xf8!\xae\xb3\x0b\xe1\x99\x5c\x80o\x09\xd0\x90\xde\xe1\x0f,\x81\xab\x1f\xc4}\xef\x04\xdd\x07\x1da\xeb\xff\x9f\xc0\x1d\xb9\x16\x1d\xf6!H\xcc\xfdO}\xee\xd4\x22\x9dU\x84\xaa\x9a\xbaM>G\xe4\x8e\xf8<<\x12\x84\xd3\xdd\x0f\xbd\xc1\x88\xc2\xe2b\x9c~/\x1e=\x03\x01\xf4/\x02\x83\x84\xbc\xc5\xff-\xee:C(Q\x91\xf7\xf6\x05\xf1N\xdc\xbf}\x843i\xe3 \x18\xf43\xab\xe0\xc9Th58\xd1\xd8\xdd\x0b\x9eX\x89\xac\x5c\xf63>G\xaa\x9e\x9c\x9ee\xe4\xee\xf7\x0e\xa2\xd7lAC\x03\x1f'b\xe3 \xe9\xd6\xc0E\xcf\x01R\x90$\xb8\x86\xb2\x9e\x00n\xb4\xdbP\xd1\x1bD\x85\xce\x8bJ~\x0bm\xbe\x9b['\xd1\xa0\x99\xf8\x16e\x22\x05\xee)\xf4(\x13\xc8\x90x5\x0b\x1a\xad>\xaa\xdcc\x13\x93\xf0\x0d\x0d\xc3f\xef\x83\xb4]\x8e\xc4K\x97\x90\xc3\xca\xc3\xd4c\xc0NzI1N\xfa\x89\x94\x7f[;\x84|\x85\x13%j\x1fJ\xd5\x03\xe8\xf20\xa3(\x22\xf8\xf93\x09t\x8f.\xa1\xa8\xbe\x15\xa5|\x09\xb2J*\xf0\xcf\xe3qQ\xe5\xf6\x07F\xd1\xe7\xf2@\xab7 \xfdj\x06\x92\xbfH\x83\xcd7\x02'\xa9\xda@\x1aL\xe0{\x88R\x9d\x1fE\xdd\xfd\x0cqA\x97\x1b\xc5\xdd\x1e\x88\x9cA\xfc\xf9\xcd\xb7]\x84\xebl\xb4C\xd0(\xf7N#\xa7\xfc\x1e\xb2K\xab\xf1Q\xeaWH\xfeo\xea\xfaXQ\xb9G\x82\xe3\xf0\x0c\xf8`4\x99Q\xc9\xab\xc2\xfbg\xcfA\xfe@\x03?\xe9n\xb2\x8d\x19\xb9oi\x06\x19\xd2\x9b*/r\xe5\x0e\xe4u\xf6\xa1\xf0\xbe\x1b\x1c\x95\x1b\xf9\x9c\xca)\xc2S\xb8\xdd)\xdc+v\x04\x90Q\xc8\xc5\x95ky8\x11\x9f\x80\x9b\xb7n3c\x15\x91\xdbjs@\x22m\xc7\x85\x84\x0fPt\xbb\x0c\xf3+\x80\x9f4X\xf7$ \x1c|\x84J\xd3\x188\xfaa\x86\x9cV\xfdU\xb3\x1e\xac\x0e;\xb8:\x1f\xd9!\x1ez/\xe0\x13\xbc\xba]\x02&\xbe\xc1\x83\x94o\xd88\x9f\x9c\x8a\x03\x7f=\x04c\xaf\x99\xe9n*\xb7F\xd7\x83\xa4\xcb\xc9H\xff:\x8b\x8c\xd5<S\xb5q\xf6\xa9\xdc5\xf6i\x5c\x97Y\x19\xd9\xbfn!\xa7\xa0\xd4\x82t\xbe\x1aW\x9b4`\xc9\xcc\x10\xbb\x82\xf8\xe5\xaf_\xa7g\xc0;\xe1u\x1f5\xcc5\xddf|\x94\x96\x85\xb8s\x17\xf1\x97C1L\xd5t\x99\xf0\xaa\xaaq\xfa\xf4\x19h\xcc\x0e\x8c\x92-6\x14\x1e\xabZ\xc7\x0cx\xe6qp\x0d#L\xa3e\x8a\x0c\x8c\xec\xb4\xfa\x9c\xb6^\x94t9\xd0f\xf7\xaf\x1e=\x11KG.o\xc3y\x135,\x5c\x99\x1a\xf1\x97>\xc7\xd1\xd83\xf881\x09\x86^\x13\x1a\x9b\x04\xf8\xdd\x1b\xfbQO\xd4\xf1\x90\x99\xee\x9a\x00\xaa\xad\x93`+]\x0c9\xf5\xbc\xf0\xbeg\xbd\xea\xcc\x16=JU\x1e\x08m\x01\x94\xd4\xf1C\xe1eS@\xf0\xca\xf7%`+nj\xc7\xa9\x84D\xc4\x1c9\x8a\xdc|6ZZ\xc58\x14\x13\x83/95\xc8\x14j\x98\xe6\xa2\xd5\xd2'\xf5\x9azL\x13\xa1Id\xb7\x99\x90\xdbnF\xb9\xda\x8d\x06\xa5v9,9=\xf9N\x13\xec\xd9r\xd4G\x0d;\xabF\x88c\xff9\x8f\xdf\xee\xfb=\x1a\xf9\x02\x9c\xbf\x90\x80\x93\xf1\x17p\xa3\xad\x07\x19\xc4OJ\x14\xe9n\xbaX\xa8\xef,\xfa\x94\x98P(\xb7@\xe9\x0e<\xf9W\xec)*w-\xc1g\x04\xfb\xb6\xb9\xe4D\x8d\xbe\xcc\xb2Z\xfc\xe3\xe4\x19\x1c<\xf47\xb0r\xf3\xb0\xef\xc0\x1fP \xd1!\x89'e*\xa6K\x85>\xbf!\xd5F\xe4.\x90[!\xb0\x0c\xae\xe5\xdc\xe2\xd2\x11\x13\x13\xe4\x87o<\xaf<\xe7\x96\x155\x9ciE\xe5\xf8\xfb\xb1X\x1c?\x19\x877\xf6\xef\xc7\x8d:\x11\x92\xab\xa4\x0c!\xedp\xea5U!\x8b4[\xc9\x037*4n\xd4I:\x17\xc3rs\x08\x8em\x95\xfb\x87$\xe0Jesp\xe4\xf8)\x1c>|\x98\x8cc.2\x05*\x5c\x22\xd5\xd3]~M\xdc\x0b6\xe9tv\xa7\x1dw\x8c\xe4\x88\xb6\xf9\x9e\x84\xb7\x1a\x95\xfb\x22\xbdI\xfd\x80\x0bm\xf4\x042JxL\x0f\x9cKI\xc3\xb5\xa6.|\xc2me6Y\xf1\x83\x01\x5c\x97\x9a\xc1Q{ \xf3\x04\xd7\xce%&\x056\xc8\xfd\xc7\x9d\xc8\x1d\xd5\x82\xdc\x1a\x01\xce^NE\x81X\x85x\xf6]\x5c\xa9U\x90\xaa\xfb\xc0\x96\xdbP\xadu\xe3\xaeTA/\x10\xca\x0dr\xbf\xba\xd3j\xa3\x05\xb7\xa2Q\xf8\x1d\xafC\x8dO\xb9-\x88\xcb\xe6\xe1\x9aH\x8f\xaa\x1e/\x9a5\xe6\xc7\x7fz\xf3-Wx\xac\xa8\xdc\xaf\xbd\xac\xdc\xd1\xe2\x08\xdd\x05\x5cu\x1f\xde\xcb\xafE\xb9v\x002g`\xf5\xc2\xa7\x97\xa9\xdc\xf7\x08\xd2\xa9\xdc;\xf8\x03\xf3\xc2\xf1\x13\x82\xca\x1c\xee\x9dP\x0b9\x94\xb8\x0d\xc2\xc8\x16\xa3\x17\x87\xc3/\x22\xf7\x0e\xff\xdam\x8a\xdda\x99\xd5\x1b\xb6\xd8k\xbb^2\xbe/\x89\xff\x01f\xb9_\xfc\x11\x80=\xcf\x00\x00\x00\x00IEND\xaeB`\x82"
-qt_resource_name = "\x00\x06\x07\x03}\xc3\x00i\x00m\x00a\x00g\x00e\x00s\x00\x07\x04\xcaW\xa7\x00n\x00e\x00w\x00.\x00p\x00n\x00g\x00\x08\x06|Z\x07\x00c\x00o\x00p\x00y\x00.\x00p\x00n\x00g\x00\x07\x0a\xc7W\x87\x00c\x00u\x00t\x00.\x00p\x00n\x00g\x00\x08\x08\xc8Xg\x00s\x00a\x00v\x00e\x00.\x00p\x00n\x00g\x00\x09\x0a\xa8\xbaG\x00p\x00a\x00s\x00t\x00e\x00.\x00p\x00n\x00g\x00\x08\x06\xc1Y\x87\x00o\x00p\x00e\x00n\x00.\x00p\x00n\x00g"
-qt_resource_struct = "\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x03X\x00\x00\x00~\x00\x00\x00\x00\x00\x01\x00\x00\x18\xdd\x00\x00\x00P\x00\x00\x00\x00\x00\x01\x00\x00\x0d\xc5\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x00\x12l\x00\x00\x00<\x00\x00\x00\x00\x00\x01\x00\x00\x08\x96"
 def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+    for group in GROUPS:
+        load(group)
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-qInitResources()
+def qCleanupResources():
+    for module in _loaded.values():
+        module.qCleanupResources()
+    _loaded.clear()
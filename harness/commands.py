@@ -0,0 +1,219 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Headless harness commands: list, time and replay plugin commands
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from . import sublime, sublime_plugin
+from .environment import Harness, HarnessError
+from .session import Session, report
+
+ANSWERS = ('quick_panel', 'input_panel', 'dialog')
+
+
+def _pair(text):
+    """Parse a NAME=JSON argument, plain strings need no quotes"""
+
+    name, _, value = text.partition('=')
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def _harness(args, settings=None, folders=None):
+    """Return a loaded Harness for the common arguments"""
+
+    settings = dict(settings or {})
+    settings.update(dict(_pair(item) for item in args.set))
+    harness = Harness(
+        settings, folders or [os.path.abspath(folder)
+                              for folder in args.folder],
+        time_scale=args.time_scale, timeout=args.timeout)
+    harness.load()
+    return harness
+
+
+def _common(parser):
+    parser.add_argument('--set', action='append', default=[],
+                        metavar='NAME=JSON', help='override a setting')
+    parser.add_argument('--folder', action='append', default=[],
+                        help='project folder of the window')
+    parser.add_argument('--time-scale', dest='time_scale', type=float,
+                        default=1.0,
+                        help='multiply set_timeout delays (0 skips them)')
+    parser.add_argument('--timeout', type=float, default=60,
+                        help='seconds a command may take')
+
+
+class CommandsCommand(object):
+    """
+    List the commands of the plugin
+    """
+
+    name = 'commands'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='list the plugin commands')
+        _common(parser)
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        harness = _harness(args)
+        try:
+            for kind, name in sublime_plugin.command_names():
+                print('{0:<12} {1}'.format(kind, name))
+        finally:
+            harness.close()
+
+        return 0
+
+
+class RunCommand(object):
+    """
+    Run a plugin command and time it, text commands run on --file
+    """
+
+    name = 'run'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='run and time a plugin command')
+        parser.add_argument('command', help='command name (compile_ui)')
+        parser.add_argument('--args', default=None,
+                            help='JSON object with the command arguments')
+        parser.add_argument('--file', default=None,
+                            help='file opened before running the command')
+        parser.add_argument('--answer', action='append', default=[],
+                            metavar='KIND=JSON',
+                            help='answer of a quick_panel, input_panel or '
+                            'dialog, in order')
+        parser.add_argument('-n', '--repeat', type=int, default=1)
+        parser.add_argument('--record', default=None,
+                            help='write the session to this file')
+        _common(parser)
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        answers = [_pair(item) for item in args.answer]
+        for kind, _ in answers:
+            if kind not in ANSWERS:
+                sys.stderr.write('unknown answer kind {0}\n'.format(kind))
+                return 2
+
+        command_args = json.loads(args.args) if args.args else None
+        harness = _harness(args)
+        try:
+            session = harness.record() if args.record else None
+            view = harness.open_file(args.file) if args.file else None
+            names = sublime_plugin.command_names()
+            if args.command not in [name for _, name in names]:
+                sys.stderr.write('unknown command {0}\n'.format(args.command))
+                return 2
+
+            text = ('text', args.command) in names
+            if text and view is None:
+                sys.stderr.write('{0} is a text command, use --file\n'.format(
+                    args.command))
+                return 2
+
+            times = []
+            for _ in range(args.repeat):
+                for kind, value in answers:
+                    harness.answer(kind, value)
+                if text:
+                    times.append(harness.run_text_command(
+                        view, args.command, command_args))
+                else:
+                    times.append(harness.run_window_command(
+                        args.command, command_args))
+
+            for kind, message in sublime.messages:
+                print('[{0}] {1}'.format(kind, message))
+
+            print('{0}: best {1:.3f}s, mean {2:.3f}s over {3} runs'.format(
+                args.command, min(times), sum(times) / len(times),
+                len(times)))
+
+            if session is not None:
+                session.save(args.record)
+        except HarnessError as error:
+            sys.stderr.write('{0}: {1}\n'.format(args.command, error))
+            return 1
+        finally:
+            harness.close()
+
+        return 0
+
+
+class ReplayCommand(object):
+    """
+    Replay a recorded session and compare its step times
+    """
+
+    name = 'replay'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='replay a recorded session')
+        parser.add_argument('session', help='session file')
+        parser.add_argument('-n', '--repeat', type=int, default=1)
+        _common(parser)
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        try:
+            session = Session.load(args.session)
+        except (IOError, OSError, ValueError) as error:
+            sys.stderr.write('{0}\n'.format(error))
+            return 2
+
+        for number in range(args.repeat):
+            harness = _harness(args, session.settings, session.folders)
+            try:
+                results = session.replay(harness)
+            except HarnessError as error:
+                sys.stderr.write('{0}\n'.format(error))
+                return 1
+            finally:
+                harness.close()
+
+            if args.repeat > 1:
+                print('run {0}'.format(number + 1))
+            print('\n'.join(report(results)))
+
+        return 0
+
+
+COMMANDS = (CommandsCommand, RunCommand, ReplayCommand)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m harness',
+        description='Run SublimePySide commands without Sublime Text')
+    subparsers = parser.add_subparsers(dest='command')
+    for command in COMMANDS:
+        command.register(subparsers)
+
+    args = parser.parse_args(argv)
+    if getattr(args, 'run', None) is None:
+        parser.print_help()
+        return 2
+
+    return args.run(args)
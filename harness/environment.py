@@ -0,0 +1,292 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Run the plugin commands in plain python
+
+A Harness installs the stand-in sublime and sublime_plugin modules, lays
+out a temporary Packages directory with the package linked into it and
+imports the plugin from there like Sublime Text does. Commands are run
+to completion: run_window_command and run_text_command return once every
+queued set_timeout callback, every thread the command started and every
+Qt tool job are done.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import importlib
+import threading
+
+from . import sublime, sublime_plugin
+from .session import Session
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXECUTABLE = '#!/bin/sh\nexit 0\n'
+
+
+class HarnessError(Exception):
+    """Raised when a command does not finish in time"""
+
+
+def _insert(view, point, text):
+    """Insert text in view in its own edit"""
+
+    edit = view.begin_edit()
+    view.insert(edit, point, text)
+    view.end_edit(edit)
+
+
+class Harness(object):
+    """
+    A headless Sublime Text session with the plugin loaded
+
+    settings overlay the package settings, folders are the project folders
+    of the window and time_scale multiplies every set_timeout delay (0
+    runs debounced callbacks right away)
+    """
+
+    def __init__(self, settings=None, folders=None, package='PySide',
+                 package_dir=PACKAGE_DIR, module='sublime_pyside',
+                 time_scale=1.0, timeout=60):
+        super(Harness, self).__init__()
+
+        self.package = package
+        self.package_dir = package_dir
+        self.module_name = module
+        self.timeout = timeout
+        self.module = None
+        self.session = None
+        self.answers = []
+        self.root = tempfile.mkdtemp(prefix='sublimepyside-harness-')
+        self.packages_path = os.path.join(self.root, 'Packages')
+
+        os.makedirs(os.path.join(self.packages_path, 'User'))
+        os.symlink(os.path.abspath(package_dir),
+                   os.path.join(self.packages_path, package))
+
+        executable = os.path.join(self.root, 'bin', 'sublime_text')
+        os.makedirs(os.path.dirname(executable))
+        with open(executable, 'w') as fhandler:
+            fhandler.write(EXECUTABLE)
+        os.chmod(executable, 0o755)
+
+        sublime_plugin.reset()
+        sublime.reset(
+            version='3211' if sys.version_info >= (3, 3) else '2221',
+            packages_path=self.packages_path,
+            installed_packages_path=os.path.join(
+                self.root, 'Installed Packages'),
+            cache_path=os.path.join(self.root, 'Cache'),
+            executable_path=executable, time_scale=time_scale
+        )
+        sys.modules['sublime'] = sublime
+        sys.modules['sublime_plugin'] = sublime_plugin
+
+        self.window = sublime.active_window()
+        self.window.set_folders(folders or [])
+        self.settings = dict(settings or {})
+        self.settings_name = 'SublimePySide.sublime-settings'
+        for name, value in self.settings.items():
+            sublime.load_settings(self.settings_name).set(name, value)
+
+        sublime.observers.append(self._observe)
+
+    def load(self):
+        """Import the plugin and register its commands, returns it"""
+
+        if sys.version_info >= (3, 3):
+            sys.path.insert(0, self.packages_path)
+            name = '{0}.{1}'.format(self.package, self.module_name)
+        else:
+            sys.path.insert(0, os.path.join(self.packages_path, self.package))
+            name = self.module_name
+
+        self.module = importlib.import_module(name)
+        sublime_plugin.load_module(self.module)
+        if sys.version_info >= (3, 3) and hasattr(
+                self.module, 'plugin_loaded'):
+            self.module.plugin_loaded()
+
+        self.wait()
+        return self.module
+
+    def close(self):
+        """Unload the plugin and remove the temporary directories"""
+
+        if self.module is not None:
+            unloaded = getattr(self.module, 'plugin_unloaded', None)
+            if unloaded is not None:
+                unloaded()
+            sublime_plugin.unload_module(self.module)
+
+            prefix = self.module.__name__.rpartition('.')[0]
+            for name in list(sys.modules):
+                if name == self.module.__name__ or (
+                        prefix and name.startswith(prefix + '.')) or (
+                        prefix and name == prefix):
+                    del sys.modules[name]
+
+            for path in (self.packages_path,
+                         os.path.join(self.packages_path, self.package)):
+                if path in sys.path:
+                    sys.path.remove(path)
+            self.module = None
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self):
+        self.load()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def busy(self):
+        """Return True while the plugin has Qt tool jobs queued or running
+        """
+
+        queue = getattr(self.module, 'job_queue', None)
+        return queue is not None and len(queue.jobs()) > 0
+
+    def wait(self, threads=()):
+        """Run the queued callbacks until nothing is pending, none of the
+        given threads is alive and the plugin is not busy
+        """
+
+        deadline = time.time() + self.timeout
+        while True:
+            ran = sublime.run_timeouts()
+            alive = [thread for thread in threads if thread.is_alive()]
+            due = sublime.next_timeout()
+            if not ran and not alive and due is None and not self.busy():
+                return
+
+            if time.time() > deadline:
+                raise HarnessError('still running after {0}s'.format(
+                    self.timeout))
+
+            if not ran:
+                delay = 0.001 if due is None else due - time.time()
+                time.sleep(min(max(delay, 0), 0.01))
+
+    def record(self):
+        """Start recording the session, returns the Session the following
+        steps are added to
+        """
+
+        self.session = Session(
+            settings=self.settings, folders=self.window.folders())
+        return self.session
+
+    def stop(self):
+        """Stop recording, returns the recorded Session"""
+
+        session, self.session = self.session, None
+        return session
+
+    def _observe(self, event, details):
+        """Collect the panel and dialog answers of the running step"""
+
+        if event == 'quick_panel':
+            self.answers.append(['quick_panel', details['picked']])
+        elif event == 'input_panel':
+            self.answers.append(['input_panel', details['text']])
+        elif event == 'dialog':
+            self.answers.append(['dialog', details['answer']])
+
+    def _run(self, run, step):
+        """Run a step to completion, returns the seconds it took"""
+
+        before = set(threading.enumerate())
+        del self.answers[:]
+        started = time.time()
+        run()
+        self.wait([thread for thread in threading.enumerate()
+                   if thread not in before and not thread.daemon])
+        elapsed = time.time() - started
+
+        if self.session is not None:
+            step['answers'] = list(self.answers)
+            step['elapsed'] = elapsed
+            self.session.add(step)
+
+        return elapsed
+
+    def view_index(self, view):
+        """Return the index of view in the window views"""
+
+        return self.window.views().index(view)
+
+    def run_window_command(self, command, args=None):
+        """Run a window command to completion, returns the seconds it took
+        """
+
+        return self._run(lambda: self.window.run_command(command, args), {
+            'action': 'window_command', 'command': command, 'args': args})
+
+    def run_text_command(self, view, command, args=None):
+        """Run a text command in view to completion, returns the seconds it
+        took
+        """
+
+        return self._run(lambda: view.run_command(command, args), {
+            'action': 'text_command', 'view': self.view_index(view),
+            'command': command, 'args': args})
+
+    def open_file(self, file_name):
+        """Open file_name in the window"""
+
+        file_name = os.path.abspath(file_name)
+        self._run(lambda: self.window.open_file(file_name), {
+            'action': 'open_file', 'file': file_name})
+        return self.window.find_open_file(file_name)
+
+    def new_file(self, text=u'', name=u''):
+        """Open a new buffer with text in the window"""
+
+        def run():
+            view = self.window.new_file()
+            view.set_name(name)
+            if text:
+                _insert(view, 0, text)
+
+        self._run(run, {'action': 'new_file', 'text': text, 'name': name})
+        return self.window.active_view()
+
+    def insert(self, view, point, text):
+        """Type text at point in view"""
+
+        self._run(lambda: _insert(view, point, text), {
+            'action': 'insert', 'view': self.view_index(view),
+            'point': point, 'text': text})
+
+    def save(self, view):
+        """Save view to its file"""
+
+        self._run(view.save, {
+            'action': 'save', 'view': self.view_index(view)})
+
+    def answer(self, kind, value):
+        """Queue the answer of the next quick_panel (picked index),
+        input_panel (text, None cancels) or dialog (bool)
+        """
+
+        sublime.responses.append((kind, value))
+
+    def messages(self, kind=None):
+        """Return the status, error, message and dialog texts shown"""
+
+        return [text for message_kind, text in sublime.messages
+                if kind is None or message_kind == kind]
+
+    def panel(self, name):
+        """Return the text of an output panel, None if it was never used"""
+
+        view = self.window.find_output_panel(name)
+        return view.text if view is not None else None
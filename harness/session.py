@@ -0,0 +1,148 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Recorded harness sessions
+
+A session file is JSON lines: a header with the settings and the project
+folders of the session followed by one step per line (new_file,
+open_file, insert, save, window_command and text_command). Every step
+keeps the panel and dialog answers it consumed and the seconds it took,
+a replay queues the same answers and times every step again.
+"""
+
+import json
+import time
+
+ACTIONS = (
+    'new_file', 'open_file', 'insert', 'save', 'window_command',
+    'text_command'
+)
+
+
+class Session(object):
+    """
+    The steps of a recorded harness session
+    """
+
+    def __init__(self, steps=None, settings=None, folders=None):
+        super(Session, self).__init__()
+
+        self.steps = list(steps or [])
+        self.settings = dict(settings or {})
+        self.folders = list(folders or [])
+
+    def add(self, step):
+        """Append a step"""
+
+        self.steps.append(step)
+
+    def save(self, filename):
+        """Write the session to filename"""
+
+        with open(filename, 'w') as fhandler:
+            fhandler.write(json.dumps(
+                {'settings': self.settings, 'folders': self.folders},
+                sort_keys=True) + '\n')
+            for step in self.steps:
+                fhandler.write(json.dumps(step, sort_keys=True) + '\n')
+
+    @classmethod
+    def load(cls, filename):
+        """Read a session file"""
+
+        with open(filename, 'r') as fhandler:
+            lines = [line for line in fhandler.read().split('\n')
+                     if line.strip()]
+
+        if not lines:
+            raise ValueError('{0}: empty session'.format(filename))
+
+        header = json.loads(lines[0])
+        steps = [json.loads(line) for line in lines[1:]]
+        for number, step in enumerate(steps, 2):
+            if step.get('action') not in ACTIONS:
+                raise ValueError('{0}:{1}: unknown action {2}'.format(
+                    filename, number, step.get('action')))
+
+        return cls(steps, header.get('settings'), header.get('folders'))
+
+    def replay(self, harness):
+        """Run every step in harness, returns a list of (step, seconds)"""
+
+        results = []
+        for step in self.steps:
+            for kind, value in step.get('answers', []):
+                harness.answer(kind, value)
+
+            action = step['action']
+            view = None
+            if 'view' in step:
+                view = harness.window.views()[step['view']]
+
+            if action == 'new_file':
+                elapsed = _timed(harness.new_file, step['text'], step['name'])
+            elif action == 'open_file':
+                elapsed = _timed(harness.open_file, step['file'])
+            elif action == 'insert':
+                elapsed = _timed(
+                    harness.insert, view, step['point'], step['text'])
+            elif action == 'save':
+                elapsed = _timed(harness.save, view)
+            elif action == 'window_command':
+                elapsed = harness.run_window_command(
+                    step['command'], step.get('args'))
+            else:
+                elapsed = harness.run_text_command(
+                    view, step['command'], step.get('args'))
+
+            results.append((step, elapsed))
+
+        return results
+
+
+def _timed(function, *args):
+    """Call function, returns the seconds it took"""
+
+    started = time.time()
+    function(*args)
+    return time.time() - started
+
+
+def describe(step):
+    """Return a short description of a step"""
+
+    action = step['action']
+    if action.endswith('_command'):
+        return '{0} {1}'.format(step['command'], json.dumps(
+            step.get('args') or {}, sort_keys=True))
+
+    if action == 'open_file':
+        return 'open_file {0}'.format(step['file'])
+
+    if action == 'insert':
+        return 'insert {0} characters'.format(len(step['text']))
+
+    return action
+
+
+def report(results):
+    """Return the report lines of replay results, the recorded time of
+    every step next to the replayed one
+    """
+
+    lines = ['{0:>10} {1:>10}  {2}'.format('recorded', 'replayed', 'step')]
+    for step, elapsed in results:
+        recorded = step.get('elapsed')
+        lines.append('{0:>10} {1:>9.3f}s  {2}'.format(
+            '-' if recorded is None else '{0:.3f}s'.format(recorded),
+            elapsed, describe(step)))
+
+    lines.append('{0:>10} {1:>9.3f}s  total'.format(
+        '{0:.3f}s'.format(sum(step.get('elapsed') or 0
+                              for step, _ in results)),
+        sum(elapsed for _, elapsed in results)))
+
+    return lines
@@ -0,0 +1,670 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Stand-in for the Sublime Text sublime module
+
+Views are plain text buffers, windows hold views and output panels and
+set_timeout callbacks are queued until the harness runs them (see
+harness.environment). Quick panels, input panels and dialogs take their
+answers from the responses queue, they are cancelled when it is empty.
+"""
+
+import os
+import re
+import json
+import time
+import heapq
+import itertools
+import threading
+from collections import deque, OrderedDict
+
+try:
+    from ..builder.settings import decode_settings
+except (ImportError, ValueError):
+    from builder.settings import decode_settings
+
+LITERAL = 1
+IGNORECASE = 2
+
+_lock = threading.RLock()
+_ids = itertools.count(1)
+_sequence = itertools.count()
+
+state = {
+    'version': '3211',
+    'platform': 'linux',
+    'arch': 'x64',
+    'packages_path': '',
+    'installed_packages_path': '',
+    'cache_path': '',
+    'executable_path': '',
+    'time_scale': 1.0
+}
+
+windows_list = []
+settings_files = {}
+timeouts = []
+responses = deque()
+messages = []
+observers = []
+
+
+def reset(**options):
+    """Forget every window, setting, pending timeout, response and
+    message, options update the paths and the platform
+    """
+
+    with _lock:
+        del windows_list[:]
+        settings_files.clear()
+        del timeouts[:]
+        responses.clear()
+        del messages[:]
+        del observers[:]
+        state.update(options)
+
+
+def notify(event, **details):
+    """Report an event (answered panels and dialogs) to the observers"""
+
+    for observer in list(observers):
+        observer(event, details)
+
+
+class Region(object):
+    """A range of the buffer, a is where it starts and b where it ends"""
+
+    def __init__(self, a, b=None):
+        if b is None:
+            b = a
+
+        self.a = a
+        self.b = b
+
+    def begin(self):
+        return min(self.a, self.b)
+
+    def end(self):
+        return max(self.a, self.b)
+
+    def size(self):
+        return abs(self.b - self.a)
+
+    def empty(self):
+        return self.a == self.b
+
+    def contains(self, x):
+        if isinstance(x, Region):
+            return self.begin() <= x.begin() and x.end() <= self.end()
+
+        return self.begin() <= x <= self.end()
+
+    def cover(self, region):
+        return Region(min(self.begin(), region.begin()),
+                      max(self.end(), region.end()))
+
+    def intersects(self, region):
+        return (self.begin() < region.end() and
+                region.begin() < self.end())
+
+    def __len__(self):
+        return self.size()
+
+    def __eq__(self, other):
+        return (isinstance(other, Region) and
+                (self.a, self.b) == (other.a, other.b))
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.a, self.b))
+
+    def __repr__(self):
+        return '({0}, {1})'.format(self.a, self.b)
+
+
+class Selection(object):
+    """The regions selected in a view"""
+
+    def __init__(self):
+        self.regions = [Region(0)]
+
+    def add(self, region):
+        if isinstance(region, int):
+            region = Region(region)
+        self.regions.append(region)
+        self.regions.sort(key=lambda item: (item.begin(), item.end()))
+
+    def clear(self):
+        del self.regions[:]
+
+    def __iter__(self):
+        return iter(list(self.regions))
+
+    def __len__(self):
+        return len(self.regions)
+
+    def __getitem__(self, index):
+        return self.regions[index]
+
+
+class Settings(object):
+    """A settings object, change callbacks run on every set and erase"""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.callbacks = OrderedDict()
+
+    def get(self, name, default=None):
+        return self.values.get(name, default)
+
+    def has(self, name):
+        return name in self.values
+
+    def set(self, name, value):
+        self.values[name] = value
+        self._changed()
+
+    def erase(self, name):
+        self.values.pop(name, None)
+        self._changed()
+
+    def add_on_change(self, key, callback):
+        self.callbacks[key] = callback
+
+    def clear_on_change(self, key):
+        self.callbacks.pop(key, None)
+
+    def _changed(self):
+        for callback in list(self.callbacks.values()):
+            callback()
+
+
+class Edit(object):
+    """The edit token given to text commands"""
+
+    def __init__(self, view, command=None):
+        self.view = view
+        self.command = command
+
+
+class View(object):
+    """
+    A text buffer with the view operations the plugins use, every change
+    bumps change_count and fires on_modified
+    """
+
+    def __init__(self, window, text=u'', file_name=None, name=u'',
+                 panel=None):
+        self._id = next(_ids)
+        self._window = window
+        self.text = text
+        self._file_name = file_name
+        self._name = name
+        self.panel = panel
+        self.changes = 0
+        self.saved_changes = 0
+        self.read_only = False
+        self.scratch = False
+        self.status = {}
+        self.selection = Selection()
+        self.view_settings = Settings()
+        self.shown = None
+        self.edits = 0
+
+    def id(self):
+        return self._id
+
+    def buffer_id(self):
+        return self._id
+
+    def window(self):
+        return self._window
+
+    def file_name(self):
+        return self._file_name
+
+    def name(self):
+        return self._name
+
+    def set_name(self, name):
+        self._name = name
+
+    def is_loading(self):
+        return False
+
+    def is_dirty(self):
+        return self.changes != self.saved_changes
+
+    def is_read_only(self):
+        return self.read_only
+
+    def set_read_only(self, value):
+        self.read_only = bool(value)
+
+    def is_scratch(self):
+        return self.scratch
+
+    def set_scratch(self, value):
+        self.scratch = bool(value)
+
+    def settings(self):
+        return self.view_settings
+
+    def set_syntax_file(self, syntax):
+        self.view_settings.set('syntax', syntax)
+
+    def encoding(self):
+        return 'UTF-8'
+
+    def line_endings(self):
+        return 'Unix'
+
+    def size(self):
+        return len(self.text)
+
+    def change_count(self):
+        return self.changes
+
+    def substr(self, x):
+        if isinstance(x, Region):
+            return self.text[x.begin():x.end()]
+
+        return self.text[x:x + 1]
+
+    def begin_edit(self, *args):
+        self.edits += 1
+        return Edit(self, args[1] if len(args) > 1 else None)
+
+    def end_edit(self, edit):
+        self.edits = max(0, self.edits - 1)
+
+    def _splice(self, begin, end, text):
+        if self.read_only:
+            return 0
+
+        self.text = self.text[:begin] + text + self.text[end:]
+        self.changes += 1
+        _plugin().fire('on_modified', self)
+        return len(text)
+
+    def insert(self, edit, point, text):
+        return self._splice(point, point, text)
+
+    def erase(self, edit, region):
+        self._splice(region.begin(), region.end(), u'')
+
+    def replace(self, edit, region, text):
+        self._splice(region.begin(), region.end(), text)
+
+    def _compile(self, pattern, flags):
+        if flags & LITERAL:
+            pattern = re.escape(pattern)
+
+        return re.compile(pattern, re.MULTILINE | (
+            re.IGNORECASE if flags & IGNORECASE else 0))
+
+    def find(self, pattern, start_point, flags=0):
+        match = self._compile(pattern, flags).search(self.text, start_point)
+        if match is None:
+            return Region(-1, -1)
+
+        return Region(match.start(), match.end())
+
+    def find_all(self, pattern, flags=0, fmt=None, extractions=None):
+        regions = []
+        for match in self._compile(pattern, flags).finditer(self.text):
+            regions.append(Region(match.start(), match.end()))
+            if fmt is not None and extractions is not None:
+                extractions.append(match.expand(fmt))
+
+        return regions
+
+    def line(self, x):
+        point = x.begin() if isinstance(x, Region) else x
+        begin = self.text.rfind('\n', 0, point) + 1
+        end = self.text.find('\n', point)
+        if isinstance(x, Region) and x.end() > point:
+            end = self.text.find('\n', x.end())
+
+        return Region(begin, len(self.text) if end == -1 else end)
+
+    def full_line(self, x):
+        region = self.line(x)
+        return Region(region.a, min(region.b + 1, len(self.text)))
+
+    def lines(self, region):
+        lines, point = [], region.begin()
+        while True:
+            line = self.line(point)
+            lines.append(line)
+            if line.b >= region.end() or line.b >= len(self.text):
+                return lines
+            point = line.b + 1
+
+    def split_by_newlines(self, region):
+        return [Region(max(line.a, region.begin()), min(line.b, region.end()))
+                for line in self.lines(region)]
+
+    def rowcol(self, point):
+        row = self.text.count('\n', 0, point)
+        return row, point - (self.text.rfind('\n', 0, point) + 1)
+
+    def text_point(self, row, col):
+        point = 0
+        for _ in range(row):
+            point = self.text.find('\n', point) + 1
+        return point + col
+
+    def sel(self):
+        return self.selection
+
+    def show(self, x, show_surrounds=True):
+        self.shown = x
+
+    def show_at_center(self, x):
+        self.shown = x
+
+    def set_status(self, key, value):
+        self.status[key] = value
+
+    def get_status(self, key):
+        return self.status.get(key, '')
+
+    def erase_status(self, key):
+        self.status.pop(key, None)
+
+    def run_command(self, cmd, args=None):
+        return _plugin().run_text_command(self, cmd, args)
+
+    def save(self):
+        """Write the buffer to its file (not part of the real API)"""
+
+        _plugin().fire('on_pre_save', self)
+        with open(self._file_name, 'wb') as fhandler:
+            fhandler.write(self.text.encode('utf-8'))
+        self.saved_changes = self.changes
+        _plugin().fire('on_post_save', self)
+
+    def close(self):
+        """Close the view (not part of the real API)"""
+
+        if self._window is not None and self in self._window.view_list:
+            self._window.view_list.remove(self)
+            _plugin().fire('on_close', self)
+
+    def __repr__(self):
+        return '<View {0} {1}>'.format(
+            self._id, self._file_name or self._name or 'untitled')
+
+
+class Window(object):
+    """
+    A window with views, output panels and project folders, panels and
+    dialogs are answered from the responses queue
+    """
+
+    def __init__(self, folders=None):
+        self._id = next(_ids)
+        self.view_list = []
+        self.active = None
+        self.panels = OrderedDict()
+        self.panel = None
+        self.folder_list = list(folders or [])
+
+    def id(self):
+        return self._id
+
+    def views(self):
+        return list(self.view_list)
+
+    def active_view(self):
+        return self.active
+
+    def focus_view(self, view):
+        if view in self.view_list:
+            self.active = view
+            _plugin().fire('on_activated', view)
+
+    def new_file(self):
+        view = View(self)
+        self.view_list.append(view)
+        self.active = view
+        _plugin().fire('on_new', view)
+        return view
+
+    def open_file(self, file_name, flags=0):
+        file_name = os.path.abspath(file_name)
+        view = self.find_open_file(file_name)
+        if view is None:
+            text = u''
+            if os.path.exists(file_name):
+                with open(file_name, 'rb') as fhandler:
+                    text = fhandler.read().decode('utf-8')
+            view = View(self, text, file_name)
+            self.view_list.append(view)
+            _plugin().fire('on_load', view)
+
+        self.focus_view(view)
+        return view
+
+    def find_open_file(self, file_name):
+        for view in self.view_list:
+            if view.file_name() == file_name:
+                return view
+
+        return None
+
+    def folders(self):
+        return list(self.folder_list)
+
+    def set_folders(self, folders):
+        """Set the project folders (not part of the real API)"""
+
+        self.folder_list = list(folders)
+
+    def project_file_name(self):
+        return None
+
+    def get_output_panel(self, name):
+        view = self.panels.get(name)
+        if view is None:
+            view = self.panels[name] = View(self, panel=name)
+
+        return view
+
+    create_output_panel = get_output_panel
+
+    def find_output_panel(self, name):
+        return self.panels.get(name)
+
+    def active_panel(self):
+        return self.panel
+
+    def run_command(self, cmd, args=None):
+        if cmd == 'show_panel':
+            self.panel = (args or {}).get('panel')
+            return None
+
+        if cmd == 'hide_panel':
+            self.panel = None
+            return None
+
+        return _plugin().run_window_command(self, cmd, args)
+
+    def show_quick_panel(self, items, on_done, flags=0, selected_index=-1,
+                         on_highlight=None):
+        picked = _response('quick_panel', -1)
+        notify('quick_panel', items=items, picked=picked)
+        set_timeout(lambda: on_done(picked), 0)
+
+    def show_input_panel(self, caption, initial_text, on_done, on_change,
+                         on_cancel):
+        text = _response('input_panel', None)
+        notify('input_panel', caption=caption, text=text)
+        view = View(self, initial_text if text is None else text)
+        if text is None:
+            if on_cancel is not None:
+                set_timeout(on_cancel, 0)
+        else:
+            set_timeout(lambda: on_done(text), 0)
+
+        return view
+
+    def __repr__(self):
+        return '<Window {0}>'.format(self._id)
+
+
+def _plugin():
+    """The sublime_plugin module of the harness"""
+
+    from . import sublime_plugin
+    return sublime_plugin
+
+
+def _response(kind, default):
+    """Pop the next queued answer of kind, default if there is none"""
+
+    with _lock:
+        if responses and responses[0][0] == kind:
+            return responses.popleft()[1]
+
+    return default
+
+
+def version():
+    return state['version']
+
+
+def platform():
+    return state['platform']
+
+
+def arch():
+    return state['arch']
+
+
+def channel():
+    return 'stable'
+
+
+def packages_path():
+    return state['packages_path']
+
+
+def installed_packages_path():
+    return state['installed_packages_path']
+
+
+def cache_path():
+    return state['cache_path']
+
+
+def executable_path():
+    return state['executable_path']
+
+
+def windows():
+    return list(windows_list)
+
+
+def active_window():
+    if not windows_list:
+        windows_list.append(Window())
+
+    return windows_list[-1]
+
+
+def load_settings(base_name):
+    """Return the settings of base_name, the default file of every package
+    overlaid with the User one, loaded once
+    """
+
+    with _lock:
+        if base_name not in settings_files:
+            values, root = {}, packages_path()
+            names = sorted(os.listdir(root)) if os.path.isdir(root) else []
+            for package in [name for name in names if name != 'User'] + [
+                    'User']:
+                filename = os.path.join(root, package, base_name)
+                if os.path.isfile(filename):
+                    with open(filename, 'r') as fhandler:
+                        values.update(decode_settings(fhandler.read()))
+
+            settings_files[base_name] = Settings(values)
+
+        return settings_files[base_name]
+
+
+def save_settings(base_name):
+    """Settings are kept in memory only"""
+
+
+def set_timeout(callback, delay=0):
+    """Queue callback to run delay milliseconds from now (scaled by the
+    time_scale state), the harness runs it
+    """
+
+    due = time.time() + delay / 1000.0 * state['time_scale']
+    with _lock:
+        heapq.heappush(timeouts, (due, next(_sequence), callback))
+
+
+set_timeout_async = set_timeout
+
+
+def run_timeouts():
+    """Run the callbacks that are due, returns how many ran"""
+
+    ran = 0
+    while True:
+        with _lock:
+            if not timeouts or timeouts[0][0] > time.time():
+                return ran
+            callback = heapq.heappop(timeouts)[2]
+
+        callback()
+        ran += 1
+
+
+def next_timeout():
+    """Return when the next queued callback is due, None if there is none
+    """
+
+    with _lock:
+        return timeouts[0][0] if timeouts else None
+
+
+def status_message(text):
+    messages.append(('status', text))
+
+
+def error_message(text):
+    messages.append(('error', text))
+
+
+def message_dialog(text):
+    messages.append(('message', text))
+
+
+def ok_cancel_dialog(text, ok_title=''):
+    answer = _response('dialog', True)
+    messages.append(('dialog', text))
+    notify('dialog', text=text, answer=answer)
+    return answer
+
+
+def decode_value(data):
+    return decode_settings(data)
+
+
+def encode_value(value, pretty=False):
+    return json.dumps(value, indent=4 if pretty else None)
+
+
+def log_commands(flag):
+    pass
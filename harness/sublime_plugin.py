@@ -0,0 +1,215 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Stand-in for the Sublime Text sublime_plugin module
+
+load_module registers the commands and event listeners of a plugin
+module the way Sublime Text does, commands are looked up by the name
+derived from their class name (CompileUiCommand is compile_ui) and run
+only when they are enabled. Every top level command run is reported to
+the sublime observers with the time it took.
+"""
+
+import time
+import threading
+
+from . import sublime
+
+application_command_classes = []
+window_command_classes = []
+text_command_classes = []
+listeners = []
+instances = {}
+
+_depth = threading.local()
+
+
+def reset():
+    """Forget every registered command and listener"""
+
+    del application_command_classes[:]
+    del window_command_classes[:]
+    del text_command_classes[:]
+    del listeners[:]
+    instances.clear()
+
+
+def command_name(cls):
+    """Return the command name of a command class"""
+
+    clsname = cls.__name__
+    name = clsname[0].lower()
+    last_upper = False
+    for char in clsname[1:]:
+        if char.isupper() and not last_upper:
+            name += '_' + char.lower()
+        else:
+            name += char
+        last_upper = char.isupper()
+
+    if name.endswith('_command'):
+        name = name[:-8]
+
+    return name
+
+
+class Command(object):
+    """Base class of every command"""
+
+    def name(self):
+        return command_name(self.__class__)
+
+    def is_enabled(self, *args, **kwargs):
+        return True
+
+    def is_visible(self, *args, **kwargs):
+        return True
+
+    def is_checked(self, *args, **kwargs):
+        return False
+
+    def description(self, *args, **kwargs):
+        return ''
+
+
+class ApplicationCommand(Command):
+    pass
+
+
+class WindowCommand(Command):
+    def __init__(self, window):
+        self.window = window
+
+
+class TextCommand(Command):
+    def __init__(self, view):
+        self.view = view
+
+
+class EventListener(object):
+    pass
+
+
+def load_module(module):
+    """Register the commands and listeners defined in module"""
+
+    for name in dir(module):
+        item = getattr(module, name)
+        if not isinstance(item, type) or item.__module__ != module.__name__:
+            continue
+
+        if issubclass(item, ApplicationCommand):
+            application_command_classes.append(item)
+        elif issubclass(item, WindowCommand):
+            window_command_classes.append(item)
+        elif issubclass(item, TextCommand):
+            text_command_classes.append(item)
+        elif issubclass(item, EventListener):
+            listeners.append(item())
+
+
+def unload_module(module):
+    """Unregister the commands and listeners defined in module"""
+
+    def keep(item):
+        cls = item if isinstance(item, type) else item.__class__
+        return cls.__module__ != module.__name__
+
+    for registry in (application_command_classes, window_command_classes,
+                     text_command_classes, listeners):
+        registry[:] = [item for item in registry if keep(item)]
+
+    for key in list(instances):
+        if key[0].__module__ == module.__name__:
+            del instances[key]
+
+
+def command_names():
+    """Return the (kind, name) of every registered command"""
+
+    return sorted(
+        [('application', command_name(cls))
+         for cls in application_command_classes] +
+        [('window', command_name(cls)) for cls in window_command_classes] +
+        [('text', command_name(cls)) for cls in text_command_classes])
+
+
+def fire(event, *args):
+    """Call the event method of every listener that has it"""
+
+    for listener in list(listeners):
+        callback = getattr(listener, event, None)
+        if callback is not None:
+            callback(*args)
+
+
+def _instance(classes, name, owner):
+    """Return the command instance of name bound to owner"""
+
+    for cls in classes:
+        if command_name(cls) == name:
+            key = (cls, owner.id() if owner is not None else None)
+            if key not in instances:
+                instances[key] = cls(owner) if owner is not None else cls()
+            return instances[key]
+
+    return None
+
+
+def _run(command, target, owner, run, args):
+    """Run a command if enabled, top level runs are reported to the
+    sublime observers
+    """
+
+    args = dict(args or {})
+    if not command.is_enabled(**args):
+        return False
+
+    depth = getattr(_depth, 'value', 0)
+    _depth.value = depth + 1
+    started = time.time()
+    try:
+        run(**args)
+    finally:
+        _depth.value = depth
+
+    if depth == 0:
+        sublime.notify('command', target=target, owner=owner,
+                       command=command.name(), args=args,
+                       elapsed=time.time() - started)
+
+    return True
+
+
+def run_application_command(name, args=None):
+    command = _instance(application_command_classes, name, None)
+    if command is None:
+        return None
+
+    return _run(command, 'application', None, command.run, args)
+
+
+def run_window_command(window, name, args=None):
+    command = _instance(window_command_classes, name, window)
+    if command is None:
+        return None
+
+    return _run(command, 'window', window, command.run, args)
+
+
+def run_text_command(view, name, args=None):
+    command = _instance(text_command_classes, name, view)
+    if command is None:
+        return None
+
+    def run(**kwargs):
+        edit = view.begin_edit(0, name, kwargs)
+        try:
+            command.run(edit, **kwargs)
+        finally:
+            view.end_edit(edit)
+
+    return _run(command, 'text', view, run, args)
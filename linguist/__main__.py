@@ -0,0 +1,32 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Command line entry point: python -m linguist <command> [options]
+"""
+
+import sys
+import argparse
+
+from . import commands
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m linguist',
+        description='Qt Linguist catalogs without the Qt tools')
+    subparsers = parser.add_subparsers(dest='command')
+    for command in commands.COMMANDS:
+        command.register(subparsers)
+
+    args = parser.parse_args(argv)
+    if getattr(args, 'run', None) is None:
+        parser.print_help()
+        return 2
+
+    return args.run(args)
+
+
+sys.exit(main())
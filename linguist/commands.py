@@ -0,0 +1,74 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Headless linguist commands
+"""
+
+import os
+import sys
+
+from .extract import ExtractionCache, update_catalog
+
+
+class UpdateCommand(object):
+    """
+    Extract the messages of python sources into a TS catalog
+    """
+
+    name = 'update'
+
+    @classmethod
+    def register(cls, subparsers):
+        parser = subparsers.add_parser(
+            cls.name, help='extract tr() messages into a TS catalog')
+        parser.add_argument('paths', nargs='+',
+                            help='python files or directories to walk')
+        parser.add_argument('-ts', '--ts', dest='catalog', required=True,
+                            help='TS catalog to create or update')
+        parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help='parser processes (default: number of '
+                            'cores)')
+        parser.add_argument('--cache', default=None,
+                            help='JSON file that keeps the extracted '
+                            'messages of unchanged sources between runs')
+        parser.add_argument('--no-obsolete', action='store_true',
+                            help='drop the messages that were not found')
+        parser.set_defaults(run=cls.run)
+
+    @staticmethod
+    def run(args):
+        sources = []
+        for path in args.paths:
+            if not os.path.isdir(path):
+                sources.append(path)
+                continue
+
+            for dirname, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                sources.extend(
+                    os.path.join(dirname, filename)
+                    for filename in sorted(files)
+                    if filename.endswith('.py')
+                    and not filename.endswith('_rc.py')
+                )
+
+        cache = ExtractionCache(args.cache) if args.cache else None
+        stats, errors = update_catalog(
+            sources, args.catalog, cache, args.jobs,
+            obsolete=not args.no_obsolete
+        )
+
+        for error in errors:
+            sys.stderr.write('{0}\n'.format(error))
+
+        print('{0}: {1} new, {2} existing and {3} obsolete messages in {4} '
+              'files'.format(args.catalog, stats['new'], stats['existing'],
+                             stats['obsolete'], len(sources)))
+
+        return 1 if errors else 0
+
+
+COMMANDS = [UpdateCommand]
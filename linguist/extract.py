@@ -0,0 +1,323 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Extract tr(), translate() and QT_TRANSLATE_NOOP() messages from python
+sources without pyside-lupdate
+"""
+
+import os
+import ast
+import json
+import hashlib
+import tempfile
+import threading
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from . import ts
+
+EXTRACTOR_VERSION = 1
+
+try:
+    string_types = (str, unicode)
+except NameError:
+    string_types = (str,)
+
+_string_nodes = tuple(
+    getattr(ast, name) for name in ('Str', 'Constant') if hasattr(ast, name))
+
+
+def _string(node):
+    """Return the value of a string literal (or a concatenation of them),
+    None for anything else
+    """
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _string(node.left), _string(node.right)
+        if left is None or right is None:
+            return None
+        return left + right
+
+    if not isinstance(node, _string_nodes):
+        return None
+
+    value = getattr(node, 'value', None)
+    if value is None:
+        value = getattr(node, 's', None)
+
+    if not isinstance(value, string_types):
+        return None
+
+    if not isinstance(value, type(u'')):
+        value = value.decode('utf-8', 'replace')
+
+    return value
+
+
+def _name(node):
+    """Return the dotted name of a Name or Attribute node"""
+
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        parent = _name(node.value)
+        return node.attr if parent is None else parent + '.' + node.attr
+
+    return None
+
+
+class Extractor(ast.NodeVisitor):
+    """
+    Collects (context, source, comment, line, numerus) messages, the
+    context of tr() and QT_TR_NOOP() calls is the enclosing class
+    """
+
+    def __init__(self):
+        super(Extractor, self).__init__()
+
+        self.classes = []
+        self.messages = []
+
+    def visit_ClassDef(self, node):
+        self.classes.append(node.name)
+        self.generic_visit(node)
+        self.classes.pop()
+
+    def visit_Call(self, node):
+        name = _name(node.func) or ''
+        last = name.split('.')[-1]
+        args = node.args
+        keywords = dict((keyword.arg, keyword.value)
+                        for keyword in node.keywords)
+
+        if last in ('tr', 'QT_TR_NOOP'):
+            owner = name.split('.')[-2] if '.' in name else ''
+            if not owner[:1].isupper():
+                owner = self.classes[-1] if self.classes else None
+            self.add(
+                node, owner, args[0] if args else None,
+                args[1] if len(args) > 1 else keywords.get('disambiguation'),
+                len(args) > 2 or 'n' in keywords
+            )
+        elif last in ('translate', '_translate') and (
+                '.' not in name or name.split('.')[-2].endswith(
+                    'Application')):
+            self.add(
+                node, _string(args[0]) if args else None,
+                args[1] if len(args) > 1 else None,
+                args[2] if len(args) > 2 else keywords.get('disambiguation'),
+                len(args) > 4 or 'n' in keywords
+            )
+        elif last in ('QT_TRANSLATE_NOOP', 'QT_TRANSLATE_NOOP3'):
+            self.add(
+                node, _string(args[0]) if args else None,
+                args[1] if len(args) > 1 else None,
+                args[2] if len(args) > 2 else None, False
+            )
+
+        self.generic_visit(node)
+
+    def add(self, node, context, source, comment, numerus):
+        """Record a message if its context and source are literals"""
+
+        source = _string(source) if source is not None else None
+        if not context or source is None:
+            return
+
+        comment = _string(comment) if comment is not None else None
+        self.messages.append(
+            (context, source, comment or '', node.lineno, bool(numerus)))
+
+
+def extract_source(data, filename='<string>'):
+    """Return the messages found in the python source data"""
+
+    extractor = Extractor()
+    extractor.visit(ast.parse(data, filename))
+
+    return extractor.messages
+
+
+def source_digest(data):
+    """Return the cache key of a source file contents"""
+
+    digest = hashlib.sha1(str(EXTRACTOR_VERSION).encode('utf-8'))
+    digest.update(data)
+
+    return digest.hexdigest()
+
+
+def _extract(item):
+    """Pool worker: returns (filename, digest, messages, error)"""
+
+    filename, digest, data = item
+    try:
+        return filename, digest, extract_source(data, filename), None
+    except (SyntaxError, ValueError, TypeError) as error:
+        return filename, digest, None, '{0}: {1}'.format(filename, error)
+
+
+class ExtractionCache(object):
+    """
+    Extracted messages keyed by source content digest, unchanged files are
+    never parsed again, optionally persisted to a JSON file
+    """
+
+    def __init__(self, filename=None, max_entries=4096):
+        super(ExtractionCache, self).__init__()
+
+        self.filename = filename
+        self.max_entries = max_entries
+        self.entries = None
+        self.order = []
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def load(self):
+        """Load the cache file if it was not loaded yet"""
+
+        if self.entries is not None:
+            return
+
+        data = {}
+        if self.filename is not None:
+            try:
+                with open(self.filename, 'r') as fhandler:
+                    data = json.load(fhandler)
+            except (IOError, OSError, ValueError):
+                pass
+
+        self.entries = {}
+        for digest, messages in data.get('entries', []):
+            self.entries[digest] = [tuple(message) for message in messages]
+            self.order.append(digest)
+
+    def save(self):
+        """Write the cache file atomically"""
+
+        if self.filename is None:
+            return
+
+        with self.lock:
+            self.load()
+            dirname = os.path.dirname(self.filename)
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+
+            fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+            with os.fdopen(fd, 'w') as fhandler:
+                json.dump({'entries': [
+                    (digest, self.entries[digest]) for digest in self.order
+                ]}, fhandler)
+
+            getattr(os, 'replace', os.rename)(tmpname, self.filename)
+
+    def get(self, digest):
+        """Return the cached messages of digest or None"""
+
+        with self.lock:
+            self.load()
+            messages = self.entries.get(digest)
+            if messages is None:
+                self.misses += 1
+                return None
+
+            self.order.remove(digest)
+            self.order.append(digest)
+            self.hits += 1
+            return messages
+
+    def put(self, digest, messages):
+        """Store the messages of digest"""
+
+        with self.lock:
+            self.load()
+            if digest in self.entries:
+                self.order.remove(digest)
+
+            self.entries[digest] = messages
+            self.order.append(digest)
+            while len(self.order) > self.max_entries:
+                del self.entries[self.order.pop(0)]
+
+
+def extract_files(filenames, cache=None, jobs=None, processes=True):
+    """Return ({filename: messages}, errors) for the given python files,
+    files missing in the cache are parsed in a process pool (or a thread
+    pool if processes is False, e.g. inside Sublime Text)
+    """
+
+    results, errors, pending = {}, [], []
+    for filename in filenames:
+        try:
+            with open(filename, 'rb') as fhandler:
+                data = fhandler.read()
+        except (IOError, OSError) as error:
+            errors.append('{0}: {1}'.format(filename, error))
+            continue
+
+        digest = source_digest(data)
+        messages = cache.get(digest) if cache is not None else None
+        if messages is None:
+            pending.append((filename, digest, data))
+        else:
+            results[filename] = messages
+
+    if len(pending) > 1 and jobs != 1:
+        pool_class = multiprocessing.Pool if processes else ThreadPool
+        pool = pool_class(jobs or multiprocessing.cpu_count())
+        try:
+            parsed = list(pool.imap_unordered(
+                _extract, pending, max(1, len(pending) // 64)))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        parsed = [_extract(item) for item in pending]
+
+    for filename, digest, messages, error in parsed:
+        if error is not None:
+            errors.append(error)
+            continue
+
+        results[filename] = messages
+        if cache is not None:
+            cache.put(digest, messages)
+
+    return results, errors
+
+
+def update_catalog(sources, catalog, cache=None, jobs=None, processes=True,
+                   obsolete=True):
+    """Extract the messages of sources and merge them into the catalog TS
+    file, returns (stats, errors)
+    """
+
+    results, errors = extract_files(sources, cache, jobs, processes)
+
+    root = os.path.dirname(os.path.abspath(catalog))
+    extracted = []
+    for filename in sources:
+        try:
+            location = os.path.relpath(filename, root)
+        except ValueError:
+            location = os.path.abspath(filename)
+
+        location = location.replace(os.sep, '/')
+        for context, source, comment, line, numerus in results.get(
+                filename, ()):
+            extracted.append(
+                (context, source, comment, location, line, numerus))
+
+    document = ts.load(catalog)
+    stats = ts.merge(document, extracted, obsolete)
+    ts.save(document, catalog)
+
+    if cache is not None:
+        cache.save()
+
+    return stats, errors
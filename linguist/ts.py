@@ -0,0 +1,243 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Read, merge and write Qt Linguist TS catalogs
+"""
+
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ElementTree
+
+ATTRIBUTE_ORDER = [
+    'version', 'language', 'sourcelanguage', 'numerus', 'filename', 'line',
+    'type'
+]
+
+_entities = [
+    ('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'),
+    ("'", '&apos;')
+]
+
+
+def load(filename):
+    """Return the root element of a TS file, a new empty catalog if the
+    file does not exist
+    """
+
+    if not os.path.exists(filename):
+        return ElementTree.Element('TS', {'version': '2.0'})
+
+    return ElementTree.parse(filename).getroot()
+
+
+def message_key(context, message):
+    """Return the (context, source, comment) key of a message element"""
+
+    return (
+        context,
+        message.findtext('source') or '',
+        message.findtext('comment') or ''
+    )
+
+
+def messages(root):
+    """Generator of (context name, context element, message element)"""
+
+    for context in root.findall('context'):
+        name = context.findtext('name') or ''
+        for message in context.findall('message'):
+            yield name, context, message
+
+
+def merge(root, extracted, obsolete=True):
+    """Merge the extracted (context, source, comment, filename, line,
+    numerus) messages into the catalog root, existing translations are
+    kept, messages that were not found are marked obsolete (or dropped if
+    obsolete is False) and new ones are added as unfinished
+
+    Returns a dict with the new, existing and obsolete message counts
+    """
+
+    found, keys = {}, []
+    for context, source, comment, filename, line, numerus in extracted:
+        key = (context, source, comment)
+        if key not in found:
+            found[key] = [numerus, []]
+            keys.append(key)
+        found[key][0] = found[key][0] or numerus
+        found[key][1].append((filename, line))
+
+    contexts = dict(
+        (context.findtext('name') or '', context)
+        for context in root.findall('context')
+    )
+    existing = dict(
+        (message_key(name, message), (context, message))
+        for name, context, message in messages(root)
+    )
+
+    stats = {'new': 0, 'existing': 0, 'obsolete': 0}
+    for key in keys:
+        numerus, locations = found[key]
+        if key in existing:
+            message = existing[key][1]
+            translation = message.find('translation')
+            if translation is not None and translation.get('type') in (
+                    'obsolete', 'vanished'):
+                translation.set('type', 'unfinished')
+            stats['existing'] += 1
+        else:
+            if key[0] not in contexts:
+                contexts[key[0]] = ElementTree.SubElement(root, 'context')
+                ElementTree.SubElement(contexts[key[0]], 'name').text = key[0]
+            message = _new_message(contexts[key[0]], key, numerus)
+            stats['new'] += 1
+
+        _set_locations(message, locations)
+
+    for key, (context, message) in existing.items():
+        if key in found:
+            continue
+
+        _set_locations(message, [])
+        if not obsolete:
+            context.remove(message)
+            continue
+
+        translation = message.find('translation')
+        if translation is None:
+            translation = ElementTree.SubElement(message, 'translation')
+        if translation.get('type') != 'obsolete':
+            translation.set('type', 'obsolete')
+            stats['obsolete'] += 1
+
+    for name, context in contexts.items():
+        if context.find('message') is None:
+            root.remove(context)
+
+    return stats
+
+
+def _new_message(context, key, numerus):
+    """Append an unfinished message for key to the context element"""
+
+    message = ElementTree.SubElement(context, 'message')
+    if numerus:
+        message.set('numerus', 'yes')
+
+    ElementTree.SubElement(message, 'source').text = key[1]
+    if key[2]:
+        ElementTree.SubElement(message, 'comment').text = key[2]
+
+    translation = ElementTree.SubElement(
+        message, 'translation', {'type': 'unfinished'})
+    if numerus:
+        ElementTree.SubElement(translation, 'numerusform')
+
+    return message
+
+
+def _set_locations(message, locations):
+    """Replace the location elements of a message"""
+
+    for location in message.findall('location'):
+        message.remove(location)
+
+    for index, (filename, line) in enumerate(locations):
+        location = ElementTree.Element(
+            'location', {'filename': filename, 'line': str(line)})
+        message.insert(index, location)
+
+
+def _escape(text):
+    for character, entity in _entities:
+        text = text.replace(character, entity)
+
+    return text
+
+
+def _attributes(element):
+    def order(name):
+        if name in ATTRIBUTE_ORDER:
+            return (ATTRIBUTE_ORDER.index(name), name)
+        return (len(ATTRIBUTE_ORDER), name)
+
+    return ''.join(
+        u' {0}="{1}"'.format(name, _escape(element.get(name)))
+        for name in sorted(element.keys(), key=order)
+    )
+
+
+def _mixed(element):
+    """Tell if the element holds text around its children (like a <byte>
+    inside a <translation>), those are written in a single line
+    """
+
+    if element.text and element.text.strip():
+        return True
+
+    return any(
+        child.tag == 'byte' or (child.tail and child.tail.strip())
+        for child in element
+    )
+
+
+def _inline(element):
+    attributes = _attributes(element)
+    if not len(element) and not element.text:
+        return u'<{0}{1}/>'.format(element.tag, attributes)
+
+    parts = [u'<{0}{1}>'.format(element.tag, attributes)]
+    parts.append(_escape(element.text or ''))
+    for child in element:
+        parts.append(_inline(child))
+        parts.append(_escape(child.tail or ''))
+    parts.append(u'</{0}>'.format(element.tag))
+
+    return u''.join(parts)
+
+
+def _write(element, depth, lines):
+    indent = '    ' * depth
+    attributes = _attributes(element)
+    children = list(element)
+    if _mixed(element):
+        lines.append(indent + _inline(element))
+    elif children:
+        lines.append(u'{0}<{1}{2}>'.format(indent, element.tag, attributes))
+        for child in children:
+            _write(child, depth + (element.tag != 'TS'), lines)
+        lines.append(u'{0}</{1}>'.format(indent, element.tag))
+    elif element.tag == 'location':
+        lines.append(u'{0}<{1}{2}/>'.format(indent, element.tag, attributes))
+    else:
+        lines.append(u'{0}<{1}{2}>{3}</{1}>'.format(
+            indent, element.tag, attributes, _escape(element.text or '')))
+
+
+def dump(root):
+    """Return the TS document text formatted like lupdate does"""
+
+    lines = [u'<?xml version="1.0" encoding="utf-8"?>', u'<!DOCTYPE TS>']
+    _write(root, 0, lines)
+
+    return u'\n'.join(lines) + u'\n'
+
+
+def save(root, filename):
+    """Write the catalog atomically"""
+
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+    with os.fdopen(fd, 'wb') as fhandler:
+        fhandler.write(dump(root).encode('utf-8'))
+
+    if os.path.exists(filename):
+        shutil.copymode(filename, tmpname)
+    else:
+        os.chmod(tmpname, 0o644)
+    getattr(os, 'replace', os.rename)(tmpname, filename)
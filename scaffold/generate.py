@@ -0,0 +1,195 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Generate projects from template directories
+
+The files of a template are rendered by a pool of workers into a staging
+directory next to the project root. The staging tree is then published
+with a single rename when the root does not exist (or is empty) and file
+by file otherwise, so a failure never leaves a half written project
+behind.
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from .render import Renderer, LINK_THRESHOLD
+
+STAGING_SUFFIX = '.staging'
+
+
+class GenerationError(Exception):
+    """Raised when a project can not be generated"""
+
+
+def template_files(directory):
+    """Return the sorted relative paths of the files and of the empty
+    directories (with a trailing separator) of a template directory
+    """
+
+    entries = []
+    for dirname, dirs, files in os.walk(directory):
+        dirs.sort()
+        relative = os.path.relpath(dirname, directory)
+        if not dirs and not files and relative != os.curdir:
+            entries.append(relative + os.sep)
+
+        for name in sorted(files):
+            entries.append(os.path.normpath(os.path.join(relative, name)))
+
+    return entries
+
+
+def _render(task):
+    """Render one file into the staging directory, returns the task
+    relative path, the action done, the seconds it took and the error
+    """
+
+    renderer, source, target, relative, values, link, threshold = task
+
+    started = time.time()
+    try:
+        action = renderer.render_file(source, target, values, link, threshold)
+    except (IOError, OSError, UnicodeError) as error:
+        return relative, None, time.time() - started, '{0}: {1}'.format(
+            source, error)
+
+    return relative, action, time.time() - started, None
+
+
+def _umask():
+    """Return the process umask"""
+
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _staging(root, parent):
+    """Create the staging directory of root next to it, or inside it when
+    its parent is not writable (the home directory), the staging directory
+    must be in the same file system for the renames to be atomic
+    """
+
+    prefix = '.{0}.'.format(os.path.basename(root))
+    try:
+        return tempfile.mkdtemp(
+            prefix=prefix, suffix=STAGING_SUFFIX, dir=parent)
+    except OSError:
+        if not os.path.isdir(root):
+            raise
+
+    return tempfile.mkdtemp(prefix=prefix, suffix=STAGING_SUFFIX, dir=root)
+
+
+def publish(staging, root):
+    """Move the staging tree into root, with one rename when root does not
+    exist or is empty and file by file otherwise (existing files are
+    replaced), the staging directory is gone afterwards
+    """
+
+    replace = getattr(os, 'replace', os.rename)
+    if not os.path.isdir(root) or not os.listdir(root):
+        if os.path.isdir(root):
+            shutil.copymode(root, staging)
+            os.rmdir(root)
+        else:
+            os.chmod(staging, 0o777 & ~_umask())
+        replace(staging, root)
+        return
+
+    for dirname, dirs, files in os.walk(staging):
+        relative = os.path.relpath(dirname, staging)
+        destination = os.path.normpath(os.path.join(root, relative))
+        if not os.path.isdir(destination):
+            os.makedirs(destination)
+
+        for name in files:
+            replace(os.path.join(dirname, name),
+                    os.path.join(destination, name))
+
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+def generate(directory, root, values, renderer=None, jobs=None,
+             link='copy', threshold=LINK_THRESHOLD, extra=()):
+    """Render the template directory into root
+
+    extra is a list of (source, relative target, values) files rendered
+    in the same transaction (the project file of the template). Files are
+    rendered in a thread pool of jobs workers (the number of cores by
+    default), link and threshold are given to Renderer.render_file
+
+    Returns a list of (relative path, action, seconds), raises
+    GenerationError when a file can not be rendered or the project can not
+    be published, root is left untouched then
+    """
+
+    renderer = renderer or Renderer()
+    parent = os.path.dirname(os.path.abspath(root))
+    try:
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+        staging = _staging(root, parent)
+    except OSError as error:
+        raise GenerationError('{0}: {1}'.format(parent, error))
+
+    try:
+        tasks = []
+        files = [(os.path.join(directory, relative), relative, values)
+                 for relative in template_files(directory)]
+        for source, relative, file_values in files + list(extra):
+            target = os.path.join(staging, relative)
+            folder = os.path.dirname(target)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+            if not relative.endswith(os.sep):
+                tasks.append((renderer, source, target, relative,
+                              file_values, link, threshold))
+
+        if len(tasks) > 1 and jobs != 1:
+            pool = ThreadPool(min(jobs or multiprocessing.cpu_count(),
+                                  len(tasks)))
+            try:
+                results = pool.map(_render, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_render(task) for task in tasks]
+
+        errors = [error for _, _, _, error in results if error is not None]
+        if errors:
+            raise GenerationError('\n'.join(errors))
+
+        try:
+            publish(staging, root)
+        except OSError as error:
+            raise GenerationError('{0}: {1}'.format(root, error))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    return [result[:3] for result in results]
+
+
+def report(results):
+    """Return the per file report lines of generate results"""
+
+    lines = ['{0:>8} {1:>11}  {2}'.format('time', 'action', 'file')]
+    for relative, action, seconds in sorted(
+            results, key=lambda result: (-result[2], result[0])):
+        lines.append(u'{0:>7.3f}s {1:>11}  {2}'.format(
+            seconds, action, relative))
+
+    lines.append('{0:>7.3f}s {1:>11}  {2} files'.format(
+        sum(result[2] for result in results), 'total', len(results)))
+
+    return lines
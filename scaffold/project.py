@@ -0,0 +1,246 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Headless PySide and PyQt4 project generation
+
+Projects are generated from the registry templates without Sublime Text,
+one at a time or many of them at once from a JSON manifest:
+
+    python -m scaffold qt_gui_application ~/apps/demo Demo --library PyQt4
+    python -m scaffold --manifest fixtures.json -j 8
+"""
+
+import os
+import sys
+import json
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from .generate import generate, report, GenerationError
+from .registry import TemplateRegistry
+from .render import Renderer, LINKS, LINK_THRESHOLD
+
+try:
+    from ..converter.base import sip_api_2
+except (ImportError, ValueError):
+    from converter.base import sip_api_2
+
+LIBRARIES = ('PySide', 'PyQt4')
+
+TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'templates'
+)
+
+
+def template_values(name, library):
+    """Return the values of the template placeholders of a project"""
+
+    return {
+        'APP_NAME': name,
+        'QT_LIBRARY': library,
+        'PyQT_API_CHECK': sip_api_2 if library == 'PyQt4' else ''
+    }
+
+
+def project_file(template, root, name, library):
+    """Return the (template, relative target, values) of the project file
+    of a project, None when the template has no project file
+    """
+
+    if not template.project_file or not os.path.exists(
+            template.project_file):
+        return None
+
+    return (
+        template.project_file, '{0}.sublime-project'.format(name),
+        {'PATH': root, 'QT_LIBRARY': library}
+    )
+
+
+def generate_project(template, root, name, library='PySide', renderer=None,
+                     jobs=None, link='copy', threshold=LINK_THRESHOLD):
+    """Generate a project and its project file from a registry Template
+    (see scaffold.generate.generate for the other arguments)
+    """
+
+    if library not in LIBRARIES:
+        raise GenerationError('unknown Qt library {0}'.format(library))
+
+    extra = project_file(template, root, name, library)
+    return generate(
+        template.directory, root, template_values(name, library), renderer,
+        jobs, link, threshold, [extra] if extra is not None else []
+    )
+
+
+class ProjectSpec(object):
+    """
+    A project to generate: template name (display or directory name),
+    root directory, project name and Qt library
+    """
+
+    def __init__(self, template, root, name, library='PySide'):
+        super(ProjectSpec, self).__init__()
+
+        self.template = template
+        self.root = root
+        self.name = name
+        self.library = library
+
+    def __repr__(self):
+        return '<ProjectSpec {0} {1} at {2}>'.format(
+            self.template, self.name, self.root)
+
+
+def load_manifest(filename, library='PySide'):
+    """Return the ProjectSpecs of a JSON manifest, a list of objects with
+    template, root, name and optionally library keys. Relative roots are
+    relative to the manifest directory
+    """
+
+    with open(filename, 'r') as fhandler:
+        entries = json.load(fhandler)
+
+    base = os.path.dirname(os.path.abspath(filename))
+    specs = []
+    for number, entry in enumerate(entries):
+        try:
+            specs.append(ProjectSpec(
+                entry['template'],
+                os.path.join(base, os.path.expanduser(entry['root'])),
+                entry['name'], entry.get('library', library)
+            ))
+        except (KeyError, TypeError, AttributeError):
+            raise ValueError(
+                '{0}: entry {1} needs template, root and name'.format(
+                    filename, number))
+
+    return specs
+
+
+def generate_projects(specs, registry, renderer=None, jobs=None,
+                      file_jobs=1, link='copy', threshold=LINK_THRESHOLD):
+    """Generate the ProjectSpecs in a thread pool of jobs workers (the
+    number of cores by default), every project renders its files with
+    file_jobs workers
+
+    Returns a list of (spec, results, error) in the order of specs, error
+    is None for the generated projects
+    """
+
+    renderer = renderer or Renderer()
+
+    def run(spec):
+        template = registry.get(spec.template)
+        if template is None:
+            return spec, None, 'unknown template {0}'.format(spec.template)
+
+        try:
+            results = generate_project(
+                template, spec.root, spec.name, spec.library, renderer,
+                file_jobs, link, threshold)
+        except GenerationError as error:
+            return spec, None, str(error)
+
+        return spec, results, None
+
+    if len(specs) > 1 and jobs != 1:
+        pool = ThreadPool(min(jobs or multiprocessing.cpu_count(),
+                              len(specs)))
+        try:
+            return pool.map(run, specs)
+        finally:
+            pool.close()
+            pool.join()
+
+    return [run(spec) for spec in specs]
+
+
+def main(argv=None):
+    """Command line entry point"""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m scaffold',
+        description='Generate PySide and PyQt4 projects without Sublime Text')
+    parser.add_argument('template', nargs='?',
+                        help='template name or directory name')
+    parser.add_argument('root', nargs='?', help='project root directory')
+    parser.add_argument('name', nargs='?', help='project name')
+    parser.add_argument('--library', choices=LIBRARIES, default='PySide',
+                        help='Qt library (default for manifest entries too)')
+    parser.add_argument('--manifest', default=None,
+                        help='JSON list of {template, root, name, library} '
+                        'projects to generate')
+    parser.add_argument('--template-dir', dest='template_dirs',
+                        action='append', default=[],
+                        help='extra template directory')
+    parser.add_argument('--list', action='store_true',
+                        help='list the available templates and exit')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='projects generated at the same time '
+                        '(default: number of cores)')
+    parser.add_argument('--file-jobs', type=int, default=None,
+                        help='files rendered at the same time per project '
+                        '(default: 1 with a manifest, cores otherwise)')
+    parser.add_argument('--link', choices=LINKS, default='copy',
+                        help='how to place large static template files')
+    parser.add_argument('--link-threshold', type=int, default=LINK_THRESHOLD,
+                        help='minimum size in bytes of linked files')
+    parser.add_argument('--report', action='store_true',
+                        help='print the time spent on every file')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    registry = TemplateRegistry([TEMPLATES_DIR] + [
+        os.path.expanduser(directory) for directory in args.template_dirs])
+
+    if args.list:
+        missing = 0
+        for template in registry.templates():
+            print('{0:<28} {1}'.format(template.key, template.panel_item()))
+            if registry.get(template.name) is not template:
+                missing += 1
+                sys.stderr.write('{0} can not be found by its name {1}\n'
+                                 .format(template.directory, template.name))
+        return 1 if missing else 0
+
+    if args.manifest is not None:
+        try:
+            specs = load_manifest(args.manifest, args.library)
+        except (IOError, OSError, ValueError) as error:
+            sys.stderr.write('{0}\n'.format(error))
+            return 2
+        file_jobs = args.file_jobs or 1
+    elif args.template and args.root and args.name:
+        specs = [ProjectSpec(args.template, os.path.expanduser(args.root),
+                             args.name, args.library)]
+        file_jobs = args.file_jobs
+    else:
+        parser.print_help()
+        return 2
+
+    failed = 0
+    for spec, results, error in generate_projects(
+            specs, registry, Renderer(), args.jobs, file_jobs, args.link,
+            args.link_threshold):
+        if error is not None:
+            failed += 1
+            sys.stderr.write('[{0}] {1}\n'.format(spec.root, error))
+            continue
+
+        if not args.quiet:
+            print('[{0}] {1} files'.format(spec.root, len(results)))
+        if args.report:
+            print('\n'.join(report(results)))
+
+    if not args.quiet:
+        print('{0} projects generated, {1} failed'.format(
+            len(specs) - failed, failed))
+
+    return 1 if failed else 0
@@ -0,0 +1,174 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Index of the project templates of the package and of any extra user
+template directories
+
+Every directory is read once, later lookups only stat the directory and
+its templates.lst to find out if they have to be indexed again
+"""
+
+import os
+import threading
+
+CATALOG = 'templates.lst'
+PROJECT_FILE = 'template.sublime-project'
+
+
+def template_key(name):
+    """Return the directory name of a template display name"""
+
+    return name.replace(' ', '_').lower()
+
+
+def _stat(path):
+    """Return the (mtime, size) of path, None if it does not exist"""
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime, stat.st_size
+
+
+class Template(object):
+    """
+    A project template: a directory whose files are copied into new
+    projects, its project file is the template.sublime-project of the
+    directory that contains it
+    """
+
+    def __init__(self, name, description, directory, project_file):
+        super(Template, self).__init__()
+
+        self.name = name
+        self.description = description
+        self.directory = directory
+        self.project_file = project_file
+
+    @property
+    def key(self):
+        return os.path.basename(self.directory)
+
+    def panel_item(self):
+        """Return the quick panel entry of the template"""
+
+        if not self.description:
+            return self.name
+
+        return '{0}:: {1}'.format(self.name, self.description)
+
+
+def parse_catalog(filename):
+    """Return the (name, description) entries of a templates.lst file"""
+
+    entries = []
+    with open(filename, 'r') as fhandler:
+        for line in fhandler.read().split('\n'):
+            if not line.strip():
+                continue
+
+            name, _, description = line.partition(':')
+            entries.append((name.strip(), description.strip()))
+
+    return entries
+
+
+def scan(directory, project_file=None):
+    """Return the templates of a directory: the templates.lst entries
+    whose directory exists followed by the unlisted template directories
+    """
+
+    catalog = os.path.join(directory, CATALOG)
+    own_project = os.path.join(directory, PROJECT_FILE)
+    if os.path.exists(own_project):
+        project_file = own_project
+
+    templates, listed = [], set()
+    if os.path.exists(catalog):
+        for name, description in parse_catalog(catalog):
+            path = os.path.join(directory, template_key(name))
+            if os.path.isdir(path):
+                templates.append(
+                    Template(name, description, path, project_file))
+                listed.add(template_key(name))
+
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        names = []
+
+    for name in names:
+        path = os.path.join(directory, name)
+        if name in listed or name.startswith(('.', '_')) or (
+                not os.path.isdir(path)):
+            continue
+
+        templates.append(Template(
+            name.replace('_', ' ').title(), '', path, project_file))
+
+    return templates
+
+
+class TemplateRegistry(object):
+    """
+    Templates of the package directory and the user directories, a user
+    template replaces a package template with the same directory name
+    """
+
+    def __init__(self, directories):
+        super(TemplateRegistry, self).__init__()
+
+        self.directories = list(directories)
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def _directory(self, directory, project_file):
+        """Return the (possibly cached) templates of a directory"""
+
+        signature = (
+            _stat(directory), _stat(os.path.join(directory, CATALOG)),
+            project_file
+        )
+        cached = self.entries.get(directory)
+        if cached is None or cached[0] != signature:
+            templates = scan(directory, project_file)
+            cached = self.entries[directory] = (signature, templates)
+
+        return cached[1]
+
+    def templates(self):
+        """Return the available templates in display order"""
+
+        project_file = None
+        if self.directories:
+            project_file = os.path.join(self.directories[0], PROJECT_FILE)
+
+        with self.lock:
+            found, keys = {}, []
+            for directory in self.directories:
+                for template in self._directory(directory, project_file):
+                    if template.key not in found:
+                        keys.append(template.key)
+                    found[template.key] = template
+
+            return [found[key] for key in keys]
+
+    def get(self, name):
+        """Return the template of a display name or directory name"""
+
+        templates = self.templates()
+        for template in templates:
+            if name in (template.name, template.key):
+                return template
+
+        key = template_key(name)
+        for template in templates:
+            if template_key(template.key) == key:
+                return template
+
+        return None
@@ -0,0 +1,244 @@
+# -*- coding: utf8 -*-
+
+# Copyright (C) 2012 - Oscar Campos <oscar.campos@member.fsf.org>
+# This plugin is Free Software see LICENSE file for details
+
+"""
+Render project template files
+
+A template is split once into literal and ${NAME} placeholder segments
+and rendered in a single pass, files without placeholders (images and
+any other binary or static asset) are copied in kernel space when the
+platform allows it, large ones can be reflinked or hardlinked instead
+"""
+
+import os
+import re
+import shutil
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+PLACEHOLDER = re.compile(r'\$\{(\w+)\}')
+
+BINARY_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.icns', '.svgz',
+    '.webp', '.ttf', '.otf', '.woff', '.woff2', '.qm', '.pyc', '.zip',
+    '.gz', '.pdf'
+)
+
+SNIFF_SIZE = 8192
+
+LINKS = ('copy', 'reflink', 'hardlink')
+LINK_THRESHOLD = 256 * 1024
+
+# linux ioctl that shares the extents of a file with another one
+FICLONE = 0x40049409
+
+
+class CompiledTemplate(object):
+    """
+    Literal and placeholder segments of a template text, placeholders
+    without a value are kept as they are, byte string values are utf-8
+    """
+
+    def __init__(self, text):
+        super(CompiledTemplate, self).__init__()
+
+        self.segments = []
+        position = 0
+        for match in PLACEHOLDER.finditer(text):
+            self.segments.append((text[position:match.start()],
+                                  match.group(1)))
+            position = match.end()
+        self.tail = text[position:]
+
+    def render(self, values):
+        """Return the text with every placeholder replaced from values"""
+
+        parts = []
+        for literal, name in self.segments:
+            parts.append(literal)
+            value = values.get(name)
+            if isinstance(value, bytes):
+                value = value.decode('utf-8')
+            parts.append(u'${' + name + u'}' if value is None else value)
+        parts.append(self.tail)
+
+        return u''.join(parts)
+
+
+def is_binary(filename):
+    """True for known binary extensions and files with NUL bytes"""
+
+    if filename.lower().endswith(BINARY_EXTENSIONS):
+        return True
+
+    with open(filename, 'rb') as fhandler:
+        return b'\0' in fhandler.read(SNIFF_SIZE)
+
+
+def _kernel_copy(source, target, size):
+    """Copy size bytes between two file descriptors with copy_file_range
+    or sendfile, returns False when the platform can not do it
+    """
+
+    for name in ('copy_file_range', 'sendfile'):
+        function = getattr(os, name, None)
+        if function is None:
+            continue
+
+        copied = 0
+        try:
+            while copied < size:
+                if name == 'sendfile':
+                    sent = function(target, source, copied, size - copied)
+                else:
+                    sent = function(source, target, size - copied, copied,
+                                    copied)
+                if not sent:
+                    break
+                copied += sent
+        except OSError:
+            pass
+
+        if copied == size:
+            return True
+
+    return False
+
+
+def copy_file(source, target):
+    """Copy source to target without user space buffers when the platform
+    allows it, with shutil otherwise
+    """
+
+    size = os.path.getsize(source)
+    with open(source, 'rb') as src:
+        with open(target, 'wb') as dst:
+            if not _kernel_copy(src.fileno(), dst.fileno(), size):
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst, 1 << 20)
+
+    shutil.copymode(source, target)
+
+
+def reflink_file(source, target):
+    """Clone source into target sharing its blocks (copy on write),
+    returns False when the platform or the filesystem can not
+    """
+
+    if fcntl is None:
+        return False
+
+    with open(source, 'rb') as src:
+        with open(target, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except (IOError, OSError):
+                return False
+
+    shutil.copymode(source, target)
+    return True
+
+
+def hardlink_file(source, target):
+    """Hardlink source as target, returns False when it is not possible
+    """
+
+    try:
+        os.link(source, target)
+    except (AttributeError, OSError):
+        return False
+
+    return True
+
+
+def place_file(source, target, link='copy', threshold=LINK_THRESHOLD):
+    """Copy source into target, files of at least threshold bytes are
+    reflinked or hardlinked instead when link says so, returns the action
+    done: copied, reflinked or hardlinked
+    """
+
+    if link != 'copy' and os.path.getsize(source) >= threshold:
+        if link == 'reflink' and reflink_file(source, target):
+            return 'reflinked'
+
+        if link == 'hardlink' and hardlink_file(source, target):
+            return 'hardlinked'
+
+    copy_file(source, target)
+    return 'copied'
+
+
+class Renderer(object):
+    """
+    Renders template files and trees, compiled templates are cached by
+    path and revalidated by mtime and size
+    """
+
+    def __init__(self, max_entries=512):
+        super(Renderer, self).__init__()
+
+        self.max_entries = max_entries
+        self.entries = {}
+        self.order = []
+        self.lock = threading.Lock()
+
+    def compiled(self, filename):
+        """Return the CompiledTemplate of a file, None for binary files and
+        files without placeholders
+        """
+
+        stat = os.stat(filename)
+        signature = (stat.st_mtime, stat.st_size)
+        with self.lock:
+            cached = self.entries.get(filename)
+            if cached is not None and cached[0] == signature:
+                self.order.remove(filename)
+                self.order.append(filename)
+                return cached[1]
+
+        template = None
+        if not is_binary(filename):
+            with open(filename, 'rb') as fhandler:
+                data = fhandler.read()
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError:
+                text = None
+
+            if text is not None and PLACEHOLDER.search(text):
+                template = CompiledTemplate(text)
+
+        with self.lock:
+            if filename in self.entries:
+                self.order.remove(filename)
+
+            self.entries[filename] = (signature, template)
+            self.order.append(filename)
+            while len(self.order) > self.max_entries:
+                del self.entries[self.order.pop(0)]
+
+        return template
+
+    def render_file(self, source, target, values, link='copy',
+                    threshold=LINK_THRESHOLD):
+        """Render source into target, files without placeholders are
+        placed with place_file, returns the action done (rendered, copied,
+        reflinked or hardlinked)
+        """
+
+        template = self.compiled(source)
+        if template is None:
+            return place_file(source, target, link, threshold)
+
+        with open(target, 'wb') as fhandler:
+            fhandler.write(template.render(values).encode('utf-8'))
+        shutil.copymode(source, target)
+
+        return 'rendered'
@@ -7,35 +7,137 @@
 Sublime PySide adds support for Digia's PySide and Riberbancks PyQt libraries
 """
 
+import time
+
+IMPORT_STARTED = time.time()
+
 import os
 import sys
-import shutil
 import functools
 import threading
-import subprocess
-from glob import glob
 
 import sublime
 import sublime_plugin
 
-try:
-    import rope
-    import ropemate
-    assert ropemate
-    from rope.base.exceptions import RopeError, ResourceNotFoundError
-    ROPE_SUPPORT = True
-except ImportError:
-    ROPE_SUPPORT = False
+SUBLIME_TEXT_3 = sys.version_info >= (3, 3)
 
+# Sublime Text 3 imports the plugin as the PySide package
+PACKAGE = 'PySide.' if SUBLIME_TEXT_3 else ''
 
-if sys.version_info < (3, 3):
-    from converter import pyqt2pyside, pyside2pyqt
-    from converter.base import sip_api_2
-    SUBLIME_TEXT_3 = False
-else:
-    from PySide.converter import pyqt2pyside, pyside2pyqt
-    from PySide.converter.base import sip_api_2
-    SUBLIME_TEXT_3 = True
+
+class StartupProfile(object):
+    """
+    Import and plugin_loaded cost of the plugin and first use latency of
+    every lazily imported module, optionally appended to a log file
+    """
+
+    def __init__(self):
+        super(StartupProfile, self).__init__()
+
+        self.entries = []
+        self.filename = None
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """Record the seconds spent by name"""
+
+        with self.lock:
+            self.entries.append((name, seconds))
+            if self.filename is not None:
+                self._append(['{0} {1:.6f}'.format(name, seconds)])
+
+    def start_log(self, filename):
+        """Append the entries recorded so far and every later one to
+        filename
+        """
+
+        with self.lock:
+            self.filename = filename
+            self._append(['# {0} Sublime Text {1}'.format(
+                time.strftime('%Y-%m-%d %H:%M:%S'), sublime.version())] + [
+                '{0} {1:.6f}'.format(name, seconds)
+                for name, seconds in self.entries
+            ])
+
+    def _append(self, lines):
+        """Append lines to the log, errors disable the log"""
+
+        try:
+            directory = os.path.dirname(self.filename)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(self.filename, 'a') as fhandler:
+                fhandler.write('\n'.join(lines) + '\n')
+        except (IOError, OSError):
+            self.filename = None
+
+    def lines(self):
+        """Return the report lines of the recorded entries"""
+
+        with self.lock:
+            entries = list(self.entries)
+
+        return ['{0:>9.3f}ms  {1}'.format(seconds * 1000, name)
+                for name, seconds in entries]
+
+
+class LazyModule(object):
+    """
+    A module imported on first attribute access, the import time is
+    recorded in the startup profile. Plugin modules are relative to the
+    package directory
+    """
+
+    def __init__(self, name, plugin=True):
+        self.__dict__['name'] = name
+        self.__dict__['fullname'] = PACKAGE + name if plugin else name
+        self.__dict__['module'] = None
+
+    def load(self):
+        """Import the module if it was not, returns it"""
+
+        module = self.__dict__['module']
+        if module is None:
+            started = time.time()
+            __import__(self.fullname)
+            module = sys.modules[self.fullname]
+            self.__dict__['module'] = module
+            startup_profile.record(
+                'first use {0}'.format(self.name), time.time() - started)
+
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+
+startup_profile = StartupProfile()
+
+subprocess = LazyModule('subprocess', plugin=False)
+rope_project = LazyModule('rope.base.project', plugin=False)
+rope_exceptions = LazyModule('rope.base.exceptions', plugin=False)
+ropemate = LazyModule('ropemate', plugin=False)
+ROPE_SUPPORT = None
+
+pyqt2pyside = LazyModule('converter.pyqt2pyside')
+pyside2pyqt = LazyModule('converter.pyside2pyqt')
+converter_base = LazyModule('converter.base')
+converter_batch = LazyModule('converter.batch')
+converter_cache = LazyModule('converter.cache')
+converter_engine = LazyModule('converter.engine')
+rcc = LazyModule('builder.rcc')
+builder_jobs = LazyModule('builder.jobs')
+builder_cache = LazyModule('builder.cache')
+builder_daemon = LazyModule('builder.daemon')
+builder_qm = LazyModule('builder.qm')
+builder_graph = LazyModule('builder.graph')
+builder_settings = LazyModule('builder.settings')
+builder_tools = LazyModule('builder.tools')
+linguist_extract = LazyModule('linguist.extract')
+scaffold_registry = LazyModule('scaffold.registry')
+scaffold_render = LazyModule('scaffold.render')
+scaffold_generate = LazyModule('scaffold.generate')
+scaffold_project = LazyModule('scaffold.project')
 
 
 # =============================================================================
@@ -79,12 +181,7 @@ class ConvertPyQt42PySideCommand(sublime_plugin.TextCommand):
         """Determine if this command is enabled
         """
 
-        if 'from PyQt4' in self.view.substr(
-            sublime.Region(0, self.view.size())
-        ):
-            return True
-
-        return False
+        return import_index.get(self.view).imports('PyQt4')
 
 
 class ConvertPySide2PyQt4Command(sublime_plugin.TextCommand):
@@ -107,12 +204,191 @@ class ConvertPySide2PyQt4Command(sublime_plugin.TextCommand):
         """Determine if this command is enabled
         """
 
-        if 'from PySide' in self.view.substr(
-            sublime.Region(0, self.view.size())
-        ):
-            return True
+        return import_index.get(self.view).imports('PySide')
 
-        return False
+
+class PreviewQtConversionCommand(sublime_plugin.TextCommand):
+    """Show the diff of converting the buffer without touching it
+    """
+
+    def run(self, edit, target='PySide'):
+        """Run the command
+        """
+
+        text = self.view.substr(sublime.Region(0, self.view.size()))
+        patch = converter_batch.conversion_diff(
+            text, target, self.view.file_name() or 'untitled',
+            get_conversion_cache().convert(text, target)
+        )
+
+        write_output_panel(
+            self.view.window(), 'sublimepyside_preview',
+            patch or 'Nothing to convert to {0}\n'.format(target),
+            'Packages/Diff/Diff.tmLanguage'
+        )
+
+    def is_enabled(self, target='PySide'):
+        """Determine if this command is enabled
+        """
+
+        source = 'PyQt4' if target == 'PySide' else 'PySide'
+        return import_index.get(self.view).imports(source)
+
+
+class ApplyQtConversionCommand(sublime_plugin.TextCommand):
+    """Apply a batch of conversion edits computed in the background
+    """
+
+    def run(self, edit, change_count, edits):
+        """Run the command
+        """
+
+        if self.view.change_count() != change_count:
+            return
+
+        for begin, end, text in edits:
+            self.view.replace(edit, sublime.Region(begin, end), text)
+
+
+class CancelQtConversionCommand(sublime_plugin.TextCommand):
+    """Cancel the running conversion of the buffer
+    """
+
+    def run(self, edit):
+        """Run the command
+        """
+
+        thread = ConversionThread.running.get(self.view.id())
+        if thread is not None:
+            thread.cancel()
+
+    def is_enabled(self):
+        """Determine if this command is enabled
+        """
+
+        return self.view.id() in ConversionThread.running
+
+
+class ShowConversionCacheStatsCommand(sublime_plugin.WindowCommand):
+    """Show the conversion cache hit and miss counters
+    """
+
+    def run(self):
+        """Run the command
+        """
+
+        stats = get_conversion_cache().stats()
+        write_output_panel(self.window, 'sublimepyside_cache', (
+            'Conversion cache: {hits} hits ({disk_hits} from disk), '
+            '{misses} misses, {entries}/{max_entries} entries in memory\n'
+            'Disk cache: {directory}\n'.format(**stats)
+        ))
+
+
+class ShowStartupProfileCommand(sublime_plugin.WindowCommand):
+    """Show the plugin import and plugin_loaded cost and the first use
+    latency of every subsystem loaded so far
+    """
+
+    def run(self):
+        """Run the command
+        """
+
+        write_output_panel(self.window, 'sublimepyside_profile', (
+            '\n'.join(startup_profile.lines()) + '\n'
+            'Log: {0}\n'.format(startup_profile.filename or 'disabled')
+        ))
+
+
+class CancelQtJobsCommand(sublime_plugin.WindowCommand):
+    """Cancel every queued or running Qt tool job
+    """
+
+    def run(self):
+        """Run the command
+        """
+
+        get_job_queue().cancel_all()
+
+    def is_enabled(self):
+        """Determine if the command is enabled
+        """
+
+        return job_queue is not None and len(job_queue.jobs()) > 0
+
+
+class QtPanelAppendCommand(sublime_plugin.TextCommand):
+    """Append text to an output panel, optionally clearing it first
+    """
+
+    def run(self, edit, characters, clear=False):
+        """Run the command
+        """
+
+        self.view.set_read_only(False)
+        if clear:
+            self.view.erase(edit, sublime.Region(0, self.view.size()))
+
+        self.view.insert(edit, self.view.size(), characters)
+        self.view.set_read_only(True)
+        self.view.show(self.view.size())
+
+
+class ToggleQtWatchModeCommand(sublime_plugin.WindowCommand):
+    """Enable or disable the .ui and .qrc watch mode
+    """
+
+    def run(self):
+        """Run the command
+        """
+
+        settings = sublime.load_settings('SublimePySide.sublime-settings')
+        options = settings.get('sublimepyside_watch_mode') or {}
+        options['enabled'] = not options.get('enabled', False)
+        settings.set('sublimepyside_watch_mode', options)
+        sublime.save_settings('SublimePySide.sublime-settings')
+
+        sublime.status_message('Qt watch mode {0}'.format(
+            'enabled' if options['enabled'] else 'disabled'))
+
+
+class QtWatchListener(sublime_plugin.EventListener):
+    """Recompiles .ui and .qrc files in the background when they, or any
+    asset referenced by a .qrc, are saved
+    """
+
+    def on_post_save(self, view):
+        """Called after a view has been saved
+        """
+
+        window = view.window()
+        if window is not None and qt_watcher.is_enabled():
+            qt_watcher.saved(window, view.file_name())
+
+    def on_activated(self, view):
+        """Catch files saved outside Sublime Text (Qt Designer)
+        """
+
+        window = view.window()
+        if window is not None and qt_watcher.is_enabled():
+            qt_watcher.activated(window)
+
+
+class QtImportIndexListener(sublime_plugin.EventListener):
+    """Keeps the per view Qt import index up to date
+    """
+
+    def on_modified(self, view):
+        """Schedule a refresh of the view import index
+        """
+
+        import_index.schedule_refresh(view)
+
+    def on_close(self, view):
+        """Forget about closed views
+        """
+
+        import_index.discard(view)
 
 
 class OpenFileInDesignerCommand(sublime_plugin.WindowCommand):
@@ -155,7 +431,7 @@ class NewDialogCommand(sublime_plugin.WindowCommand):
         """Determine if this command is enbaled in determinate conditions
         """
 
-        designer = get_settings('sublimepyside_qt_tools_map').get('designer')
+        designer = plugin_settings.tool('designer')
         if designer is None:
             return False
 
@@ -210,8 +486,9 @@ class GenerateTranslationsCommand(sublime_plugin.WindowCommand):
     """Generate Qt Linguist TS files
     """
 
-    def run(self, files=[], dirs=[]):
-        """Run the command
+    def run(self, files=[], dirs=[], engine=None):
+        """Run the command, engine is pyside-lupdate or builtin (defaults
+        to the sublimepyside_lupdate_engine setting)
         """
 
         if not files and not dirs:
@@ -220,7 +497,12 @@ class GenerateTranslationsCommand(sublime_plugin.WindowCommand):
             )
             return
 
-        PySideLupdateCommand(self.window).generate_translations(files, dirs)
+        if engine is None:
+            engine = plugin_settings.get('sublimepyside_lupdate_engine')
+
+        lupdate = PySideLupdateCommand(self.window, engine == 'builtin')
+        if lupdate.is_valid:
+            lupdate.generate_translations(files, dirs)
 
     def is_enabled(self, files=[], dirs=[]):
         """Determine if the command is enabled
@@ -231,13 +513,56 @@ class GenerateTranslationsCommand(sublime_plugin.WindowCommand):
                 if filename.endswith('.py') or filename.endswith('.pro'):
                     return True
 
-        for dirname in dirs:
-            for filename in glob('{}/{}'.format(dirname, '*[.py,.pro]')):
-                if filename.endswith('.py') or filename.endswith('.pro'):
-                    return True
+        ignore = plugin_settings.get('sublimepyside_ignore_patterns') or None
+        for filename in builder_graph.walk(dirs, ('.py', '.pro'), ignore):
+            return True
+
+        return False
+
+
+class CompileTranslationsCommand(sublime_plugin.WindowCommand):
+    """Compile Qt Linguist TS files into QM files without lrelease
+    """
+
+    def run(self, files=[], dirs=[], force=False):
+        """Run the command
+        """
+
+        catalogs = list(self.catalogs(files, dirs))
+        if not catalogs:
+            sublime.error_message('This command will process TS files only.')
+            return
+
+        CompileTranslationsThread(self.window, catalogs, force).start()
+
+    def is_enabled(self, files=[], dirs=[], force=False):
+        """Determine if the command is enabled
+        """
+
+        for catalog in self.catalogs(files, dirs):
+            return True
 
         return False
 
+    def catalogs(self, files, dirs):
+        """Generator of the TS files of the side bar selection or the
+        active view, directories are walked lazily
+        """
+
+        if not files and not dirs:
+            view = self.window.active_view()
+            if view is not None and (view.file_name() or '').endswith('.ts'):
+                yield view.file_name()
+            return
+
+        for filename in files:
+            if filename.endswith('.ts'):
+                yield filename
+
+        ignore = plugin_settings.get('sublimepyside_ignore_patterns') or None
+        for filename in builder_graph.walk(dirs, ('.ts',), ignore):
+            yield filename
+
 
 class CompileCommons:
     """Compile commons methods and parameters
@@ -263,7 +588,7 @@ class CompileResourceCommand(sublime_plugin.WindowCommand, CompileCommons):
     """Compile Qt Resources
     """
 
-    def run(self, files=[]):
+    def run(self, files=[], force=False):
         """Run the command
         """
 
@@ -274,12 +599,12 @@ class CompileResourceCommand(sublime_plugin.WindowCommand, CompileCommons):
                     'This command will process QRC files only.'
                 )
             else:
-                RCCCommand(self.window).compile()
+                RCCCommand(self.window).compile(force=force)
         else:
             for filename in files:
-                RCCCommand(self.window).compile(filename)
+                RCCCommand(self.window).compile(filename, force)
 
-    def is_enabled(self, files=[]):
+    def is_enabled(self, files=[], force=False):
         """Determine if the command is enabled
         """
 
@@ -291,17 +616,17 @@ class CompileUiCommand(sublime_plugin.WindowCommand, CompileCommons):
     """Compile Qt UI files
     """
 
-    def run(self, files=[]):
+    def run(self, files=[], force=False):
         """Run the command
         """
 
         if not files:
-            PyUicCommand(self.window).compile()
+            PyUicCommand(self.window).compile(force=force)
         else:
             for filename in files:
-                PyUicCommand(self.window).compile(filename)
+                PyUicCommand(self.window).compile(filename, force)
 
-    def is_enabled(self, files=[]):
+    def is_enabled(self, files=[], force=False):
         """Determine if the command is enabled
         """
 
@@ -309,6 +634,23 @@ class CompileUiCommand(sublime_plugin.WindowCommand, CompileCommons):
         return CompileCommons.is_enabled(self, files)
 
 
+class BuildQtArtifactsCommand(sublime_plugin.WindowCommand):
+    """Build every Qt artifact (ui, qrc and translations) of the project
+    """
+
+    def run(self, force=False, translations=True):
+        """Run the command
+        """
+
+        BuildQtArtifactsThread(self.window, force, translations).start()
+
+    def is_enabled(self, force=False, translations=True):
+        """Determine if the command is enabled
+        """
+
+        return len(self.window.folders()) > 0
+
+
 class PreviewUiCommand(sublime_plugin.WindowCommand):
     """Preview an UI file
     """
@@ -339,16 +681,19 @@ class CreateQtProjectThread(threading.Thread):
     """
     def __init__(self, window):
         self.window = window
+        self.panel = OutputPanel(window, 'sublimepyside_project')
         self.tplmanager = TplManager(
             sublime.packages_path(),
-            get_settings('sublimepyside_package'),
-            get_settings('sublimepyside_data_dir')
+            plugin_settings.get('sublimepyside_package'),
+            plugin_settings.get('sublimepyside_data_dir'),
+            get_template_registry()
         )
 
         self.folders = self.window.folders()
+        self.templates = []
         self.proj_dir = None
         self.proj_name = None
-        self.proj_library = get_settings('sublimepyside_library')
+        self.proj_library = plugin_settings.get('sublimepyside_library')
         self.library_options = ['Use Digia\'s PySide', 'Use RiverBank PyQt4']
 
         threading.Thread.__init__(self)
@@ -360,13 +705,16 @@ class CreateQtProjectThread(threading.Thread):
 
         def show_quick_pane():
             """Just a wrapper to get set_timeout on OSX and Windows"""
-            if not self.tplmanager.get_template_list():
+            self.templates = self.tplmanager.get_templates()
+            if not self.templates:
                 sublime.error_message(
                     "{0}: There are no templates to list.".format(__name__))
                 return
 
             self.window.show_quick_panel(
-                list(self.tplmanager.get_template_list()), self.tpl_selected)
+                [template.panel_item() for template in self.templates],
+                self.tpl_selected
+            )
 
         sublime.set_timeout(show_quick_pane, 10)
 
@@ -377,8 +725,7 @@ class CreateQtProjectThread(threading.Thread):
         if picked == -1:
             return
 
-        tpl_list = list(self.tplmanager.get_template_list())
-        self.tplmanager.selected = tpl_list[picked].split('::')[0]
+        self.tplmanager.selected = self.templates[picked].name
 
         suggest = self.folders[0] if self.folders else os.path.expanduser('~')
         self.window.show_input_panel(
@@ -414,7 +761,7 @@ class CreateQtProjectThread(threading.Thread):
 
         self.proj_name = name
 
-        if not get_settings('sublimepyside_library_ask', bool):
+        if not plugin_settings.get('sublimepyside_library_ask'):
             self.generate_project()
         else:
             self.window.show_quick_panel(
@@ -441,9 +788,22 @@ class CreateQtProjectThread(threading.Thread):
         )
 
         if self.tplmanager.is_valid(self.tplmanager.get_selected()):
-            project.generate_project()
+            try:
+                results = project.generate_project(
+                    plugin_settings.get('sublimepyside_project_generation'))
+            except scaffold_generate.GenerationError as error:
+                sublime.error_message(
+                    'Could not create the project at {0}\n{1}'.format(
+                        self.proj_dir, error))
+                return
+
+            self.panel.write(
+                'Generated {0}\n{1}\n'.format(
+                    self.proj_dir,
+                    '\n'.join(scaffold_generate.report(results))),
+                clear=True
+            )
 
-            project.generate_st2_project()
             if SUBLIME_TEXT_3 is False:
                 project.generate_rope_project()
 
@@ -461,86 +821,332 @@ class CreateQtProjectThread(threading.Thread):
             )
 
 
-# =============================================================================
-# Sublime Text 2 specific code
-# =============================================================================
-if SUBLIME_TEXT_3 is False:
-    class ConversionWorker(threading.Thread):
-        """
-        Base worker class for PySide <--> PyQt4 converters
+class ExtractTranslationsThread(threading.Thread):
+    """
+    Worker that extracts the messages of python sources into TS catalogs
+    without pyside-lupdate
+    """
 
-        This is only used in Sublime Text 2
-        """
-        def __init__(self, view):
-            threading.Thread.__init__(self)
-            self.view = view
+    def __init__(self, window, targets):
+        self.panel = OutputPanel(window, 'sublimepyside_tools')
+        self.targets = targets
+        self.cache = get_extraction_cache()
 
-        def run(self):
-            """
-            Starts the thread
-            """
+        threading.Thread.__init__(self)
 
-            def show_conversion_confirmation():
-                """Shows a confirmation dialog and proceed if true"""
+    def run(self):
+        """
+        Starts the thread
+        """
 
-                if self.__class__.__name__ == 'PyQt42PySideWorker':
-                    library = 'PySide'
-                else:
-                    library = 'PyQt4'
+        for sources, catalog in self.targets:
+            stats, errors = linguist_extract.update_catalog(
+                sources, catalog, self.cache, processes=False)
 
-                if sublime.ok_cancel_dialog(
-                    'Do you really want to convert this file to %s' % library
-                ):
-                    self.qt_conversion()
+            for error in errors:
+                self.panel.write('{0}\n'.format(error))
 
-            sublime.set_timeout(show_conversion_confirmation, 10)
+            self.panel.write(
+                '[{0}] {1} new, {2} existing and {3} obsolete messages in '
+                '{4} files\n'.format(
+                    os.path.basename(catalog), stats['new'],
+                    stats['existing'], stats['obsolete'], len(sources))
+            )
 
-        def qt_conversion(self):
-            """Must be reimplemnted"""
+            if errors:
+                self.panel.show()
 
-            raise NotImplementedError('qt_conversion not implemented yet')
-# =============================================================================
-# Sublime Text 3 specific code
-# =============================================================================
-else:
-    class ConversionWorker(object):
-        """
-        Base worker class for PySide <--> PyQt4 converters
 
-        This is only used in Sublime Text 3
-        """
-        def __init__(self, view):
-            self.view = view
+class CompileTranslationsThread(threading.Thread):
+    """
+    Worker that compiles TS catalogs into QM files, catalogs that did not
+    change since their last compilation are skipped
+    """
 
-        def run(self):
-            """
-            Starts the thread
-            """
+    def __init__(self, window, catalogs, force=False):
+        self.panel = OutputPanel(window, 'sublimepyside_tools')
+        self.catalogs = catalogs
+        self.force = force
+        self.jobs = plugin_settings.get('sublimepyside_jobs')
 
-            def show_conversion_confirmation():
-                """Shows a confirmation dialog and proceed if true"""
+        threading.Thread.__init__(self)
 
-                if self.__class__.__name__ == 'PyQt42PySideWorker':
-                    library = 'PySide'
-                else:
-                    library = 'PyQt4'
+    def run(self):
+        """
+        Starts the thread
+        """
 
-                if sublime.ok_cancel_dialog(
-                    'Do you really want to convert this file to %s' % library
-                ):
-                    self.qt_conversion()
+        results = builder_qm.compile_catalogs(
+            self.catalogs, get_build_cache(),
+            self.jobs.get('max_workers') or None, False, self.force
+        )
 
-            show_conversion_confirmation()
+        counts = {'compiled': 0, 'up to date': 0, 'failed': 0}
+        for catalog, output, stats, error in results:
+            if error is not None:
+                counts['failed'] += 1
+                self.panel.write('{0}\n'.format(error))
+            elif stats is None:
+                counts['up to date'] += 1
+                self.panel.write(
+                    '[{0}] up to date\n'.format(os.path.basename(output)))
+            else:
+                counts['compiled'] += 1
+                self.panel.write(
+                    '[{0}] {1} finished and {2} unfinished translations, '
+                    '{3} untranslated\n'.format(
+                        os.path.basename(output), stats['finished'],
+                        stats['unfinished'], stats['untranslated'])
+                )
 
-        def qt_conversion(self):
-            """Must be reimplemnted"""
+        if counts['failed']:
+            self.panel.show()
 
-            raise NotImplementedError('qt_conversion not implemented yet')
+        sublime.set_timeout(lambda: sublime.status_message(
+            'QM files: {0} compiled, {1} up to date, {2} failed'.format(
+                counts['compiled'], counts['up to date'], counts['failed'])
+        ), 0)
 
 
-class PyQt42PySideWorker(ConversionWorker):
+class BuildQtArtifactsThread(threading.Thread):
+    """
+    Worker that plans and executes the Qt artifacts build graph
     """
-    Worker class to convert PyQt4 buffer to PySide Syntax.
+
+    def __init__(self, window, force=False, translations=True):
+        self.panel = OutputPanel(window, 'sublimepyside_tools')
+        self.folders = window.folders()
+        self.force = force
+        self.translations = translations
+        self.tools = plugin_settings.get('sublimepyside_tools_map')
+        self.rcc_options = plugin_settings.rcc_options()
+        self.jobs = plugin_settings.get('sublimepyside_jobs')
+        self.tool_daemon = get_tool_daemon()
+        self.ignore = (
+            plugin_settings.get('sublimepyside_ignore_patterns') or None)
+        self.builtin_rcc = get_builtin_rcc()
+
+        threading.Thread.__init__(self)
+
+    def run(self):
+        """
+        Starts the thread
+        """
+
+        self.panel.write('Building Qt artifacts...\n', clear=True)
+        self.panel.show()
+
+        graph = builder_graph.plan(
+            self.folders, self.tools, self.rcc_options, self.translations,
+            self.ignore, self.builtin_rcc
+        )
+
+        def on_output(job, line):
+            self.panel.write(line)
+
+        def on_task(task, job):
+            status = job.status if job is not None else task.state
+            self.panel.write('[{0}] {1}\n'.format(task.name, status))
+
+        scheduler = builder_graph.Scheduler(
+            graph, get_build_cache(), self.jobs.get('max_workers') or None,
+            self.force, self.jobs.get('timeout'), on_output, on_task,
+            self.tool_daemon, **Command.popen_kwargs()
+        )
+        success = scheduler.run()
+
+        self.panel.write('\n'.join(scheduler.report()) + '\n')
+        sublime.set_timeout(lambda: sublime.status_message(
+            'Qt artifacts build {0}'.format(
+                'finished' if success else 'failed')), 0)
+
+
+class ConversionThread(threading.Thread):
+    """
+    Worker that computes the conversion edits of a buffer snapshot
+    """
+
+    running = {}
+
+    def __init__(self, view, target):
+        self.view_id = view.id()
+        self.text = view.substr(sublime.Region(0, view.size()))
+        self.change_count = view.change_count()
+        self.target = target
+        self.progress = 0
+        self.edits = None
+        self.cancelled = threading.Event()
+
+        threading.Thread.__init__(self)
+
+    def run(self):
+        """
+        Starts the thread
+        """
+
+        cache = get_conversion_cache()
+        converted = cache.get(self.text, self.target)
+        if converted is not None:
+            self.edits = converter_engine.line_regions(self.text, converted)
+            return
+
+        try:
+            edits = converter_batch.conversion_edits(
+                self.text, self.target, self.checkpoint)
+        except converter_engine.ConversionCancelled:
+            return
+
+        cache.put(self.text, self.target,
+                  converter_batch.convert_text(self.text, self.target))
+        self.edits = edits
+
+    def checkpoint(self, position):
+        """Update the progress and abort if the thread has been cancelled"""
+
+        if self.cancelled.is_set():
+            raise converter_engine.ConversionCancelled()
+
+        self.progress = position * 100 // max(len(self.text), 1)
+
+    def cancel(self):
+        """Cancel the conversion"""
+
+        self.cancelled.set()
+
+
+# =============================================================================
+# Sublime Text 2 specific code
+# =============================================================================
+if SUBLIME_TEXT_3 is False:
+    class ConversionWorker(threading.Thread):
+        """
+        Base worker class for PySide <--> PyQt4 converters
+
+        This is only used in Sublime Text 2
+        """
+        def __init__(self, view):
+            threading.Thread.__init__(self)
+            self.view = view
+
+        def run(self):
+            """
+            Starts the thread
+            """
+
+            def show_conversion_confirmation():
+                """Shows a confirmation dialog and proceed if true"""
+
+                if self.__class__.__name__ == 'PyQt42PySideWorker':
+                    library = 'PySide'
+                else:
+                    library = 'PyQt4'
+
+                if sublime.ok_cancel_dialog(
+                    'Do you really want to convert this file to %s' % library
+                ):
+                    self.qt_conversion()
+
+            sublime.set_timeout(show_conversion_confirmation, 10)
+
+        def qt_conversion(self):
+            """Must be reimplemnted"""
+
+            raise NotImplementedError('qt_conversion not implemented yet')
+# =============================================================================
+# Sublime Text 3 specific code
+# =============================================================================
+else:
+    class ConversionWorker(object):
+        """
+        Base worker class for PySide <--> PyQt4 converters
+
+        This is only used in Sublime Text 3, the conversion is computed by
+        a ConversionThread and applied in a single apply_qt_conversion
+        command if the buffer did not change in the meantime
+        """
+
+        status_key = 'sublimepyside_conversion'
+        max_attempts = 3
+
+        def __init__(self, view):
+            self.view = view
+
+        def run(self):
+            """
+            Starts the thread
+            """
+
+            def show_conversion_confirmation():
+                """Shows a confirmation dialog and proceed if true"""
+
+                if self.__class__.__name__ == 'PyQt42PySideWorker':
+                    library = 'PySide'
+                else:
+                    library = 'PyQt4'
+
+                if sublime.ok_cancel_dialog(
+                    'Do you really want to convert this file to %s' % library
+                ):
+                    self.start_conversion(library)
+
+            show_conversion_confirmation()
+
+        def start_conversion(self, target, attempt=1):
+            """Start a conversion thread, cancels any previous one"""
+
+            previous = ConversionThread.running.get(self.view.id())
+            if previous is not None:
+                previous.cancel()
+
+            thread = ConversionThread(self.view, target)
+            ConversionThread.running[self.view.id()] = thread
+            thread.start()
+
+            self.monitor(thread, attempt)
+
+        def monitor(self, thread, attempt):
+            """Show the progress and apply the edits once done"""
+
+            if thread.is_alive():
+                self.view.set_status(self.status_key, (
+                    'Converting to {0}... {1}% '
+                    '(SublimePySide: Cancel conversion to abort)'.format(
+                        thread.target, thread.progress)))
+                sublime.set_timeout(
+                    lambda: self.monitor(thread, attempt), 100)
+                return
+
+            self.view.erase_status(self.status_key)
+            if ConversionThread.running.get(self.view.id()) is thread:
+                del ConversionThread.running[self.view.id()]
+
+            if thread.cancelled.is_set() or thread.edits is None:
+                sublime.status_message('Conversion cancelled')
+                return
+
+            if self.view.change_count() != thread.change_count:
+                if attempt < self.max_attempts:
+                    self.start_conversion(thread.target, attempt + 1)
+                else:
+                    sublime.status_message(
+                        'Buffer changed during conversion, discarded')
+                return
+
+            if thread.edits:
+                self.view.run_command('apply_qt_conversion', {
+                    'change_count': thread.change_count,
+                    'edits': thread.edits
+                })
+
+        def qt_conversion(self):
+            """Must be reimplemnted"""
+
+            raise NotImplementedError('qt_conversion not implemented yet')
+
+
+class PyQt42PySideWorker(ConversionWorker):
+    """
+    Worker class to convert PyQt4 buffer to PySide Syntax.
 
     Note that there is not automatically conversion from PyQt API 1
     to PySide yet so you should remove all the QVariant stuff yourself.
@@ -559,17 +1165,13 @@ class PyQt42PySideWorker(ConversionWorker):
     def remove_api_imports(self):
         """Remove api conversions for PyQt4 API 2"""
 
-        # line_one = self.view.find('import sip', 0)
-        line_one = self.view.find('# PyQT4 API 2 SetUp.', 0)
-        if not line_one:
-            line_one = self.view.find('from sip import setapi', 0)
+        index = import_index.get(self.view)
+        line_one = index.sip_header
 
         # At this point we already changed PyQt4 occurrences to PySide
-        line_two = self.view.find('from PySide', 0)
-        if not line_two:
-            line_two = self.view.find('import PySide', 0)
+        line_two = index.first_import('PySide')
 
-        if not line_one or not line_two:
+        if line_one is None or line_two is None:
             return
 
         region = sublime.Region(line_one.a, self.view.line(line_two).a)
@@ -601,24 +1203,20 @@ class PySide2PyQt4Worker(ConversionWorker):
     def insert_api_imports(self):
         """Insert api conversions for PyQt4 API 2"""
 
-        pyqt4import = self.view.find('from PyQt4', 0)
-        if not pyqt4import:
-            pyqt4import = self.view.find('import PyQt4', 0)
-            if not pyqt4import:
-                return
-
-        prior_lines = self.view.lines(sublime.Region(0, pyqt4import.a))
-        insert_import_str = '\n' + sip_api_2 + '\n'
-        existing_imports_str = self.view.substr(
-            sublime.Region(prior_lines[0].a, prior_lines[-1].b))
+        index = import_index.get(self.view)
+        pyqt4import = index.first_import('PyQt4')
+        if pyqt4import is None:
+            return
 
-        if insert_import_str.rstrip() in existing_imports_str:
+        header = index.sip_header
+        if header is not None and header.a < pyqt4import.a:
             return
 
-        insert_import_point = prior_lines[-1].a
+        insert_import_str = '\n' + converter_base.sip_api_2 + '\n'
+        insert_import_point = self.view.line(pyqt4import).a
 
         edit = self.edit if self.edit is not None else self.view.begin_edit()
-        self.view.insert(self.edit, insert_import_point, insert_import_str)
+        self.view.insert(edit, insert_import_point, insert_import_str)
         self.view.end_edit(edit)
 
 
@@ -653,70 +1251,23 @@ class Project(object):
 
         self.ropemanager.create_project(self.root)
 
-    def generate_st2_project(self):
+    def generate_project(self, options=None):
         """
-        Create Sublime Text 2 project file
+        Create the project files and the project file in a staging
+        directory and publish them into the project root at once (see
+        scaffold.project), returns the generate results
         """
 
-        file_name = '{0}/{1}.sublime-project'.format(self.root, self.name)
-        with open(file_name, 'w') as fdescriptor:
-            template_name = '{0}/template.sublime-project'.format(
-                self.tplmanager.get_template_dir())
-
-            with open(template_name, 'r') as fhandler:
-                file_buffer = fhandler.read().replace(
-                    '${PATH}', self.root).replace('${QT_LIBRARY}', self.lib)
+        options = options or {}
+        sublime.status_message('Generating {0}...'.format(self.root))
 
-            fdescriptor.write(file_buffer)
-
-    def generate_project(self):
-        """
-        Create the project files
-        """
-
-        templates_dir = '{0}/{1}/*'.format(
-            self.tplmanager.get_template_dir(),
-            self.tplmanager.get_selected(True)
+        return scaffold_project.generate_project(
+            self.tplmanager.get_selected_template(), self.root, self.name,
+            self.lib, get_template_renderer(), options.get('jobs') or None,
+            options.get('link', 'copy'),
+            options.get('link_threshold', scaffold_render.LINK_THRESHOLD)
         )
 
-        for tpl in glob(templates_dir):
-            path = '{0}/{1}'.format(self.root, os.path.basename(tpl))
-
-            if os.path.isdir(tpl):
-                sublime.status_message('Copying {0} tree...'.format(tpl))
-                try:
-                    shutil.copytree(tpl, path)
-                except OSError as error:
-                    if error.errno != 17:
-                        message = '%d: %s' % (error.errno, error.strerror)
-                        sublime.error_message(message)
-                continue
-
-            with open(tpl, 'r') as fhandler:
-                app_name = (
-                    self.name.encode('utf-8')
-                    if SUBLIME_TEXT_3 is False else self.name
-                )
-
-                file_buffer = fhandler.read().replace(
-                    '${APP_NAME}', app_name).replace(
-                        '${QT_LIBRARY}', self.lib).replace(
-                            '${PyQT_API_CHECK}', self.pyqt_api_check())
-
-            with open(path, 'w') as fhandler:
-                fhandler.write(file_buffer)
-                sublime.status_message('Copying {0} file...'.format(tpl))
-
-    def pyqt_api_check(self):
-        """
-        If PyQt4 is used then we add API 2
-        """
-
-        if self.lib == 'PyQt4':
-            return sip_api_2
-
-        return ''
-
 
 class PySideProject(Project):
     """
@@ -745,12 +1296,15 @@ class TplManager(object):
     SublimePySide TemplateManager class
     """
 
-    def __init__(self, packagespath, packagedir=None, datadir=None):
+    def __init__(self, packagespath, packagedir=None, datadir=None,
+                 registry=None):
         super(TplManager, self).__init__()
 
         self.packagespath = packagespath
         self.packagedir = packagedir
         self.datadir = datadir
+        self.registry = registry or scaffold_registry.TemplateRegistry(
+            [self.get_template_dir()])
         self.selected = None
 
     def is_valid(self, template):
@@ -758,11 +1312,7 @@ class TplManager(object):
         Check if the given project template is valid
         """
 
-        tpl_list = list(self.get_template_list())
-        if template not in [tpl.split('::')[0] for tpl in tpl_list]:
-            return False
-
-        return True
+        return self.registry.get(template) is not None
 
     def get_template_dir(self):
         """
@@ -775,17 +1325,10 @@ class TplManager(object):
             self.datadir
         )
 
-    def get_template_list(self):
-        """
-        Generator for lazy templates list
-        """
+    def get_templates(self):
+        """Return the available templates (see scaffold.registry)"""
 
-        file_name = '{0}/templates.lst'.format(self.get_template_dir())
-        with open(file_name, 'r') as fhandler:
-            for tpl in fhandler.read().split('\n'):
-                if len(tpl):
-                    tpl_split = tpl.split(':')
-                    yield '{0}:: {1}'.format(tpl_split[0], tpl_split[1])
+        return self.registry.templates()
 
     def get_selected(self, dir_conversion=False):
         """Return the selected template"""
@@ -793,6 +1336,97 @@ class TplManager(object):
         return (self.selected.replace(' ', '_').lower()
                 if dir_conversion else self.selected)
 
+    def get_selected_template(self):
+        """Return the selected Template or None"""
+
+        return self.registry.get(self.selected)
+
+
+class PluginSettings(object):
+    """
+    SublimePySide settings loaded once and checked against the
+    builder.settings schema, values are dropped and the listeners called
+    when Sublime Text reports a change, the resolved tool paths and the
+    rcc options are kept until then
+    """
+
+    def __init__(self, name='SublimePySide.sublime-settings'):
+        super(PluginSettings, self).__init__()
+
+        self.name = name
+        self.settings = None
+        self.values = {}
+        self.memo = {}
+        self.listeners = []
+        self.lock = threading.RLock()
+
+    def load(self):
+        """Return the sublime Settings object, loaded on first use"""
+
+        with self.lock:
+            if self.settings is None:
+                self.settings = sublime.load_settings(self.name)
+                self.settings.add_on_change('sublimepyside', self.invalidate)
+
+            return self.settings
+
+    def get(self, name):
+        """Return the checked value of a setting"""
+
+        with self.lock:
+            if name not in self.values:
+                self.values[name] = builder_settings.validate(
+                    name, self.load().get(name))
+
+            return self.values[name]
+
+    def memoize(self, key, function):
+        """Return function() cached under key until the settings change"""
+
+        with self.lock:
+            if key not in self.memo:
+                self.memo[key] = function()
+
+            return self.memo[key]
+
+    def tool(self, name):
+        """Return the path of a tool of sublimepyside_tools_map or
+        sublimepyside_qt_tools_map, None if it is not configured
+        """
+
+        return self.memoize(('tool', name), lambda: resolve_tool(
+            self.get('sublimepyside_tools_map').get(name) or
+            self.get('sublimepyside_qt_tools_map').get(name)
+        ))
+
+    def rcc_options(self):
+        """Return the checked sublimepyside_rcc_options"""
+
+        return self.memoize(
+            'rcc_options', lambda: self.get('sublimepyside_rcc_options'))
+
+    def add_on_change(self, key, callback):
+        """Call callback() whenever the settings change"""
+
+        self.clear_on_change(key)
+        self.listeners.append((key, callback))
+
+    def clear_on_change(self, key):
+        """Remove the change listener with the given key"""
+
+        self.listeners[:] = [
+            listener for listener in self.listeners if listener[0] != key]
+
+    def invalidate(self):
+        """Forget every value and notify the listeners"""
+
+        with self.lock:
+            self.values.clear()
+            self.memo.clear()
+
+        for _, callback in list(self.listeners):
+            callback()
+
 
 class RopeManager(object):
     """
@@ -801,7 +1435,10 @@ class RopeManager(object):
 
     def __init__(self):
         super(RopeManager, self).__init__()
-        self.supported = ROPE_SUPPORT
+
+    @property
+    def supported(self):
+        return rope_support()
 
     def is_supported(self):
         """Returns true if rope is supported, otherwise returns false"""
@@ -817,23 +1454,278 @@ class RopeManager(object):
             return
 
         try:
-            rope_project = rope.base.project.Project(projectroot)
-            rope_project.close()
-        except (ResourceNotFoundError, RopeError) as error:
+            project = rope_project.Project(projectroot)
+            project.close()
+        except (rope_exceptions.ResourceNotFoundError,
+                rope_exceptions.RopeError) as error:
             msg = 'Could not create rope project folder at {0}\nException: {1}'
             sublime.status_message(msg.format(self.root, str(error)))
 
 
+class QtImportInfo(object):
+    """
+    Qt imports and PyQt4 API 2 header locations of a buffer
+    """
+
+    def __init__(self, change_count):
+        super(QtImportInfo, self).__init__()
+
+        self.change_count = change_count
+        self.regions = {}
+        self.sip_header = None
+
+    def imports(self, binding):
+        """Returns true if the buffer imports from the given binding"""
+
+        return ('from', binding) in self.regions
+
+    def first_import(self, binding):
+        """Return the region of the first import of the given binding"""
+
+        keys = [('from', binding), ('import', binding)]
+        regions = [self.regions[key] for key in keys if key in self.regions]
+
+        return min(regions, key=lambda region: region.a) if regions else None
+
+
+class QtImportIndex(object):
+    """
+    LRU map of view id to QtImportInfo
+
+    Entries are validated against the view change_count so menus and the
+    command palette get their answer without copying the buffer
+    """
+
+    max_size = 64
+    refresh_delay = 250
+
+    def __init__(self):
+        super(QtImportIndex, self).__init__()
+        self.entries = {}
+        self.order = []
+
+    def get(self, view):
+        """Return the (up to date) import info for the given view"""
+
+        info = self.entries.get(view.id())
+        if info is None or info.change_count != view.change_count():
+            info = self.scan(view)
+
+        if view.id() in self.entries:
+            self.order.remove(view.id())
+
+        self.entries[view.id()] = info
+        self.order.append(view.id())
+        while len(self.order) > self.max_size:
+            del self.entries[self.order.pop(0)]
+
+        return info
+
+    def scan(self, view):
+        """Look for Qt imports and the API 2 header using native finds"""
+
+        info = QtImportInfo(view.change_count())
+        for keyword in ('from', 'import'):
+            for binding in ('PyQt4', 'PySide'):
+                region = self._find(view, '{0} {1}'.format(keyword, binding))
+                if region is not None:
+                    info.regions[(keyword, binding)] = region
+
+        info.sip_header = self._find(view, '# PyQT4 API 2 SetUp.')
+        if info.sip_header is None:
+            info.sip_header = self._find(view, 'from sip import setapi')
+
+        return info
+
+    def schedule_refresh(self, view):
+        """Refresh the view entry once the user stops typing"""
+
+        if view.id() not in self.entries:
+            return
+
+        change_count = view.change_count()
+
+        def refresh():
+            if view.change_count() == change_count:
+                self.get(view)
+
+        sublime.set_timeout(refresh, self.refresh_delay)
+
+    def discard(self, view):
+        """Drop the entry of the given view"""
+
+        if self.entries.pop(view.id(), None) is not None:
+            self.order.remove(view.id())
+
+    def _find(self, view, text):
+        """Literal find that returns None when there is no match"""
+
+        region = view.find(text, 0, sublime.LITERAL)
+        if region is None or region.a == -1:
+            return None
+
+        return region
+
+
+class QtWatcher(object):
+    """
+    Maps .ui files, .qrc files and qrc assets to the sources that have to
+    be recompiled when they change
+
+    Bursts of changes are coalesced in a debounce window and a newer
+    change cancels the stale in flight compilation of the same source
+    """
+
+    def __init__(self):
+        super(QtWatcher, self).__init__()
+
+        self.folders = None
+        self.targets = {}
+        self.mtimes = {}
+        self.generations = {}
+        self.running = {}
+
+    def is_enabled(self):
+        """Returns true if the watch mode is enabled"""
+
+        options = plugin_settings.get('sublimepyside_watch_mode')
+        return options.get('enabled', False) is True
+
+    def index(self, folders):
+        """Index every .ui and .qrc file under folders"""
+
+        if folders == self.folders:
+            return
+
+        self.folders = list(folders)
+        self.targets.clear()
+        self.mtimes.clear()
+        ignore = plugin_settings.get('sublimepyside_ignore_patterns') or None
+        for filename in builder_graph.walk(
+                self.folders, ('.ui', '.qrc'), ignore):
+            self.watch(filename)
+
+    def watch(self, source):
+        """Watch a .ui or .qrc source and the assets it references"""
+
+        inputs = [source]
+        if source.endswith('.qrc'):
+            inputs += builder_cache.qrc_assets(source)
+
+        for filename in inputs:
+            self.targets.setdefault(filename, set()).add(source)
+            self.mtimes[filename] = self._mtime(filename)
+
+    def saved(self, window, filename):
+        """A file has been saved in the editor"""
+
+        self.index(window.folders())
+        if filename.endswith(('.ui', '.qrc')):
+            self.watch(filename)
+
+        self.mtimes[filename] = self._mtime(filename)
+        for source in self.targets.get(filename, ()):
+            self.schedule(window, source)
+
+    def activated(self, window):
+        """The editor got the focus back, look for files changed outside"""
+
+        self.index(window.folders())
+        for filename, mtime in list(self.mtimes.items()):
+            current = self._mtime(filename)
+            if current != mtime:
+                self.mtimes[filename] = current
+                for source in self.targets.get(filename, ()):
+                    self.schedule(window, source)
+
+    def schedule(self, window, source):
+        """Compile source once no other change arrives in the window"""
+
+        options = plugin_settings.get('sublimepyside_watch_mode')
+        generation = self.generations.get(source, 0) + 1
+        self.generations[source] = generation
+
+        sublime.set_timeout(
+            lambda: self.compile(window, source, generation),
+            options.get('debounce', 500)
+        )
+
+    def compile(self, window, source, generation):
+        """Compile source if no newer change has been scheduled"""
+
+        if self.generations.get(source) != generation:
+            return
+
+        job = self.running.pop(source, None)
+        if job is not None and not job.done.is_set():
+            job.cancel()
+
+        if source.endswith('.ui') and plugin_settings.tool('uic'):
+            job = PyUicCommand(window).compile(source)
+        elif source.endswith('.qrc') and (
+                plugin_settings.tool('rcc') or get_builtin_rcc() is not None):
+            job = RCCCommand(window).compile_resource_file(
+                source, source.replace('.qrc', '_rc.py'),
+                plugin_settings.rcc_options()
+            )
+        else:
+            return
+
+        if job is not None:
+            self.running[source] = job
+
+    def _mtime(self, filename):
+        """Return the mtime of filename or None if it does not exist"""
+
+        try:
+            return os.path.getmtime(filename)
+        except OSError:
+            return None
+
+
+class OutputPanel(object):
+    """
+    Output panel that can be written from any thread
+    """
+
+    def __init__(self, window, name, syntax=None):
+        super(OutputPanel, self).__init__()
+
+        self.window = window
+        self.name = name
+        self.view = window.get_output_panel(name)
+        if syntax is not None:
+            self.view.set_syntax_file(syntax)
+
+    def write(self, text, clear=False):
+        """Append text to the panel"""
+
+        sublime.set_timeout(lambda: self.view.run_command(
+            'qt_panel_append', {'characters': text, 'clear': clear}), 0)
+
+    def show(self):
+        """Show the panel"""
+
+        sublime.set_timeout(lambda: self.window.run_command(
+            'show_panel', {'panel': 'output.{0}'.format(self.name)}), 0)
+
+
 class Command(object):
-    """Base class for external commands
+    """Base class for external commands, built-in tools set function (see
+    builder.jobs.FunctionJob) and version
     """
 
+    tool = None
+    function = None
+    version = None
+
     def __init__(self, command):
         self.command = command
         self.proc = None
 
-    def launch(self):
-        """Launch the external process
+    @staticmethod
+    def popen_kwargs():
+        """Return the subprocess.Popen keyword arguments
         """
 
         kwargs = {
@@ -846,19 +1738,95 @@ class Command(object):
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             kwargs['startupinfo'] = startupinfo
 
+        return kwargs
+
+    def launch(self):
+        """Launch the external process
+        """
+
         sub_args = [self.command] + self.options
-        self.proc = subprocess.Popen(sub_args, **kwargs)
+        self.proc = subprocess.Popen(sub_args, **self.popen_kwargs())
+
+    def enqueue(self, name=None, on_done=None):
+        """Run the external process through the tools job queue, its output
+        and exit status are reported in the tools output panel
+
+        Tools served by the tools daemon run in it, the configured binary
+        is spawned when the daemon is disabled or unavailable
+        """
+
+        panel = OutputPanel(self.window, 'sublimepyside_tools')
+        options = plugin_settings.get('sublimepyside_jobs')
+
+        def job_output(job, line):
+            panel.write(line)
+
+        def job_done(job):
+            panel.write('[{0}] {1} in {2:.2f}s\n'.format(
+                job.name, job.status, job.elapsed))
+            if not job.succeeded:
+                panel.show()
+
+            if on_done is not None:
+                on_done(job)
+
+        if self.function is not None:
+            job = builder_jobs.FunctionJob(
+                self.function, [self.command] + self.options, name=name,
+                timeout=options.get('timeout'), on_output=job_output,
+                on_done=job_done
+            )
+        else:
+            job = builder_daemon.DaemonJob(
+                get_tool_daemon() if self.tool else None, self.tool,
+                [self.command] + self.options, name=name,
+                timeout=options.get('timeout'), on_output=job_output,
+                on_done=job_done, **self.popen_kwargs()
+            )
+
+        return get_job_queue().submit(job)
+
+    def build(self, output, inputs, force=False):
+        """Enqueue the tool unless output is up to date with its inputs,
+        the tool path, the tool version and the options
+
+        The tool is never spawned here to ask its version, while it is
+        not known yet the output is built and its signature computed from
+        the worker thread once the job is done
+        """
+
+        cache = get_build_cache()
+        version = self.version or builder_cache.known_version(self.command)
+        signature = None
+        if version is not None:
+            signature = cache.signature(
+                inputs, self.command, self.options, version)
+            if not force and cache.is_up_to_date(output, signature):
+                sublime.status_message(
+                    '{0} is up to date'.format(os.path.basename(output)))
+                return None
+
+        def build_done(job):
+            if job.succeeded:
+                cache.record(output, signature or cache.signature(
+                    inputs, self.command, self.options))
+            else:
+                cache.forget(output)
+
+        return self.enqueue(os.path.basename(inputs[0]), build_done)
 
 
 class PyUicCommand(Command):
     """PySide-uic
     """
 
+    tool = 'uic'
+
     def __init__(self, window):
         self.window = window
         self.options = []
 
-        command = get_settings('sublimepyside_tools_map').get('uic')
+        command = plugin_settings.tool('uic')
         if command is None:
             self.is_valid = False
             sublime.error_message(
@@ -878,26 +1846,36 @@ class PyUicCommand(Command):
         self.options += ['-p', filename]
         self.launch()
 
-    def compile(self, filename=None):
-        """Compile a UI file
+    def compile(self, filename=None, force=False):
+        """Compile a UI file, skips it if the output is up to date
         """
 
         if filename is None:
             filename = self.window.active_view().file_name()
 
-        self.options += ['-o', filename.replace('.ui', '_ui.py'), filename]
-        self.launch()
+        output = filename.replace('.ui', '_ui.py')
+        self.options += builder_tools.uic_arguments(filename, output)
+        return self.build(output, [filename], force)
 
 
 class RCCCommand(Command):
     """PySide-rcc
     """
 
+    tool = 'rcc'
+
     def __init__(self, window):
         self.window = window
         self.options = []
 
-        command = get_settings('sublimepyside_tools_map').get('rcc')
+        self.function = get_builtin_rcc()
+        if self.function is not None:
+            self.is_valid = True
+            self.version = rcc.COMPILER_VERSION
+            super(RCCCommand, self).__init__(rcc.COMPILER)
+            return
+
+        command = plugin_settings.tool('rcc')
         if command is None:
             self.is_valid = False
             sublime.error_message(
@@ -907,7 +1885,7 @@ class RCCCommand(Command):
             self.is_valid = True
             super(RCCCommand, self).__init__(command)
 
-    def compile(self, filename=None):
+    def compile(self, filename=None, force=False):
         """Compile a file
         """
 
@@ -915,44 +1893,37 @@ class RCCCommand(Command):
             filename = self.window.active_view().file_name()
 
         if filename.lower().endswith('.qrc'):
-            rcc_options = get_settings('sublimepyside_rcc_options')
+            rcc_options = plugin_settings.rcc_options()
             if rcc_options.get('output_file', '') != 'same_rc':
                 self.window.show_input_panel(
                     'Output filename (with no extension):',
                     filename.replace('.qrc', '_rc'),
                     lambda name: self.compile_resource_file(
-                        filename, '{0}.py'.format(name.strip()), rcc_options
+                        filename, '{0}.py'.format(name.strip()), rcc_options,
+                        force
                     ), None, None
                 )
             else:
                 self.compile_resource_file(
-                    filename, filename.replace('.qrc', '_rc.py'), rcc_options
+                    filename, filename.replace('.qrc', '_rc.py'), rcc_options,
+                    force
                 )
         else:
             sublime.error_message('Unknown file extension')
 
-    def compile_resource_file(self, input_file, filename, rcc_options):
-        """Process a QRC file using PySide-rcc
+    def compile_resource_file(self, input_file, filename, rcc_options,
+                              force=False):
+        """Process a QRC file using PySide-rcc (or the built-in compiler),
+        skips it if the output is up to date with the qrc file and every
+        asset it references
         """
 
-        self.options += ['-o', filename]
-
-        root_path = rcc_options.get('root_path', '')
-        no_compress = rcc_options.get('no_compress', False)
-        compression_level = rcc_options.get('compression_level', -1)
-
-        if compression_level != -1 and not no_compress:
-            if compression_level >= 0 and compression_level <= 9:
-                self.options += ['-compress', str(compression_level)]
-
-        if no_compress:
-            self.options.append('-no-compress')
-
-        if root_path != '' and type(root_path) is str:
-            self.options += ['-root', root_path]
-
-        self.options.append(input_file)
-        self.launch()
+        arguments = (builder_tools.builtin_rcc_arguments if self.function
+                     else builder_tools.rcc_arguments)
+        self.options += arguments(input_file, filename, rcc_options)
+        return self.build(
+            filename, [input_file] + builder_cache.qrc_assets(input_file),
+            force)
 
 
 class LinguistCommand(Command):
@@ -962,7 +1933,7 @@ class LinguistCommand(Command):
     def __init__(self):
         self.options = []
 
-        command = get_settings('sublimepyside_qt_tools_map').get('linguist')
+        command = plugin_settings.tool('linguist')
         if command is None:
             self.is_valid = False
             sublime.error_message(
@@ -994,12 +1965,19 @@ class PySideLupdateCommand(Command):
     """PySide Lupdate
     """
 
-    def __init__(self, window):
+    tool = 'lupdate'
+
+    def __init__(self, window, builtin=False):
         self.window = window
         self.options = []
+        self.builtin = builtin
+        self.targets = []
 
-        command = get_settings('sublimepyside_tools_map').get('lupdate')
-        if command is None:
+        command = plugin_settings.tool('lupdate')
+        if builtin:
+            self.is_valid = True
+            super(PySideLupdateCommand, self).__init__(command)
+        elif command is None:
             self.is_valid = False
             sublime.error_message(
                 'PySide Lupdate tool path is not configured'
@@ -1015,6 +1993,9 @@ class PySideLupdateCommand(Command):
         self.handle_files(files)
         self.handle_dirs(dirs)
 
+        if self.targets:
+            ExtractTranslationsThread(self.window, self.targets).start()
+
     def handle_files(self, files):
         """Handle files to generate TS
         """
@@ -1026,27 +2007,73 @@ class PySideLupdateCommand(Command):
                 self.generate_translation_from_project(filename)
 
     def handle_dirs(self, dirs):
-        """Hadnle dirs to generate TS
+        """Handle dirs to generate TS, the project files with TRANSLATIONS
+        found walking each directory are used, if there are none all its
+        python sources are aggregated into a single <dirname>.ts catalog
         """
 
+        ignore = plugin_settings.get('sublimepyside_ignore_patterns') or None
         for dirname in dirs:
-            self.handle_files(glob('{}/{}'.format(dirname, '*[.py,.pro]')))
+            projects, sources = [], []
+            for filename in builder_graph.walk(
+                    [dirname], ('.py', '.pro'), ignore):
+                if filename.endswith('.pro'):
+                    variables = builder_graph.pro_variables(filename)
+                    if variables.get('TRANSLATIONS'):
+                        projects.append(filename)
+                elif not filename.endswith('_rc.py'):
+                    sources.append(filename)
+
+            for filename in projects:
+                self.generate_translation_from_project(filename)
+
+            if sources and not projects:
+                self.generate_translation_from_sources(dirname, sources)
 
     def generate_translation_from_file(self, filename):
         """Just a convenience method
         """
 
+        if self.builtin:
+            self.targets.append(([filename], filename.replace('.py', '.ts')))
+            return
+
         self.options = []
         self.options += [filename, '-ts', filename.replace('.py', '.ts')]
-        self.launch()
+        self.enqueue(os.path.basename(filename))
+
+    def generate_translation_from_sources(self, dirname, sources):
+        """Run lupdate once for every source through a generated project
+        """
+
+        catalog = os.path.join(dirname, '{0}.ts'.format(
+            os.path.basename(dirname.rstrip('/\\'))))
+
+        if self.builtin:
+            self.targets.append((sources, catalog))
+            return
+
+        project = builder_tools.write_lupdate_project(sources, catalog)
+        self.options = list(project)
+        self.enqueue(
+            os.path.basename(catalog),
+            lambda job: builder_tools.remove_lupdate_project(project))
 
     def generate_translation_from_project(self, filename):
         """Just a convenience method
         """
 
+        if self.builtin:
+            variables = builder_graph.pro_variables(filename)
+            sources = [name for name in variables.get('SOURCES', [])
+                       if name.endswith('.py')]
+            for catalog in variables.get('TRANSLATIONS', []):
+                self.targets.append((sources, catalog))
+            return
+
         self.options = []
         self.options.append(filename)
-        self.launch()
+        self.enqueue(os.path.basename(filename))
 
 
 class QDBusViewerCommand(Command):
@@ -1056,7 +2083,7 @@ class QDBusViewerCommand(Command):
     def __init__(self):
         self.options = []
 
-        command = get_settings('sublimepyside_qt_tools_map').get('qdbusviewer')
+        command = plugin_settings.tool('qdbusviewer')
         if command is None:
             self.is_valid = False
             sublime.error_message(
@@ -1077,7 +2104,7 @@ class QtDesignerCommand(Command):
         self.options = []
         self.dirs = []
 
-        command = get_settings('sublimepyside_qt_tools_map').get('designer')
+        command = plugin_settings.tool('designer')
         if command is None:
             self.is_valid = False
             sublime.error_message(
@@ -1151,6 +2178,20 @@ class QtDesignerCommand(Command):
         sublime.message_dialog('Qt Designer is starting, please wait')
 
 
+plugin_settings = PluginSettings()
+import_index = QtImportIndex()
+conversion_cache = None
+job_queue = None
+build_cache = None
+extraction_cache = None
+chunk_cache = None
+tool_daemon = None
+tool_daemon_options = None
+template_registry = None
+template_renderer = None
+qt_watcher = QtWatcher()
+
+
 # =============================================================================
 # Global functions
 # =============================================================================
@@ -1180,19 +2221,282 @@ def sublime_executable_path():
     return sys.executable
 
 
-def get_settings(name, typeof=str):
-    """Get settings"""
-    settings = sublime.load_settings('SublimePySide.sublime-settings')
-    setting = settings.get(name)
-    if setting:
-        if typeof == str:
-            return setting
-        elif typeof == bool:
-            return setting is True
-        elif typeof == int:
-            return int(settings.get(name, 500))
+def package_cache_dir(*parts):
+    """
+    Return a directory for SublimePySide cached data
+    """
+
+    if SUBLIME_TEXT_3 is True:
+        root = os.path.join(sublime.cache_path(), 'PySide')
     else:
-        if typeof == str:
-            return ''
-        else:
+        root = os.path.join(sublime.packages_path(), 'User', 'PySide.cache')
+
+    return os.path.join(root, *parts)
+
+
+def get_template_registry():
+    """
+    Return the shared TemplateRegistry of the package templates and the
+    sublimepyside_template_dirs directories, created again when that
+    setting changes
+    """
+
+    global template_registry
+
+    directories = ['{0}/{1}/{2}/templates'.format(
+        sublime.packages_path(),
+        plugin_settings.get('sublimepyside_package'),
+        plugin_settings.get('sublimepyside_data_dir')
+    )] + [
+        os.path.expanduser(directory)
+        for directory in plugin_settings.get('sublimepyside_template_dirs')
+    ]
+
+    if (template_registry is None or
+            template_registry.directories != directories):
+        template_registry = scaffold_registry.TemplateRegistry(directories)
+
+    return template_registry
+
+
+def get_template_renderer():
+    """
+    Return the shared template Renderer
+    """
+
+    global template_renderer
+    if template_renderer is None:
+        template_renderer = scaffold_render.Renderer()
+
+    return template_renderer
+
+
+def get_conversion_cache():
+    """
+    Return the conversion cache, it is created on first use
+    """
+
+    global conversion_cache
+
+    if conversion_cache is None:
+        options = plugin_settings.get('sublimepyside_conversion_cache')
+        conversion_cache = converter_cache.ConversionCache(
+            options.get('max_entries', 64),
+            package_cache_dir('conversion') if options.get('disk') else None
+        )
+
+    return conversion_cache
+
+
+def get_job_queue():
+    """
+    Return the Qt tools job queue, it is created on first use
+    """
+
+    global job_queue
+
+    if job_queue is None:
+        options = plugin_settings.get('sublimepyside_jobs')
+        job_queue = builder_jobs.JobQueue(options.get('max_workers') or None)
+
+    return job_queue
+
+
+def get_build_cache():
+    """
+    Return the build cache, it is created on first use
+    """
+
+    global build_cache
+
+    if build_cache is None:
+        build_cache = builder_cache.BuildCache(package_cache_dir('build.json'))
+
+    return build_cache
+
+
+def get_builtin_rcc():
+    """
+    Return the built-in resource compiler (a builder.jobs.FunctionJob
+    function) when sublimepyside_rcc_engine is builtin, None otherwise
+    """
+
+    global chunk_cache
+
+    if plugin_settings.get('sublimepyside_rcc_engine') != 'builtin':
+        return None
+
+    if chunk_cache is None:
+        chunk_cache = rcc.ChunkCache(package_cache_dir('rcc-chunks'))
+
+    return functools.partial(rcc.run, chunks=chunk_cache, processes=False)
+
+
+def get_extraction_cache():
+    """
+    Return the translations extraction cache, it is created on first use
+    """
+
+    global extraction_cache
+
+    if extraction_cache is None:
+        extraction_cache = linguist_extract.ExtractionCache(
+            package_cache_dir('extraction.json'))
+
+    return extraction_cache
+
+
+def get_tool_daemon():
+    """
+    Return the PySide tools daemon client or None if it is disabled or
+    there is no Python interpreter to run it, the daemon process itself is
+    started on first use
+    """
+
+    global tool_daemon, tool_daemon_options
+
+    options = plugin_settings.get('sublimepyside_daemon')
+    if not options.get('enabled', False):
+        return None
+
+    if tool_daemon is None:
+        uic = plugin_settings.tool('uic')
+        python = options.get('python') or (
+            uic and builder_daemon.interpreter(uic))
+        if not python:
             return None
+
+        tool_daemon_options = options
+        tool_daemon = builder_daemon.DaemonClient(
+            python, os.path.dirname(os.path.abspath(__file__)),
+            idle_timeout=options.get('idle_timeout', 600),
+            **Command.popen_kwargs()
+        )
+
+    return tool_daemon
+
+
+def write_output_panel(window, name, text, syntax=None):
+    """Replace the contents of the named output panel and show it
+    """
+
+    panel = OutputPanel(window, name, syntax)
+    panel.write(text, clear=True)
+    panel.show()
+
+
+def get_settings(name, typeof=str):
+    """Get a setting checked against the settings schema (see
+    PluginSettings), typeof is ignored and kept for compatibility
+    """
+
+    return plugin_settings.get(name)
+
+
+def rope_support():
+    """
+    Return True if rope and SublimeRope can be imported, they are only
+    imported the first time a project needs them
+    """
+
+    global ROPE_SUPPORT
+
+    if ROPE_SUPPORT is None:
+        try:
+            rope_exceptions.load()
+            ropemate.load()
+            ROPE_SUPPORT = True
+        except ImportError:
+            ROPE_SUPPORT = False
+
+    return ROPE_SUPPORT
+
+
+def resolve_tool(command):
+    """Return the path of a tool command, names without a directory are
+    looked up in PATH, None if command is empty
+    """
+
+    if not command:
+        return None
+
+    command = os.path.expandvars(os.path.expanduser(command))
+    if os.path.dirname(command):
+        return command
+
+    extensions = ['']
+    if sublime.platform() == 'windows':
+        extensions += os.environ.get('PATHEXT', '.EXE').split(os.pathsep)
+
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        for extension in extensions:
+            path = os.path.join(directory, command + extension)
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+
+    return command
+
+
+def daemon_settings_changed():
+    """Stop the tools daemon when its settings changed, it is started
+    again with the new ones on first use
+    """
+
+    global tool_daemon
+
+    if tool_daemon is not None and (
+            tool_daemon_options != plugin_settings.get(
+                'sublimepyside_daemon')):
+        tool_daemon.stop()
+        tool_daemon = None
+
+
+def probe_tool_versions():
+    """Ask the configured pyside-uic and pyside-rcc their version in a
+    background thread, the build cache needs it for up to date checks
+    """
+
+    commands = [command for command in (
+        plugin_settings.tool('uic'), plugin_settings.tool('rcc')) if command]
+
+    def probe():
+        for command in commands:
+            builder_cache.tool_version(command)
+
+    if commands:
+        thread = threading.Thread(target=probe)
+        thread.daemon = True
+        thread.start()
+
+
+def plugin_loaded():
+    """Start the startup profile log and the tool version probe, Sublime
+    Text 2 has no plugin_loaded so it is called at the end of the plugin
+    import
+    """
+
+    started = time.time()
+    if plugin_settings.get('sublimepyside_startup_log'):
+        startup_profile.start_log(package_cache_dir('startup.log'))
+
+    probe_tool_versions()
+    startup_profile.record('plugin_loaded', time.time() - started)
+
+
+def plugin_unloaded():
+    """Stop the PySide tools daemon when the plugin is unloaded
+    """
+
+    if tool_daemon is not None:
+        tool_daemon.stop()
+
+
+# Sublime Text 2 calls unload_handler instead of plugin_unloaded
+unload_handler = plugin_unloaded
+
+plugin_settings.add_on_change('tool_daemon', daemon_settings_changed)
+plugin_settings.add_on_change('tool_versions', probe_tool_versions)
+
+startup_profile.record('import sublime_pyside', time.time() - IMPORT_STARTED)
+if SUBLIME_TEXT_3 is False:
+    plugin_loaded()